@@ -1,7 +1,7 @@
 """Alembic environment configuration."""
 import os
 from logging.config import fileConfig
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, pool, text
 from alembic import context
 
 # Import your models
@@ -39,15 +39,25 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
-def run_migrations_online() -> None:
-    """Run migrations in 'online' mode."""
-    connectable = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+# Key of the PostgreSQL advisory lock held while migrating
+MIGRATION_LOCK_KEY = 0x46324C4D4947
 
-    with connectable.connect() as connection:
+
+def do_run_migrations(connection) -> None:
+    """
+    Run all pending revisions on a single connection.
+
+    Every uvicorn worker upgrades on startup, so on PostgreSQL the run holds
+    a session-level advisory lock: one process migrates while the others
+    wait, then find nothing left to apply. The lock is session-level so it
+    survives the commits of ``autocommit_block`` revisions.
+    """
+    locked = connection.dialect.name == "postgresql"
+    if locked:
+        connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        connection.commit()
+
+    try:
         context.configure(
             connection=connection,
             target_metadata=target_metadata
@@ -55,6 +65,28 @@ def run_migrations_online() -> None:
 
         with context.begin_transaction():
             context.run_migrations()
+    finally:
+        if locked:
+            if connection.in_transaction():
+                connection.rollback()
+            connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            connection.commit()
+
+
+def run_migrations_online() -> None:
+    """
+    Run migrations in 'online' mode.
+
+    Every revision in the run shares one connection.
+    """
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        do_run_migrations(connection)
 
 
 if context.is_offline_mode():
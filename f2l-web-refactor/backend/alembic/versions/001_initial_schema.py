@@ -5,9 +5,12 @@ Revises:
 Create Date: 2025-01-30 00:00:00.000000
 
 """
+from datetime import datetime, timedelta, timezone
+
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 # revision identifiers, used by Alembic.
 revision = '001_initial_schema'
@@ -16,264 +19,309 @@ branch_labels = None
 depends_on = None
 
 
-def upgrade() -> None:
-    # Create enum types
-    op.execute("""
-        DO $$ BEGIN
-            CREATE TYPE endpointtype AS ENUM ('ftp', 'sftp', 's3', 'local');
-        EXCEPTION
-            WHEN duplicate_object THEN null;
-        END $$;
-    """)
-    op.execute("""
-        DO $$ BEGIN
-            CREATE TYPE syncdirection AS ENUM ('source_to_dest', 'dest_to_source', 'bidirectional');
-        EXCEPTION
-            WHEN duplicate_object THEN null;
-        END $$;
-    """)
-    op.execute("""
-        DO $$ BEGIN
-            CREATE TYPE foldermatchmode AS ENUM ('exact', 'contains', 'startswith');
-        EXCEPTION
-            WHEN duplicate_object THEN null;
-        END $$;
-    """)
-    op.execute("""
-        DO $$ BEGIN
-            CREATE TYPE executionstatus AS ENUM ('queued', 'running', 'completed', 'failed', 'cancelled');
-        EXCEPTION
-            WHEN duplicate_object THEN null;
-        END $$;
-    """)
-    op.execute("""
-        DO $$ BEGIN
-            CREATE TYPE operationtype AS ENUM ('upload', 'download', 'delete', 'skip');
-        EXCEPTION
-            WHEN duplicate_object THEN null;
-        END $$;
-    """)
-    op.execute("""
-        DO $$ BEGIN
-            CREATE TYPE operationstatus AS ENUM ('pending', 'in_progress', 'completed', 'failed', 'skipped');
-        EXCEPTION
-            WHEN duplicate_object THEN null;
-        END $$;
-    """)
-    op.execute("""
-        DO $$ BEGIN
-            CREATE TYPE loglevel AS ENUM ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL');
-        EXCEPTION
-            WHEN duplicate_object THEN null;
-        END $$;
-    """)
-    op.execute("""
+# The schema is declared and compiled once when the migration module is
+# imported, so upgrade() only ships precompiled SQL to the server.
+_dialect = postgresql.dialect()
+_metadata = sa.MetaData()
+
+# Create endpoints table
+sa.Table('endpoints', _metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('endpoint_type', postgresql.ENUM('ftp', 'sftp', 's3', 'local', name='endpointtype', create_type=False), nullable=False),
+    sa.Column('host', sa.String(length=255), nullable=True),
+    sa.Column('port', sa.Integer(), nullable=True),
+    sa.Column('username', sa.String(length=255), nullable=True),
+    sa.Column('password_encrypted', sa.Text(), nullable=True),
+    sa.Column('remote_path', sa.Text(), nullable=True),
+    sa.Column('s3_bucket', sa.String(length=255), nullable=True),
+    sa.Column('s3_region', sa.String(length=50), nullable=True),
+    sa.Column('s3_access_key', sa.String(length=255), nullable=True),
+    sa.Column('s3_secret_key_encrypted', sa.Text(), nullable=True),
+    sa.Column('s3_endpoint_url', sa.String(length=512), nullable=True),
+    sa.Column('s3_use_ssl', sa.Boolean(), nullable=False, server_default=sa.true()),
+    sa.Column('local_path', sa.Text(), nullable=True),
+    sa.Column('connection_status', sa.String(length=50), nullable=False, server_default='unknown'),
+    sa.Column('last_health_check', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('health_check_message', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.true()),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.Index('idx_endpoint_type', 'endpoint_type'),
+    sa.Index('idx_endpoint_status', 'connection_status'),
+    sa.Index('idx_endpoint_active', 'id', postgresql_where=sa.text('is_active = true'))
+)
+
+# Create sync_sessions table
+sa.Table('sync_sessions', _metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('source_endpoint_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('destination_endpoint_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('source_path', sa.Text(), nullable=False, server_default='/'),
+    sa.Column('destination_path', sa.Text(), nullable=False, server_default='/'),
+    sa.Column('sync_direction', postgresql.ENUM('source_to_dest', 'dest_to_source', 'bidirectional', name='syncdirection', create_type=False), nullable=False),
+    sa.Column('folder_filter_enabled', sa.Boolean(), nullable=False, server_default=sa.false()),
+    sa.Column('folder_names', postgresql.JSONB(), nullable=True),
+    sa.Column('folder_match_mode', postgresql.ENUM('exact', 'contains', 'startswith', name='foldermatchmode', create_type=False), nullable=False),
+    sa.Column('folder_case_sensitive', sa.Boolean(), nullable=False, server_default=sa.false()),
+    sa.Column('file_pattern_enabled', sa.Boolean(), nullable=False, server_default=sa.false()),
+    sa.Column('file_patterns', postgresql.JSONB(), nullable=True),
+    sa.Column('force_overwrite', sa.Boolean(), nullable=False, server_default=sa.false()),
+    sa.Column('delete_missing', sa.Boolean(), nullable=False, server_default=sa.false()),
+    sa.Column('schedule_enabled', sa.Boolean(), nullable=False, server_default=sa.false()),
+    sa.Column('schedule_interval', sa.Integer(), nullable=True),
+    sa.Column('schedule_unit', postgresql.ENUM('minutes', 'hours', 'days', name='scheduleunit', create_type=False), nullable=True),
+    sa.Column('auto_start_enabled', sa.Boolean(), nullable=False, server_default=sa.false()),
+    sa.Column('next_run_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.true()),
+    sa.Column('is_running', sa.Boolean(), nullable=False, server_default=sa.false()),
+    sa.Column('last_run_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_run_status', sa.String(length=50), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.CheckConstraint('source_endpoint_id != destination_endpoint_id', name='check_different_endpoints'),
+    sa.ForeignKeyConstraint(['source_endpoint_id'], ['endpoints.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['destination_endpoint_id'], ['endpoints.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.Index('idx_session_active', 'id', postgresql_where=sa.text('is_active = true')),
+    sa.Index('idx_session_running', 'id', postgresql_where=sa.text('is_running = true')),
+    sa.Index('idx_session_schedule', 'schedule_enabled', 'next_run_at'),
+    sa.Index('idx_session_folder_names', 'folder_names', postgresql_using='gin', postgresql_ops={'folder_names': 'jsonb_path_ops'}),
+    sa.Index('idx_session_file_patterns', 'file_patterns', postgresql_using='gin', postgresql_ops={'file_patterns': 'jsonb_path_ops'})
+)
+
+# Create sync_executions table
+sa.Table('sync_executions', _metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+    sa.Column('session_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('status', postgresql.ENUM('queued', 'running', 'completed', 'failed', 'cancelled', name='executionstatus', create_type=False), nullable=False),
+    sa.Column('is_dry_run', sa.Boolean(), nullable=False, server_default=sa.false()),
+    sa.Column('queued_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('duration_seconds', sa.Float(), nullable=True),
+    sa.Column('total_files', sa.Integer(), nullable=False, server_default=sa.text('0')),
+    sa.Column('files_synced', sa.Integer(), nullable=False, server_default=sa.text('0')),
+    sa.Column('files_failed', sa.Integer(), nullable=False, server_default=sa.text('0')),
+    sa.Column('files_skipped', sa.Integer(), nullable=False, server_default=sa.text('0')),
+    sa.Column('bytes_transferred', sa.BigInteger(), nullable=False, server_default=sa.text('0')),
+    sa.Column('progress_percentage', sa.Float(), nullable=False, server_default=sa.text('0.0')),
+    sa.Column('current_file', sa.Text(), nullable=True),
+    sa.Column('current_operation', sa.String(length=50), nullable=True),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.Column('error_stack_trace', sa.Text(), nullable=True),
+    sa.Column('summary', postgresql.JSON(), nullable=True),
+    sa.Column('celery_task_id', sa.String(length=255), nullable=True),
+    sa.ForeignKeyConstraint(['session_id'], ['sync_sessions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.Index('idx_execution_status', 'status'),
+    sa.Index('idx_execution_session', 'session_id', sa.text('queued_at DESC'), postgresql_include=['status', 'duration_seconds', 'files_synced', 'bytes_transferred']),
+    sa.Index('idx_execution_celery_task', 'celery_task_id')
+)
+
+# Create sync_operations table
+sa.Table('sync_operations', _metadata,
+    sa.Column('id', sa.BigInteger(), sa.Identity(always=True), nullable=False),
+    sa.Column('execution_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('operation_type', postgresql.ENUM('upload', 'download', 'delete', 'skip', name='operationtype', create_type=False), nullable=False),
+    sa.Column('status', postgresql.ENUM('pending', 'in_progress', 'completed', 'failed', 'skipped', name='operationstatus', create_type=False), nullable=False),
+    sa.Column('source_path', sa.Text(), nullable=False),
+    sa.Column('destination_path', sa.Text(), nullable=False),
+    sa.Column('file_size', sa.BigInteger(), nullable=False, server_default=sa.text('0')),
+    sa.Column('file_modified_time', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('duration_ms', sa.Integer(), nullable=True),
+    sa.Column('bytes_transferred', sa.BigInteger(), nullable=False, server_default=sa.text('0')),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['execution_id'], ['sync_executions.id'], ondelete='CASCADE', deferrable=True, initially='DEFERRED'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.Index('idx_operation_execution', 'execution_id', 'status'),
+    sa.Index('idx_operation_type', 'operation_type')
+)
+
+# Create logs table
+sa.Table('logs', _metadata,
+    sa.Column('id', sa.BigInteger(), sa.Identity(always=True), nullable=False),
+    sa.Column('level', postgresql.ENUM('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL', name='loglevel', create_type=False), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('logger_name', sa.String(length=255), nullable=True),
+    sa.Column('execution_id', postgresql.UUID(as_uuid=True), nullable=True),
+    sa.Column('session_id', postgresql.UUID(as_uuid=True), nullable=True),
+    sa.Column('endpoint_id', postgresql.UUID(as_uuid=True), nullable=True),
+    sa.Column('extra_data', postgresql.JSONB(), nullable=True),
+    sa.Column('timestamp', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['execution_id'], ['sync_executions.id'], ondelete='CASCADE', deferrable=True, initially='DEFERRED'),
+    sa.PrimaryKeyConstraint('id', 'timestamp'),
+    sa.Index('idx_log_level', 'level'),
+    sa.Index('idx_log_timestamp', 'timestamp', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+    sa.Index('idx_log_execution', 'execution_id'),
+    sa.Index('idx_log_session', 'session_id'),
+    postgresql_partition_by='RANGE (timestamp)'
+)
+
+# Create scan_cache table
+sa.Table('scan_cache', _metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+    sa.Column('endpoint_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('path', sa.Text(), nullable=False),
+    sa.Column('file_list', postgresql.JSON(), nullable=False),
+    sa.Column('total_files', sa.Integer(), nullable=False, server_default=sa.text('0')),
+    sa.Column('total_size', sa.BigInteger(), nullable=False, server_default=sa.text('0')),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('is_valid', sa.Boolean(), nullable=False, server_default=sa.true()),
+    sa.ForeignKeyConstraint(['endpoint_id'], ['endpoints.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('endpoint_id', 'path', name='uq_scan_cache_endpoint_path'),
+    sa.Index('idx_scan_cache_expires', 'expires_at', 'is_valid'),
+    # Rebuildable cache: skip WAL for its insert/update churn
+    prefixes=['UNLOGGED']
+)
+
+# Create app_settings table
+sa.Table('app_settings', _metadata,
+    sa.Column('key', sa.String(length=255), nullable=False),
+    sa.Column('value', sa.Text(), nullable=False),
+    sa.Column('value_type', sa.String(length=50), nullable=False, server_default='string'),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+)
+
+# Create users table
+sa.Table('users', _metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('hashed_password', sa.String(length=255), nullable=False),
+    sa.Column('full_name', sa.String(length=255), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.true()),
+    sa.Column('is_superuser', sa.Boolean(), nullable=False, server_default=sa.false()),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('last_login_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('email'),
+    sa.Index('idx_user_active', 'id', postgresql_where=sa.text('is_active = true'))
+)
+
+
+def _compile(element) -> str:
+    return str(element.compile(dialect=_dialect)).strip()
+
+
+def _build_schema_ddl() -> str:
+    # pgcrypto provides gen_random_uuid() for server-side primary keys on
+    # PostgreSQL < 13. Enum types are created in one DO block (parsed and
+    # planned once).
+    statements = [
+        "CREATE EXTENSION IF NOT EXISTS pgcrypto",
+        """
         DO $$ BEGIN
-            CREATE TYPE scheduleunit AS ENUM ('minutes', 'hours', 'days');
-        EXCEPTION
-            WHEN duplicate_object THEN null;
-        END $$;
-    """)
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'endpointtype') THEN
+                CREATE TYPE endpointtype AS ENUM ('ftp', 'sftp', 's3', 'local');
+            END IF;
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'syncdirection') THEN
+                CREATE TYPE syncdirection AS ENUM ('source_to_dest', 'dest_to_source', 'bidirectional');
+            END IF;
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'foldermatchmode') THEN
+                CREATE TYPE foldermatchmode AS ENUM ('exact', 'contains', 'startswith');
+            END IF;
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'executionstatus') THEN
+                CREATE TYPE executionstatus AS ENUM ('queued', 'running', 'completed', 'failed', 'cancelled');
+            END IF;
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'operationtype') THEN
+                CREATE TYPE operationtype AS ENUM ('upload', 'download', 'delete', 'skip');
+            END IF;
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'operationstatus') THEN
+                CREATE TYPE operationstatus AS ENUM ('pending', 'in_progress', 'completed', 'failed', 'skipped');
+            END IF;
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'loglevel') THEN
+                CREATE TYPE loglevel AS ENUM ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL');
+            END IF;
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'scheduleunit') THEN
+                CREATE TYPE scheduleunit AS ENUM ('minutes', 'hours', 'days');
+            END IF;
+        END $$
+        """,
+    ]
+    # Emit tables after the enum types as a single batch so the whole
+    # schema is created in one server roundtrip.
+    for table in _metadata.sorted_tables:
+        statements.append(_compile(CreateTable(table)))
+        # Indexes cannot be built CONCURRENTLY on a partitioned table, so
+        # build them here while the table is still empty.
+        if table.dialect_options['postgresql']['partition_by']:
+            for index in sorted(table.indexes, key=lambda i: i.name):
+                statements.append(_compile(CreateIndex(index)))
+    # file_list is written once and read back whole; store it out of line
+    # without TOAST compression to trade disk for CPU on large listings.
+    statements.append("ALTER TABLE scan_cache ALTER COLUMN file_list SET STORAGE EXTERNAL")
+    # Progress updates rewrite executions/operations rows without touching
+    # indexed columns; leave free space per page so they stay HOT updates.
+    statements.append("ALTER TABLE sync_executions SET (fillfactor = 70)")
+    statements.append("ALTER TABLE sync_operations SET (fillfactor = 70)")
+    return ";\n".join(statement.strip() for statement in statements)
 
-    # Create endpoints table
-    op.create_table('endpoints',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('name', sa.String(length=255), nullable=False),
-        sa.Column('endpoint_type', postgresql.ENUM('ftp', 'sftp', 's3', 'local', name='endpointtype', create_type=False), nullable=False),
-        sa.Column('host', sa.String(length=255), nullable=True),
-        sa.Column('port', sa.Integer(), nullable=True),
-        sa.Column('username', sa.String(length=255), nullable=True),
-        sa.Column('password_encrypted', sa.Text(), nullable=True),
-        sa.Column('remote_path', sa.String(length=1024), nullable=True),
-        sa.Column('s3_bucket', sa.String(length=255), nullable=True),
-        sa.Column('s3_region', sa.String(length=50), nullable=True),
-        sa.Column('s3_access_key', sa.String(length=255), nullable=True),
-        sa.Column('s3_secret_key_encrypted', sa.Text(), nullable=True),
-        sa.Column('s3_endpoint_url', sa.String(length=512), nullable=True),
-        sa.Column('s3_use_ssl', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('local_path', sa.String(length=1024), nullable=True),
-        sa.Column('connection_status', sa.String(length=50), nullable=False, server_default='unknown'),
-        sa.Column('last_health_check', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('health_check_message', sa.Text(), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('notes', sa.Text(), nullable=True),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index('idx_endpoint_type', 'endpoints', ['endpoint_type'])
-    op.create_index('idx_endpoint_status', 'endpoints', ['connection_status'])
-    op.create_index('idx_endpoint_active', 'endpoints', ['is_active'])
 
-    # Create sync_sessions table
-    op.create_table('sync_sessions',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('name', sa.String(length=255), nullable=False),
-        sa.Column('source_endpoint_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('destination_endpoint_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('source_path', sa.String(length=1024), nullable=False, server_default='/'),
-        sa.Column('destination_path', sa.String(length=1024), nullable=False, server_default='/'),
-        sa.Column('sync_direction', postgresql.ENUM('source_to_dest', 'dest_to_source', 'bidirectional', name='syncdirection', create_type=False), nullable=False),
-        sa.Column('folder_filter_enabled', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('folder_names', postgresql.JSONB(), nullable=True),
-        sa.Column('folder_match_mode', postgresql.ENUM('exact', 'contains', 'startswith', name='foldermatchmode', create_type=False), nullable=False),
-        sa.Column('folder_case_sensitive', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('file_pattern_enabled', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('file_patterns', postgresql.JSONB(), nullable=True),
-        sa.Column('force_overwrite', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('delete_missing', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('schedule_enabled', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('schedule_interval', sa.Integer(), nullable=True),
-        sa.Column('schedule_unit', postgresql.ENUM('minutes', 'hours', 'days', name='scheduleunit', create_type=False), nullable=True),
-        sa.Column('auto_start_enabled', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('next_run_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('is_running', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('last_run_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('last_run_status', sa.String(length=50), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('notes', sa.Text(), nullable=True),
-        sa.CheckConstraint('source_endpoint_id != destination_endpoint_id', name='check_different_endpoints'),
-        sa.ForeignKeyConstraint(['source_endpoint_id'], ['endpoints.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['destination_endpoint_id'], ['endpoints.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index('idx_session_active', 'sync_sessions', ['is_active'])
-    op.create_index('idx_session_running', 'sync_sessions', ['is_running'])
-    op.create_index('idx_session_schedule', 'sync_sessions', ['schedule_enabled', 'next_run_at'])
+def _build_index_ddl() -> list:
+    # Build indexes outside the migration transaction with CONCURRENTLY so a
+    # re-run against populated tables does not block writes. CONCURRENTLY
+    # cannot be part of a multi-statement batch, so each index is its own
+    # statement.
+    statements = []
+    for table in _metadata.sorted_tables:
+        if table.dialect_options['postgresql']['partition_by']:
+            continue
+        for index in sorted(table.indexes, key=lambda i: i.name):
+            index.dialect_options['postgresql']['concurrently'] = True
+            statements.append(_compile(CreateIndex(index)))
+    return statements
 
-    # Create sync_executions table
-    op.create_table('sync_executions',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('session_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('status', postgresql.ENUM('queued', 'running', 'completed', 'failed', 'cancelled', name='executionstatus', create_type=False), nullable=False),
-        sa.Column('is_dry_run', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('queued_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('duration_seconds', sa.Float(), nullable=True),
-        sa.Column('total_files', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('files_synced', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('files_failed', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('files_skipped', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('bytes_transferred', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('progress_percentage', sa.Float(), nullable=False, server_default='0.0'),
-        sa.Column('current_file', sa.String(length=1024), nullable=True),
-        sa.Column('current_operation', sa.String(length=50), nullable=True),
-        sa.Column('error_message', sa.Text(), nullable=True),
-        sa.Column('error_stack_trace', sa.Text(), nullable=True),
-        sa.Column('summary', postgresql.JSONB(), nullable=True),
-        sa.Column('celery_task_id', sa.String(length=255), nullable=True),
-        sa.ForeignKeyConstraint(['session_id'], ['sync_sessions.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index('idx_execution_status', 'sync_executions', ['status'])
-    op.create_index('idx_execution_session', 'sync_executions', ['session_id', 'queued_at'])
-    op.create_index('idx_execution_celery_task', 'sync_executions', ['celery_task_id'])
 
-    # Create sync_operations table
-    op.create_table('sync_operations',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('execution_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('operation_type', postgresql.ENUM('upload', 'download', 'delete', 'skip', name='operationtype', create_type=False), nullable=False),
-        sa.Column('status', postgresql.ENUM('pending', 'in_progress', 'completed', 'failed', 'skipped', name='operationstatus', create_type=False), nullable=False),
-        sa.Column('source_path', sa.String(length=1024), nullable=False),
-        sa.Column('destination_path', sa.String(length=1024), nullable=False),
-        sa.Column('file_size', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('file_modified_time', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('duration_ms', sa.Integer(), nullable=True),
-        sa.Column('bytes_transferred', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('error_message', sa.Text(), nullable=True),
-        sa.ForeignKeyConstraint(['execution_id'], ['sync_executions.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index('idx_operation_execution', 'sync_operations', ['execution_id', 'status'])
-    op.create_index('idx_operation_type', 'sync_operations', ['operation_type'])
+_SCHEMA_DDL = _build_schema_ddl()
+_INDEX_DDL = _build_index_ddl()
 
-    # Create logs table
-    op.create_table('logs',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('level', postgresql.ENUM('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL', name='loglevel', create_type=False), nullable=False),
-        sa.Column('message', sa.Text(), nullable=False),
-        sa.Column('logger_name', sa.String(length=255), nullable=True),
-        sa.Column('execution_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('session_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('endpoint_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('extra_data', postgresql.JSONB(), nullable=True),
-        sa.Column('timestamp', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['execution_id'], ['sync_executions.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index('idx_log_level', 'logs', ['level'])
-    op.create_index('idx_log_timestamp', 'logs', ['timestamp'])
-    op.create_index('idx_log_execution', 'logs', ['execution_id'])
-    op.create_index('idx_log_session', 'logs', ['session_id'])
 
-    # Create scan_cache table
-    op.create_table('scan_cache',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('endpoint_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('path', sa.String(length=1024), nullable=False),
-        sa.Column('file_list', postgresql.JSONB(), nullable=False),
-        sa.Column('total_files', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('total_size', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
-        sa.Column('is_valid', sa.Boolean(), nullable=False, server_default='true'),
-        sa.ForeignKeyConstraint(['endpoint_id'], ['endpoints.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('endpoint_id', 'path', name='uq_scan_cache_endpoint_path')
-    )
-    op.create_index('idx_scan_cache_expires', 'scan_cache', ['expires_at', 'is_valid'])
+def _log_partition_ddl() -> str:
+    # Monthly logs partitions for the coming year; later months are created
+    # by the maintain_log_partitions task, and anything outside the covered
+    # range lands in the default partition. Bounds depend on the day the
+    # migration runs, so these are not precompiled.
+    statements = []
+    month = datetime.now(timezone.utc).date().replace(day=1)
+    for _ in range(12):
+        next_month = (month + timedelta(days=32)).replace(day=1)
+        statements.append(
+            f"CREATE TABLE logs_{month:%Y_%m} PARTITION OF logs "
+            f"FOR VALUES FROM ('{month}') TO ('{next_month}')"
+        )
+        month = next_month
+    statements.append("CREATE TABLE logs_default PARTITION OF logs DEFAULT")
+    return ";\n".join(statements)
 
-    # Create app_settings table
-    op.create_table('app_settings',
-        sa.Column('key', sa.String(length=255), nullable=False),
-        sa.Column('value', sa.Text(), nullable=False),
-        sa.Column('value_type', sa.String(length=50), nullable=False, server_default='string'),
-        sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.PrimaryKeyConstraint('key')
-    )
 
-    # Create users table
-    op.create_table('users',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('email', sa.String(length=255), nullable=False),
-        sa.Column('hashed_password', sa.String(length=255), nullable=False),
-        sa.Column('full_name', sa.String(length=255), nullable=True),
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('is_superuser', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('last_login_at', sa.DateTime(timezone=True), nullable=True),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('email')
-    )
-    op.create_index('idx_user_email', 'users', ['email'])
-    op.create_index('idx_user_active', 'users', ['is_active'])
+def upgrade() -> None:
+    op.execute(_SCHEMA_DDL + ";\n" + _log_partition_ddl())
+
+    with op.get_context().autocommit_block():
+        for statement in _INDEX_DDL:
+            op.execute(statement)
 
 
 def downgrade() -> None:
-    # Drop tables
-    op.drop_table('users')
-    op.drop_table('app_settings')
-    op.drop_table('scan_cache')
-    op.drop_table('logs')
-    op.drop_table('sync_operations')
-    op.drop_table('sync_executions')
-    op.drop_table('sync_sessions')
-    op.drop_table('endpoints')
+    # Drop tables (their indexes and logs partitions go with them)
+    op.execute(
+        "DROP TABLE users, app_settings, scan_cache, logs, sync_operations, "
+        "sync_executions, sync_sessions, endpoints CASCADE"
+    )
 
     # Drop enum types
-    op.execute('DROP TYPE scheduleunit')
-    op.execute('DROP TYPE loglevel')
-    op.execute('DROP TYPE operationstatus')
-    op.execute('DROP TYPE operationtype')
-    op.execute('DROP TYPE executionstatus')
-    op.execute('DROP TYPE foldermatchmode')
-    op.execute('DROP TYPE syncdirection')
-    op.execute('DROP TYPE endpointtype')
+    op.execute(
+        "DROP TYPE scheduleunit, loglevel, operationstatus, operationtype, "
+        "executionstatus, foldermatchmode, syncdirection, endpointtype"
+    )
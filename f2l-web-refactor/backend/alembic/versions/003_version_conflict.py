@@ -6,8 +6,6 @@ Create Date: 2025-01-30 14:00:00.000000
 
 """
 from alembic import op
-import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision = '003_version_conflict'
@@ -17,49 +15,44 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Add version and conflict fields to shot_download_tasks
-    op.add_column('shot_download_tasks', 
-        sa.Column('version_strategy', sa.String(length=20), nullable=False, server_default='latest')
-    )
-    op.add_column('shot_download_tasks', 
-        sa.Column('specific_version', sa.String(length=20), nullable=True)
-    )
-    op.add_column('shot_download_tasks', 
-        sa.Column('conflict_strategy', sa.String(length=20), nullable=False, server_default='skip')
-    )
-    
+    # Add version and conflict fields to shot_download_tasks. Each table gets
+    # a single multi-clause ALTER TABLE: one ACCESS EXCLUSIVE lock and one
+    # catalog update instead of one per column.
+    op.execute("""
+        ALTER TABLE shot_download_tasks
+            ADD COLUMN version_strategy VARCHAR(20) NOT NULL DEFAULT 'latest',
+            ADD COLUMN specific_version VARCHAR(20),
+            ADD COLUMN conflict_strategy VARCHAR(20) NOT NULL DEFAULT 'skip'
+    """)
+
     # Add version and statistics fields to shot_download_items
-    op.add_column('shot_download_items', 
-        sa.Column('selected_version', sa.String(length=20), nullable=True)
-    )
-    op.add_column('shot_download_items', 
-        sa.Column('available_versions', postgresql.JSONB(astext_type=sa.Text()), nullable=True)
-    )
-    op.add_column('shot_download_items', 
-        sa.Column('latest_version', sa.String(length=20), nullable=True)
-    )
-    op.add_column('shot_download_items', 
-        sa.Column('files_skipped', sa.Integer(), nullable=False, server_default='0')
-    )
-    op.add_column('shot_download_items', 
-        sa.Column('files_overwritten', sa.Integer(), nullable=False, server_default='0')
-    )
-    op.add_column('shot_download_items', 
-        sa.Column('files_kept_both', sa.Integer(), nullable=False, server_default='0')
-    )
+    op.execute("""
+        ALTER TABLE shot_download_items
+            ADD COLUMN selected_version VARCHAR(20),
+            ADD COLUMN available_versions JSONB,
+            ADD COLUMN latest_version VARCHAR(20),
+            ADD COLUMN files_skipped INTEGER NOT NULL DEFAULT 0,
+            ADD COLUMN files_overwritten INTEGER NOT NULL DEFAULT 0,
+            ADD COLUMN files_kept_both INTEGER NOT NULL DEFAULT 0
+    """)
 
 
 def downgrade() -> None:
     # Remove fields from shot_download_items
-    op.drop_column('shot_download_items', 'files_kept_both')
-    op.drop_column('shot_download_items', 'files_overwritten')
-    op.drop_column('shot_download_items', 'files_skipped')
-    op.drop_column('shot_download_items', 'latest_version')
-    op.drop_column('shot_download_items', 'available_versions')
-    op.drop_column('shot_download_items', 'selected_version')
-    
-    # Remove fields from shot_download_tasks
-    op.drop_column('shot_download_tasks', 'conflict_strategy')
-    op.drop_column('shot_download_tasks', 'specific_version')
-    op.drop_column('shot_download_tasks', 'version_strategy')
+    op.execute("""
+        ALTER TABLE shot_download_items
+            DROP COLUMN files_kept_both,
+            DROP COLUMN files_overwritten,
+            DROP COLUMN files_skipped,
+            DROP COLUMN latest_version,
+            DROP COLUMN available_versions,
+            DROP COLUMN selected_version
+    """)
 
+    # Remove fields from shot_download_tasks
+    op.execute("""
+        ALTER TABLE shot_download_tasks
+            DROP COLUMN conflict_strategy,
+            DROP COLUMN specific_version,
+            DROP COLUMN version_strategy
+    """)
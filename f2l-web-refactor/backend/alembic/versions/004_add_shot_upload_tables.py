@@ -5,9 +5,12 @@ Revises: 003_version_conflict
 Create Date: 2025-01-31 10:00:00.000000
 
 """
+from datetime import datetime, timedelta, timezone
+
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 # revision identifiers, used by Alembic.
 revision = '004_add_shot_upload_tables'
@@ -17,33 +20,80 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Create shot upload task status enum
+    # Upload ids are UUIDv7: the leading 48 bits are a millisecond timestamp,
+    # so new rows land on the right-most primary key page instead of random
+    # leaves. Built on pgcrypto's gen_random_uuid() (see 001). Enum types are
+    # created in one DO block so existing types are skipped without a catalog
+    # lookup roundtrip per type.
+    statements = [
+        """
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(uuid_send(gen_random_uuid())
+                                placing substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                                FROM 1 FOR 6),
+                        52, 1),
+                    53, 1),
+                'hex')::uuid
+        $$ LANGUAGE sql VOLATILE
+        """,
+        """
+        DO $$ BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'shotuploadtaskstatus') THEN
+                CREATE TYPE shotuploadtaskstatus AS ENUM ('pending', 'running', 'completed', 'failed', 'cancelled');
+            END IF;
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'shotuploaditemstatus') THEN
+                CREATE TYPE shotuploaditemstatus AS ENUM ('pending', 'uploading', 'completed', 'failed', 'skipped');
+            END IF;
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'uploadversionstrategy') THEN
+                CREATE TYPE uploadversionstrategy AS ENUM ('latest', 'specific', 'all', 'custom');
+            END IF;
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'uploadconflictstrategy') THEN
+                CREATE TYPE uploadconflictstrategy AS ENUM ('skip', 'overwrite');
+            END IF;
+        END $$
+        """,
+    ]
     shot_upload_task_status = postgresql.ENUM(
         'pending', 'running', 'completed', 'failed', 'cancelled',
         name='shotuploadtaskstatus',
         create_type=False
     )
-    shot_upload_task_status.create(op.get_bind(), checkfirst=True)
-
-    # Create shot upload item status enum
     shot_upload_item_status = postgresql.ENUM(
         'pending', 'uploading', 'completed', 'failed', 'skipped',
         name='shotuploaditemstatus',
         create_type=False
     )
-    shot_upload_item_status.create(op.get_bind(), checkfirst=True)
+    # Strategies are stored as 4-byte enums rather than VARCHAR(20)
+    upload_version_strategy = postgresql.ENUM(
+        'latest', 'specific', 'all', 'custom',
+        name='uploadversionstrategy',
+        create_type=False
+    )
+    upload_conflict_strategy = postgresql.ENUM(
+        'skip', 'overwrite',
+        name='uploadconflictstrategy',
+        create_type=False
+    )
+
+    # endpoints already exists; it is declared here only so the foreign keys
+    # below can be compiled.
+    metadata = sa.MetaData()
+    sa.Table('endpoints', metadata, sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True))
 
     # Create shot_upload_tasks table
-    op.create_table(
-        'shot_upload_tasks',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    tasks = sa.Table(
+        'shot_upload_tasks', metadata,
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('name', sa.String(length=255), nullable=False),
         sa.Column('source_endpoint_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('target_endpoint_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('status', shot_upload_task_status, nullable=False, server_default='pending'),
-        sa.Column('version_strategy', sa.String(length=20), nullable=False, server_default='latest'),
+        sa.Column('version_strategy', upload_version_strategy, nullable=False, server_default='latest'),
         sa.Column('specific_version', sa.String(length=20), nullable=True),
-        sa.Column('conflict_strategy', sa.String(length=20), nullable=False, server_default='skip'),
+        sa.Column('conflict_strategy', upload_conflict_strategy, nullable=False, server_default='skip'),
         sa.Column('total_items', sa.Integer(), nullable=False, server_default='0'),
         sa.Column('completed_items', sa.Integer(), nullable=False, server_default='0'),
         sa.Column('failed_items', sa.Integer(), nullable=False, server_default='0'),
@@ -59,15 +109,11 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['source_endpoint_id'], ['endpoints.id'], ondelete='CASCADE'),
         sa.ForeignKeyConstraint(['target_endpoint_id'], ['endpoints.id'], ondelete='CASCADE'),
     )
-    op.create_index('idx_shot_upload_task_source', 'shot_upload_tasks', ['source_endpoint_id'])
-    op.create_index('idx_shot_upload_task_target', 'shot_upload_tasks', ['target_endpoint_id'])
-    op.create_index('idx_shot_upload_task_status', 'shot_upload_tasks', ['status'])
-    op.create_index('idx_shot_upload_task_created', 'shot_upload_tasks', ['created_at'])
 
     # Create shot_upload_items table
-    op.create_table(
-        'shot_upload_items',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    items = sa.Table(
+        'shot_upload_items', metadata,
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('task_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('episode', sa.String(length=50), nullable=False),
         sa.Column('sequence', sa.String(length=50), nullable=False),
@@ -89,14 +135,11 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.ForeignKeyConstraint(['task_id'], ['shot_upload_tasks.id'], ondelete='CASCADE'),
     )
-    op.create_index('idx_shot_upload_item_task', 'shot_upload_items', ['task_id'])
-    op.create_index('idx_shot_upload_item_status', 'shot_upload_items', ['status'])
-    op.create_index('idx_shot_upload_item_shot', 'shot_upload_items', ['episode', 'sequence', 'shot'])
 
     # Create shot_upload_history table
-    op.create_table(
-        'shot_upload_history',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    history = sa.Table(
+        'shot_upload_history', metadata,
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('task_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('item_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('task_name', sa.String(length=255), nullable=False),
@@ -111,38 +154,87 @@ def upgrade() -> None:
         sa.Column('target_path', sa.Text(), nullable=False),
         sa.Column('source_endpoint_name', sa.String(length=255), nullable=False),
         sa.Column('target_endpoint_name', sa.String(length=255), nullable=False),
-        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('status', shot_upload_item_status, nullable=False),
         sa.Column('error_message', sa.Text(), nullable=True),
-        sa.Column('uploaded_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('uploaded_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
         sa.Column('uploaded_by', sa.String(length=255), nullable=True),
-        sa.PrimaryKeyConstraint('id'),
+        # Partition key must be part of the primary key
+        sa.PrimaryKeyConstraint('id', 'uploaded_at'),
+        sa.Index('idx_upload_history_task_status', 'task_id', 'status'),
+        sa.Index('idx_upload_history_shot', 'episode', 'sequence', 'shot'),
+        sa.Index('idx_upload_history_date', 'uploaded_at'),
+        sa.Index('idx_upload_history_status', 'status'),
+        postgresql_partition_by='RANGE (uploaded_at)',
     )
-    op.create_index('idx_upload_history_task', 'shot_upload_history', ['task_id'])
-    op.create_index('idx_upload_history_shot', 'shot_upload_history', ['episode', 'sequence', 'shot'])
-    op.create_index('idx_upload_history_date', 'shot_upload_history', ['uploaded_at'])
-    op.create_index('idx_upload_history_status', 'shot_upload_history', ['status'])
 
+    # Emit the tables after the enum types as a single batch so the schema
+    # is created in one server roundtrip.
+    dialect = postgresql.dialect()
+    for table in (tasks, items, history):
+        statements.append(str(CreateTable(table).compile(dialect=dialect)))
+    # Paths share long project/shot prefixes; when a row is big enough to be
+    # compressed, lz4 (PostgreSQL 14+) is much cheaper than pglz. Partitions
+    # created below inherit the setting.
+    statements.append(
+        "ALTER TABLE shot_upload_items "
+        "ALTER COLUMN source_path SET COMPRESSION lz4, "
+        "ALTER COLUMN target_path SET COMPRESSION lz4, "
+        "ALTER COLUMN relative_path SET COMPRESSION lz4"
+    )
+    statements.append(
+        "ALTER TABLE shot_upload_history "
+        "ALTER COLUMN source_path SET COMPRESSION lz4, "
+        "ALTER COLUMN target_path SET COMPRESSION lz4"
+    )
+    # Indexes cannot be built CONCURRENTLY on a partitioned table, so build
+    # the history indexes here while the table is still empty.
+    for index in sorted(history.indexes, key=lambda i: i.name):
+        statements.append(str(CreateIndex(index).compile(dialect=dialect)))
+    # Monthly history partitions for the coming year; later months are
+    # created by the maintain_upload_history_partitions task, and anything
+    # outside the covered range lands in the default partition.
+    month = datetime.now(timezone.utc).date().replace(day=1)
+    for _ in range(12):
+        next_month = (month + timedelta(days=32)).replace(day=1)
+        statements.append(
+            f"CREATE TABLE shot_upload_history_{month:%Y_%m} PARTITION OF shot_upload_history "
+            f"FOR VALUES FROM ('{month}') TO ('{next_month}')"
+        )
+        month = next_month
+    statements.append("CREATE TABLE shot_upload_history_default PARTITION OF shot_upload_history DEFAULT")
+    op.execute(";\n".join(statement.strip() for statement in statements))
 
-def downgrade() -> None:
-    # Drop tables in reverse order
-    op.drop_index('idx_upload_history_status', table_name='shot_upload_history')
-    op.drop_index('idx_upload_history_date', table_name='shot_upload_history')
-    op.drop_index('idx_upload_history_shot', table_name='shot_upload_history')
-    op.drop_index('idx_upload_history_task', table_name='shot_upload_history')
-    op.drop_table('shot_upload_history')
-
-    op.drop_index('idx_shot_upload_item_shot', table_name='shot_upload_items')
-    op.drop_index('idx_shot_upload_item_status', table_name='shot_upload_items')
-    op.drop_index('idx_shot_upload_item_task', table_name='shot_upload_items')
-    op.drop_table('shot_upload_items')
-
-    op.drop_index('idx_shot_upload_task_created', table_name='shot_upload_tasks')
-    op.drop_index('idx_shot_upload_task_status', table_name='shot_upload_tasks')
-    op.drop_index('idx_shot_upload_task_target', table_name='shot_upload_tasks')
-    op.drop_index('idx_shot_upload_task_source', table_name='shot_upload_tasks')
-    op.drop_table('shot_upload_tasks')
+    # Build indexes outside the migration transaction so they do not block
+    # writes to the upload tables.
+    with op.get_context().autocommit_block():
+        op.create_index('idx_shot_upload_task_source', 'shot_upload_tasks', ['source_endpoint_id'], postgresql_concurrently=True)
+        op.create_index('idx_shot_upload_task_target', 'shot_upload_tasks', ['target_endpoint_id'], postgresql_concurrently=True)
+        # Only pending/running tasks are looked up by status; terminal rows
+        # never enter these indexes.
+        op.create_index(
+            'idx_shot_upload_task_status_active', 'shot_upload_tasks', ['status', 'created_at'],
+            postgresql_where=sa.text("status IN ('pending', 'running')"), postgresql_concurrently=True
+        )
+        op.create_index('idx_shot_upload_task_created', 'shot_upload_tasks', ['created_at'], postgresql_concurrently=True)
+        # Progress queries filter on task and status together; the INCLUDE
+        # columns let size aggregates run as index-only scans.
+        op.create_index(
+            'idx_shot_upload_item_task_status', 'shot_upload_items', ['task_id', 'status'],
+            postgresql_include=['file_size', 'uploaded_size'], postgresql_concurrently=True
+        )
+        op.create_index('idx_shot_upload_item_shot', 'shot_upload_items', ['episode', 'sequence', 'shot'], postgresql_concurrently=True)
+        op.create_index(
+            'idx_shot_upload_item_active', 'shot_upload_items', ['task_id', 'episode', 'sequence', 'shot'],
+            postgresql_where=sa.text("status IN ('pending', 'uploading')"), postgresql_concurrently=True
+        )
 
-    # Drop enums
-    op.execute('DROP TYPE IF EXISTS shotuploaditemstatus')
-    op.execute('DROP TYPE IF EXISTS shotuploadtaskstatus')
 
+def downgrade() -> None:
+    # Drop tables (their indexes and history partitions go with them), enum types and the id
+    # function in one batch
+    op.execute(
+        "DROP TABLE shot_upload_history, shot_upload_items, shot_upload_tasks CASCADE;\n"
+        "DROP TYPE IF EXISTS uploadconflictstrategy, uploadversionstrategy, "
+        "shotuploaditemstatus, shotuploadtaskstatus;\n"
+        "DROP FUNCTION IF EXISTS uuid_generate_v7()"
+    )
@@ -18,6 +18,33 @@ down_revision = '004_add_shot_upload_tables'
 branch_labels = None
 depends_on = None
 
+# Rows back-filled per committed UPDATE when copying endpoint columns
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _backfill(assignments: str, pending_column: str) -> None:
+    """Copy endpoint columns in committed batches to keep row locks short."""
+    if op.get_context().as_sql:
+        # Offline SQL cannot loop on row counts; emit a single UPDATE.
+        op.execute(f"UPDATE shot_upload_tasks SET {assignments} WHERE {pending_column} IS NULL")
+        return
+
+    bind = op.get_bind()
+    batch_update = sa.text(f"""
+        WITH batch AS (
+            SELECT id FROM shot_upload_tasks
+            WHERE {pending_column} IS NULL
+            LIMIT {BACKFILL_BATCH_SIZE}
+        )
+        UPDATE shot_upload_tasks AS t
+        SET {assignments}
+        FROM batch
+        WHERE t.id = batch.id
+    """)
+    with op.get_context().autocommit_block():
+        while bind.execute(batch_update).rowcount:
+            pass
+
 
 def upgrade() -> None:
     # Add new endpoint_id column (initially nullable)
@@ -26,28 +53,36 @@ def upgrade() -> None:
     )
     
     # Copy target_endpoint_id to endpoint_id (target has both local_path and remote_path)
-    op.execute("""
-        UPDATE shot_upload_tasks 
-        SET endpoint_id = target_endpoint_id
-    """)
+    _backfill('endpoint_id = target_endpoint_id', 'endpoint_id')
     
-    # Make endpoint_id not nullable
-    op.alter_column('shot_upload_tasks', 'endpoint_id', nullable=False)
-    
-    # Add foreign key constraint
-    op.create_foreign_key(
-        'fk_shot_upload_tasks_endpoint',
-        'shot_upload_tasks', 'endpoints',
-        ['endpoint_id'], ['id'],
-        ondelete='CASCADE'
+    # Make endpoint_id not nullable. A validated CHECK proves there are no
+    # NULLs, so SET NOT NULL skips its table scan under ACCESS EXCLUSIVE.
+    op.execute(
+        "ALTER TABLE shot_upload_tasks ADD CONSTRAINT endpoint_id_not_null "
+        "CHECK (endpoint_id IS NOT NULL) NOT VALID"
+    )
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE shot_upload_tasks VALIDATE CONSTRAINT endpoint_id_not_null")
+    op.execute(
+        "ALTER TABLE shot_upload_tasks ALTER COLUMN endpoint_id SET NOT NULL, "
+        "DROP CONSTRAINT endpoint_id_not_null"
     )
     
-    # Create new index
-    op.create_index('idx_shot_upload_task_endpoint', 'shot_upload_tasks', ['endpoint_id'])
+    # Add foreign key constraint without scanning the table under lock;
+    # existing rows are checked by VALIDATE below, which does not block
+    # writes
+    op.execute(
+        "ALTER TABLE shot_upload_tasks ADD CONSTRAINT fk_shot_upload_tasks_endpoint "
+        "FOREIGN KEY (endpoint_id) REFERENCES endpoints (id) ON DELETE CASCADE NOT VALID"
+    )
     
-    # Drop old indexes
-    op.drop_index('idx_shot_upload_task_source', table_name='shot_upload_tasks')
-    op.drop_index('idx_shot_upload_task_target', table_name='shot_upload_tasks')
+    # Swap indexes outside the migration transaction so concurrent task
+    # writes are not blocked while they build
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE shot_upload_tasks VALIDATE CONSTRAINT fk_shot_upload_tasks_endpoint")
+        op.create_index('idx_shot_upload_task_endpoint', 'shot_upload_tasks', ['endpoint_id'], postgresql_concurrently=True)
+        op.drop_index('idx_shot_upload_task_source', table_name='shot_upload_tasks', postgresql_concurrently=True)
+        op.drop_index('idx_shot_upload_task_target', table_name='shot_upload_tasks', postgresql_concurrently=True)
     
     # Drop old foreign key constraints
     op.drop_constraint('shot_upload_tasks_source_endpoint_id_fkey', 'shot_upload_tasks', type_='foreignkey')
@@ -68,36 +103,41 @@ def downgrade() -> None:
     )
     
     # Copy endpoint_id to both columns
-    op.execute("""
-        UPDATE shot_upload_tasks 
-        SET source_endpoint_id = endpoint_id,
-            target_endpoint_id = endpoint_id
-    """)
-    
-    # Make columns not nullable
-    op.alter_column('shot_upload_tasks', 'source_endpoint_id', nullable=False)
-    op.alter_column('shot_upload_tasks', 'target_endpoint_id', nullable=False)
+    _backfill('source_endpoint_id = endpoint_id, target_endpoint_id = endpoint_id', 'source_endpoint_id')
     
-    # Add foreign key constraints
-    op.create_foreign_key(
-        'shot_upload_tasks_source_endpoint_id_fkey',
-        'shot_upload_tasks', 'endpoints',
-        ['source_endpoint_id'], ['id'],
-        ondelete='CASCADE'
+    # Make columns not nullable via validated CHECKs, as in upgrade()
+    op.execute(
+        "ALTER TABLE shot_upload_tasks "
+        "ADD CONSTRAINT source_endpoint_id_not_null CHECK (source_endpoint_id IS NOT NULL) NOT VALID, "
+        "ADD CONSTRAINT target_endpoint_id_not_null CHECK (target_endpoint_id IS NOT NULL) NOT VALID"
     )
-    op.create_foreign_key(
-        'shot_upload_tasks_target_endpoint_id_fkey',
-        'shot_upload_tasks', 'endpoints',
-        ['target_endpoint_id'], ['id'],
-        ondelete='CASCADE'
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE shot_upload_tasks VALIDATE CONSTRAINT source_endpoint_id_not_null")
+        op.execute("ALTER TABLE shot_upload_tasks VALIDATE CONSTRAINT target_endpoint_id_not_null")
+    op.execute(
+        "ALTER TABLE shot_upload_tasks "
+        "ALTER COLUMN source_endpoint_id SET NOT NULL, "
+        "ALTER COLUMN target_endpoint_id SET NOT NULL, "
+        "DROP CONSTRAINT source_endpoint_id_not_null, "
+        "DROP CONSTRAINT target_endpoint_id_not_null"
     )
     
-    # Create old indexes
-    op.create_index('idx_shot_upload_task_source', 'shot_upload_tasks', ['source_endpoint_id'])
-    op.create_index('idx_shot_upload_task_target', 'shot_upload_tasks', ['target_endpoint_id'])
+    # Add foreign key constraints NOT VALID and validate them below
+    op.execute(
+        "ALTER TABLE shot_upload_tasks "
+        "ADD CONSTRAINT shot_upload_tasks_source_endpoint_id_fkey "
+        "FOREIGN KEY (source_endpoint_id) REFERENCES endpoints (id) ON DELETE CASCADE NOT VALID, "
+        "ADD CONSTRAINT shot_upload_tasks_target_endpoint_id_fkey "
+        "FOREIGN KEY (target_endpoint_id) REFERENCES endpoints (id) ON DELETE CASCADE NOT VALID"
+    )
     
-    # Drop new index
-    op.drop_index('idx_shot_upload_task_endpoint', table_name='shot_upload_tasks')
+    # Swap indexes back without blocking concurrent task writes
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE shot_upload_tasks VALIDATE CONSTRAINT shot_upload_tasks_source_endpoint_id_fkey")
+        op.execute("ALTER TABLE shot_upload_tasks VALIDATE CONSTRAINT shot_upload_tasks_target_endpoint_id_fkey")
+        op.create_index('idx_shot_upload_task_source', 'shot_upload_tasks', ['source_endpoint_id'], postgresql_concurrently=True)
+        op.create_index('idx_shot_upload_task_target', 'shot_upload_tasks', ['target_endpoint_id'], postgresql_concurrently=True)
+        op.drop_index('idx_shot_upload_task_endpoint', table_name='shot_upload_tasks', postgresql_concurrently=True)
     
     # Drop new foreign key constraint
     op.drop_constraint('fk_shot_upload_tasks_endpoint', 'shot_upload_tasks', type_='foreignkey')
@@ -1,15 +1,15 @@
 """Fix upload size columns to BigInteger
 
 Revision ID: 009_fix_upload_size_columns
-Revises: 008_schedule_history
+Revises: 005_upload_single_endpoint
 Create Date: 2025-12-07
 
+The upload size columns are now widened together with the download size
+columns by 010_fix_download_size_columns. This revision is kept as a no-op
+so databases stamped at it still upgrade.
 """
 from typing import Sequence, Union
 
-from alembic import op
-import sqlalchemy as sa
-
 
 # revision identifiers, used by Alembic.
 revision: str = '009_fix_upload_size_columns'
@@ -19,81 +19,8 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Fix shot_upload_tasks columns
-    op.alter_column('shot_upload_tasks', 'total_size',
-                    existing_type=sa.Integer(),
-                    type_=sa.BigInteger(),
-                    existing_nullable=False,
-                    existing_server_default='0')
-    
-    op.alter_column('shot_upload_tasks', 'uploaded_size',
-                    existing_type=sa.Integer(),
-                    type_=sa.BigInteger(),
-                    existing_nullable=False,
-                    existing_server_default='0')
-    
-    # Fix shot_upload_items columns
-    op.alter_column('shot_upload_items', 'file_size',
-                    existing_type=sa.Integer(),
-                    type_=sa.BigInteger(),
-                    existing_nullable=False,
-                    existing_server_default='0')
-    
-    op.alter_column('shot_upload_items', 'uploaded_size',
-                    existing_type=sa.Integer(),
-                    type_=sa.BigInteger(),
-                    existing_nullable=False,
-                    existing_server_default='0')
-    
-    op.alter_column('shot_upload_items', 'target_size',
-                    existing_type=sa.Integer(),
-                    type_=sa.BigInteger(),
-                    existing_nullable=True)
-    
-    # Fix shot_upload_history columns
-    op.alter_column('shot_upload_history', 'file_size',
-                    existing_type=sa.Integer(),
-                    type_=sa.BigInteger(),
-                    existing_nullable=False,
-                    existing_server_default='0')
+    pass
 
 
 def downgrade() -> None:
-    # Revert shot_upload_history columns
-    op.alter_column('shot_upload_history', 'file_size',
-                    existing_type=sa.BigInteger(),
-                    type_=sa.Integer(),
-                    existing_nullable=False,
-                    existing_server_default='0')
-    
-    # Revert shot_upload_items columns
-    op.alter_column('shot_upload_items', 'target_size',
-                    existing_type=sa.BigInteger(),
-                    type_=sa.Integer(),
-                    existing_nullable=True)
-    
-    op.alter_column('shot_upload_items', 'uploaded_size',
-                    existing_type=sa.BigInteger(),
-                    type_=sa.Integer(),
-                    existing_nullable=False,
-                    existing_server_default='0')
-    
-    op.alter_column('shot_upload_items', 'file_size',
-                    existing_type=sa.BigInteger(),
-                    type_=sa.Integer(),
-                    existing_nullable=False,
-                    existing_server_default='0')
-    
-    # Revert shot_upload_tasks columns
-    op.alter_column('shot_upload_tasks', 'uploaded_size',
-                    existing_type=sa.BigInteger(),
-                    type_=sa.Integer(),
-                    existing_nullable=False,
-                    existing_server_default='0')
-    
-    op.alter_column('shot_upload_tasks', 'total_size',
-                    existing_type=sa.BigInteger(),
-                    type_=sa.Integer(),
-                    existing_nullable=False,
-                    existing_server_default='0')
-
+    pass
@@ -0,0 +1,93 @@
+"""Fix upload and download size columns to BigInteger
+
+Revision ID: 010_fix_download_size_columns
+Revises: 009_fix_upload_size_columns
+Create Date: 2025-12-12
+
+Changes INTEGER size columns to BIGINT to support files larger than 2GB.
+Also widens the upload size columns, formerly done by the now no-op
+009_fix_upload_size_columns; ALTERing a column that is already BIGINT is
+a no-op, so databases upgraded past 009 are unaffected.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010_fix_download_size_columns'
+down_revision: Union[str, None] = '009_fix_upload_size_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Give up rather than queue behind long-running transactions: a blocked
+# ACCESS EXCLUSIVE request would stall every other query on the table.
+LOCK_TIMEOUT = '5s'
+STATEMENT_TIMEOUT = '15min'
+
+# One ALTER TABLE per table so each heap is rewritten once rather than once
+# per column; columns that are already BIGINT are left without a rewrite.
+UPGRADE_ALTERS = [
+    """
+    ALTER TABLE shot_upload_tasks
+        ALTER COLUMN total_size TYPE BIGINT,
+        ALTER COLUMN uploaded_size TYPE BIGINT
+    """,
+    """
+    ALTER TABLE shot_upload_items
+        ALTER COLUMN file_size TYPE BIGINT,
+        ALTER COLUMN uploaded_size TYPE BIGINT,
+        ALTER COLUMN target_size TYPE BIGINT
+    """,
+    """
+    ALTER TABLE shot_upload_history
+        ALTER COLUMN file_size TYPE BIGINT
+    """,
+    """
+    ALTER TABLE shot_download_tasks
+        ALTER COLUMN total_size TYPE BIGINT,
+        ALTER COLUMN downloaded_size TYPE BIGINT
+    """,
+    """
+    ALTER TABLE shot_download_items
+        ALTER COLUMN total_size TYPE BIGINT,
+        ALTER COLUMN downloaded_size TYPE BIGINT
+    """,
+]
+
+def _run_alters(statements: List[str]) -> None:
+    """Run per-table ALTERs in parallel, one backend per table."""
+    if op.get_context().as_sql:
+        op.execute(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'")
+        op.execute(f"SET LOCAL statement_timeout = '{STATEMENT_TIMEOUT}'")
+        for statement in statements:
+            op.execute(statement)
+        op.execute("RESET lock_timeout")
+        op.execute("RESET statement_timeout")
+        return
+
+    engine = op.get_bind().engine
+
+    def alter(statement: str) -> None:
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'")
+            conn.exec_driver_sql(f"SET LOCAL statement_timeout = '{STATEMENT_TIMEOUT}'")
+            conn.exec_driver_sql(statement)
+
+    # The autocommit block commits the migration transaction first, so the
+    # other backends see tables created earlier in this run.
+    with op.get_context().autocommit_block():
+        with ThreadPoolExecutor(max_workers=len(statements)) as executor:
+            # list() re-raises the first failure
+            list(executor.map(alter, statements))
+
+
+def upgrade() -> None:
+    _run_alters(UPGRADE_ALTERS)
+
+
+def downgrade() -> None:
+    # 002 and 004 create these columns as BIGINT, so narrowing them back
+    # to INTEGER would leave the schema different from a fresh install
+    pass
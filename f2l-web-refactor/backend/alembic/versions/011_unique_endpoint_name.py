@@ -0,0 +1,40 @@
+"""Make endpoint names unique
+
+Revision ID: 011_unique_endpoint_name
+Revises: 010_fix_download_size_columns
+Create Date: 2026-10-17
+
+Endpoint creation inserts with ON CONFLICT (name) DO NOTHING, which needs
+a unique constraint on endpoints.name. The API already rejected duplicate
+names, but the check was not atomic; any duplicates that slipped through
+keep the oldest row's name and get their ID appended.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011_unique_endpoint_name'
+down_revision: Union[str, None] = '010_fix_download_size_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        UPDATE endpoints AS e
+        SET name = left(e.name, 216) || ' (' || e.id::text || ')'
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY name ORDER BY created_at, id) AS rn
+            FROM endpoints
+        ) AS d
+        WHERE e.id = d.id AND d.rn > 1
+        """
+    )
+    op.create_unique_constraint('uq_endpoint_name', 'endpoints', ['name'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_endpoint_name', 'endpoints', type_='unique')
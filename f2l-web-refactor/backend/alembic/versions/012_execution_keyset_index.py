@@ -0,0 +1,33 @@
+"""Index executions for keyset pagination
+
+Revision ID: 012_execution_keyset_index
+Revises: 011_unique_endpoint_name
+Create Date: 2026-10-17
+
+The executions list pages with WHERE (queued_at, id) < cursor ORDER BY
+queued_at DESC, id DESC. A btree on (queued_at, id) serves that as a
+backward index scan starting at the cursor, whatever the page depth.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012_execution_keyset_index'
+down_revision: Union[str, None] = '011_unique_endpoint_name'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_execution_queued', 'sync_executions', ['queued_at', 'id'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_execution_queued', table_name='sync_executions', postgresql_concurrently=True)
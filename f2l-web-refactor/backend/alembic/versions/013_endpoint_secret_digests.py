@@ -0,0 +1,31 @@
+"""Add keyed digests of endpoint secrets
+
+Revision ID: 013_endpoint_secret_digests
+Revises: 012_execution_keyset_index
+Create Date: 2026-10-17
+
+Endpoint updates compare a submitted password or S3 secret key with the
+stored digest and skip re-encrypting it when unchanged. Existing rows have
+no digest and get one the next time their secret is saved.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013_endpoint_secret_digests'
+down_revision: Union[str, None] = '012_execution_keyset_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('endpoints', sa.Column('password_digest', sa.String(length=32), nullable=True))
+    op.add_column('endpoints', sa.Column('s3_secret_key_digest', sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('endpoints', 's3_secret_key_digest')
+    op.drop_column('endpoints', 'password_digest')
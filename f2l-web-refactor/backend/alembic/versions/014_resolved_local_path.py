@@ -0,0 +1,46 @@
+"""Store the resolved local path of endpoints
+
+Revision ID: 014_resolved_local_path
+Revises: 013_endpoint_secret_digests
+Create Date: 2026-10-17
+
+Connection tests read the absolute local path saved with the endpoint
+instead of joining relative paths to /mnt on every probe. Existing rows are
+backfilled the same way resolve_local_path() resolves them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '014_resolved_local_path'
+down_revision: Union[str, None] = '013_endpoint_secret_digests'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('endpoints', sa.Column('resolved_local_path', sa.Text(), nullable=True))
+
+    # Join relative paths to /mnt, then drop "." components, repeated and trailing slashes
+    op.execute("""
+        UPDATE endpoints
+        SET resolved_local_path = COALESCE(NULLIF(
+            rtrim(
+                regexp_replace(
+                    regexp_replace(
+                        CASE WHEN local_path LIKE '/%' THEN local_path ELSE '/mnt/' || local_path END,
+                        '(/\\.)+(/|$)', '/', 'g'
+                    ),
+                    '/{2,}', '/', 'g'
+                ),
+                '/'
+            ), ''), '/')
+        WHERE local_path IS NOT NULL AND local_path <> ''
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('endpoints', 'resolved_local_path')
@@ -0,0 +1,33 @@
+"""Index sessions for keyset pagination
+
+Revision ID: 015_session_keyset_index
+Revises: 014_resolved_local_path
+Create Date: 2026-10-17
+
+The sessions list pages with WHERE is_active AND (created_at, id) < cursor
+ORDER BY created_at DESC, id DESC. A btree on (is_active, created_at, id)
+serves that as a backward index scan starting at the cursor.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '015_session_keyset_index'
+down_revision: Union[str, None] = '014_resolved_local_path'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_session_created', 'sync_sessions', ['is_active', 'created_at', 'id'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_session_created', table_name='sync_sessions', postgresql_concurrently=True)
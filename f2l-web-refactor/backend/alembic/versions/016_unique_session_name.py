@@ -0,0 +1,40 @@
+"""Make sync session names unique
+
+Revision ID: 016_unique_session_name
+Revises: 015_session_keyset_index
+Create Date: 2026-10-17
+
+Session creation inserts with ON CONFLICT (name) DO NOTHING, which needs
+a unique constraint on sync_sessions.name. The API already rejected
+duplicate names, but the check was not atomic; any duplicates that slipped
+through keep the oldest row's name and get their ID appended.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '016_unique_session_name'
+down_revision: Union[str, None] = '015_session_keyset_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        UPDATE sync_sessions AS s
+        SET name = left(s.name, 216) || ' (' || s.id::text || ')'
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY name ORDER BY created_at, id) AS rn
+            FROM sync_sessions
+        ) AS d
+        WHERE s.id = d.id AND d.rn > 1
+        """
+    )
+    op.create_unique_constraint('uq_session_name', 'sync_sessions', ['name'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_session_name', 'sync_sessions', type_='unique')
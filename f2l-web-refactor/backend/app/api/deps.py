@@ -0,0 +1,32 @@
+"""
+API dependencies - Repositories bound to the request's database session.
+"""
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.session_cache import SessionCache, session_cache
+from app.database.session import get_db
+from app.repositories.endpoint_repository import EndpointRepository
+from app.repositories.execution_repository import ExecutionRepository
+from app.repositories.session_repository import SessionRepository
+
+
+# async so FastAPI calls them inline instead of in the threadpool
+async def get_endpoint_repo(db: AsyncSession = Depends(get_db)) -> EndpointRepository:
+    """Get an endpoint repository for the request."""
+    return EndpointRepository(db)
+
+
+async def get_execution_repo(db: AsyncSession = Depends(get_db)) -> ExecutionRepository:
+    """Get an execution repository for the request."""
+    return ExecutionRepository(db)
+
+
+async def get_session_repo(db: AsyncSession = Depends(get_db)) -> SessionRepository:
+    """Get a sync session repository for the request."""
+    return SessionRepository(db)
+
+
+async def get_session_cache() -> SessionCache:
+    """Get the shared sync session response cache."""
+    return session_cache
@@ -0,0 +1,52 @@
+"""
+Keyset pagination - Opaque cursors for list endpoints.
+
+``skip`` makes the database walk and discard every skipped row. A cursor
+holds the sort key of the last row of a page instead, so the next page
+starts with an index seek no matter how deep it is.
+"""
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+from uuid import UUID
+import base64
+
+from fastapi import HTTPException, Response, status
+
+# Response header carrying the cursor of the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+Cursor = Tuple[datetime, UUID]
+
+
+def encode_cursor(sort_value: datetime, row_id: UUID) -> str:
+    """Encode a row's ``(sort_value, id)`` key as a URL-safe cursor."""
+    raw = f"{sort_value.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    """
+    Decode a cursor from ``encode_cursor``.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        sort_value, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(sort_value), UUID(row_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def set_next_cursor(response: Response, rows: Sequence[Any], limit: int, sort_attr: str) -> Response:
+    """Add the next page's cursor to a list response if the page is full."""
+    if rows and len(rows) >= limit:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(getattr(last, sort_attr), last.id)
+    return response
@@ -0,0 +1,79 @@
+"""
+ORM responses - Encode trusted database rows straight to JSON.
+
+Response schemas for reads describe rows from our own database, so
+validating every row against the schema before encoding it is wasted work.
+Rows are copied into plain dicts with the schema's fields and encoded by
+orjson, which writes UUIDs, enums and datetimes the way the schemas do.
+"""
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterable, Tuple, Type
+
+import orjson
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _schema_fields(schema: Type[BaseModel]) -> Tuple[Tuple[str, Any], ...]:
+    """``(name, default)`` per schema field; required fields get ``_MISSING``."""
+    return tuple(
+        (name, _MISSING if field.default is PydanticUndefined else field.default)
+        for name, field in schema.model_fields.items()
+    )
+
+
+def _row_dict(fields: Tuple[Tuple[str, Any], ...], row: Any) -> dict:
+    return {
+        name: getattr(row, name) if default is _MISSING else getattr(row, name, default)
+        for name, default in fields
+    }
+
+
+def _json(content: Any, status_code: int = 200) -> Response:
+    return Response(
+        content=orjson.dumps(content, option=orjson.OPT_UTC_Z),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+def orm_response(schema: Type[BaseModel], row: Any, status_code: int = 200) -> Response:
+    """Encode an ORM row with the fields of ``schema``."""
+    return _json(_row_dict(_schema_fields(schema), row), status_code)
+
+
+def orm_list_response(schema: Type[BaseModel], rows: Iterable[Any]) -> Response:
+    """Encode ORM rows as a JSON array with the fields of ``schema``."""
+    fields = _schema_fields(schema)
+    return _json([_row_dict(fields, row) for row in rows])
+
+
+def orm_ndjson_response(schema: Type[BaseModel], rows: AsyncIterator[Any]) -> StreamingResponse:
+    """Stream ORM rows as newline-delimited JSON with the fields of ``schema``."""
+    fields = _schema_fields(schema)
+
+    async def lines() -> AsyncIterator[bytes]:
+        async for row in rows:
+            yield orjson.dumps(_row_dict(fields, row), option=orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE)
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
+
+
+def json_array_response(items: AsyncIterator[Any]) -> StreamingResponse:
+    """Stream already-shaped items as one JSON array, encoding each as it arrives."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        separator = b"["
+        async for item in items:
+            yield separator + orjson.dumps(item, option=orjson.OPT_UTC_Z)
+            separator = b","
+        yield b"[]" if separator == b"[" else b"]"
+
+    return StreamingResponse(chunks(), media_type="application/json")
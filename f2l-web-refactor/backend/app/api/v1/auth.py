@@ -1,16 +1,34 @@
 """
 Authentication API endpoints.
 """
+import re
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, field_validator
 
 router = APIRouter()
 
+# Shape check only; login looks the address up, so full RFC validation
+# (email-validator) buys nothing on this hot path.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 
 class LoginRequest(BaseModel):
-    email: EmailStr
+    # Reject unknown fields rather than collecting them
+    model_config = ConfigDict(extra="forbid")
+
+    email: str
     password: str
 
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        """Check the email has a user@domain.tld shape."""
+        v = v.strip()
+        if not _EMAIL_RE.match(v):
+            raise ValueError("value is not a valid email address")
+        return v
+
 
 class TokenResponse(BaseModel):
     access_token: str
@@ -2,20 +2,137 @@
 Browse API - Interactive directory browsing with metadata comparison.
 Provides endpoints for FTP/SFTP/Local directory navigation and file metadata operations.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List, Optional, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import AsyncIterator, Callable, List, Optional, Dict, Any, Tuple, TypeVar
+import asyncio
+import logging
+import posixpath
+
+import orjson
+from email.utils import format_datetime
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.ftp_manager import FTPManager, FTPConfig
+from app.core.listing_cache import CachedListing, listing_cache, metadata_cache
+from app.core.listing_result import ListingResult
+from app.core.local_manager import LocalManager, LocalConfig
+from app.core.manager_pool import EndpointManagerPool
 from app.core.sftp_manager import SFTPManager, SFTPConfig
 from app.core.metadata_engine import MetadataEngine, SyncDirection, FileMetadata, ComparisonResult
 from app.database.models import Endpoint, EndpointType
 from app.database.session import get_db
+from app.repositories.endpoint_repository import EndpointRepository
 
-router = APIRouter()
+# orjson serializes the remaining response_model responses several times faster than json
+router = APIRouter(default_response_class=ORJSONResponse)
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# FTP/SFTP/Local managers are blocking; run their calls here so a slow
+# listing does not stall the event loop for every other request.
+_browse_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="browse")
+
+
+async def _run_blocking(func: Callable[..., T], *args, **kwargs) -> T:
+    """Run a blocking manager call in the browse thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_browse_executor, partial(func, *args, **kwargs))
+
+
+# Connected managers reused across browse requests for the same endpoint
+manager_pool = EndpointManagerPool(executor=_browse_executor)
+
+# LocalManager keeps no per-connection state (its listing methods only read
+# base_path), so one connected instance per base path is shared by all
+# requests and threads; connect() lists the whole base directory.
+_local_managers: Dict[str, LocalManager] = {}
+
+
+async def _shared_local_manager(base_path: str) -> LocalManager:
+    """Get the connected LocalManager for a base path, connecting it once."""
+    manager = _local_managers.get(base_path)
+    if manager is None or not manager.connected:
+        manager = LocalManager(config=LocalConfig(base_path=base_path))
+        if not await _run_blocking(manager.connect):
+            raise ConnectionError("Failed to connect to endpoint")
+        _local_managers[base_path] = manager
+    return manager
+
+
+@asynccontextmanager
+async def _acquire_manager(key: Any, config: Any, factory: Callable[[Any], Any]) -> AsyncIterator[Any]:
+    """Borrow a manager: the shared LocalManager for local configs, else from ``manager_pool``."""
+    if factory is LocalManager:
+        yield await _shared_local_manager(config.base_path)
+        return
+    async with manager_pool.acquire(key, config, factory) as manager:
+        yield manager
+
+
+def _ftp_manager_config(endpoint_data: Dict[str, Any], local_base_path: str) -> Tuple[Any, Callable[[Any], Any]]:
+    config = FTPConfig(
+        host=endpoint_data['host'],
+        port=endpoint_data.get('port') or 21,
+        username=endpoint_data['username'],
+        password=endpoint_data.get('password', '')
+    )
+    return config, FTPManager
+
+
+def _sftp_manager_config(endpoint_data: Dict[str, Any], local_base_path: str) -> Tuple[Any, Callable[[Any], Any]]:
+    config = SFTPConfig(
+        host=endpoint_data['host'],
+        port=endpoint_data.get('port') or 22,
+        username=endpoint_data['username'],
+        password=endpoint_data.get('password', '')
+    )
+    return config, SFTPManager
+
+
+def _local_manager_config(endpoint_data: Dict[str, Any], local_base_path: str) -> Tuple[Any, Callable[[Any], Any]]:
+    return LocalConfig(base_path=local_base_path), LocalManager
+
+
+# Endpoint types that support browsing -> builder of (config, factory)
+_MANAGER_CONFIGS: Dict[EndpointType, Callable[[Dict[str, Any], str], Tuple[Any, Callable[[Any], Any]]]] = {
+    EndpointType.FTP: _ftp_manager_config,
+    EndpointType.SFTP: _sftp_manager_config,
+    EndpointType.LOCAL: _local_manager_config,
+}
+
+
+def _manager_config(endpoint_data: Dict[str, Any], local_base_path: str) -> Tuple[Any, Callable[[Any], Any]]:
+    """
+    Build the manager config and factory for an endpoint.
+
+    Args:
+        endpoint_data: Endpoint data with decrypted password
+        local_base_path: Base path for LOCAL endpoints
+
+    Returns:
+        Tuple of (config, factory) for ``_acquire_manager``
+
+    Raises:
+        HTTPException: 400 if the endpoint type does not support browsing
+    """
+    try:
+        build = _MANAGER_CONFIGS.get(EndpointType(endpoint_data['endpoint_type']))
+    except ValueError:
+        build = None
+    if build is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported endpoint type: {endpoint_data['endpoint_type']}"
+        )
+    return build(endpoint_data, local_base_path)
 
 
 class DirectoryItem(BaseModel):
@@ -37,6 +154,211 @@ class DirectoryListing(BaseModel):
     total_directories: int
 
 
+# Directories listed at once by a parallel recursive walk. Each listing
+# borrows its own pooled connection, so this matches the pool's idle limit
+# to keep those connections for the next request.
+WALK_CONCURRENCY = 4
+
+
+async def _walk_parallel(
+    key: Any,
+    config: Any,
+    factory: Callable[[Any], Any],
+    root: str,
+    max_depth: int,
+    max_items: int,
+    concurrency: int = WALK_CONCURRENCY
+) -> List[Any]:
+    """
+    Recursively list an FTP/SFTP directory, listing subdirectories concurrently.
+
+    Returns the same entries as ``list_directory(recursive=True)`` (files only,
+    directories down to ``max_depth``) but in completion order, and stops
+    listing further directories once ``max_items`` files have been collected.
+
+    Args:
+        key: Pool key, normally the endpoint ID
+        config: Manager config
+        factory: Creates a new manager from ``config``
+        root: Directory to walk
+        max_depth: Maximum recursion depth
+        max_items: Stop after this many files
+        concurrency: Maximum directories listed at the same time
+
+    Returns:
+        ListingResult of file info objects
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    files: List[Any] = []
+    failed = False
+
+    async def walk(directory: str, depth: int) -> None:
+        nonlocal failed
+        async with semaphore:
+            if len(files) >= max_items:
+                return
+            async with _acquire_manager(key, config, factory) as manager:
+                entries = await _run_blocking(manager.list_directory, remote_path=directory)
+        failed = failed or getattr(entries, 'failed', False)
+
+        subdirectories = []
+        for entry in entries:
+            if entry.is_file:
+                files.append(entry)
+            elif depth + 1 < max_depth:
+                subdirectories.append(entry.path)
+        await asyncio.gather(*(walk(subdirectory, depth + 1) for subdirectory in subdirectories))
+
+    await walk(root, 0)
+    return ListingResult(files[:max_items], failed=failed)
+
+
+def _dumps(content: Any) -> bytes:
+    """Encode JSON like the pydantic schemas do (UTC datetimes end in ``Z``)."""
+    return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+
+def _listing_response(
+    path: str,
+    items: List[Dict[str, Any]],
+    total_files: int,
+    total_directories: int
+) -> Response:
+    """
+    Serialize a directory listing without building models.
+
+    Items are plain dicts in the DirectoryItem shape, built from manager data
+    that is already typed. They are encoded with orjson and returned as a
+    ``Response``, which skips FastAPI's ``response_model`` validation; the
+    models only document the schema.
+    """
+    listing = {
+        "path": path,
+        "items": items,
+        "total_items": len(items),
+        "total_files": total_files,
+        "total_directories": total_directories,
+    }
+    return Response(content=_dumps(listing), media_type="application/json")
+
+
+def _cached_response(request: Request, cached: CachedListing) -> Response:
+    """Send a cached body, or 304 if the client already has this version."""
+    headers = {
+        "ETag": cached.etag,
+        "Last-Modified": format_datetime(cached.cached_at, usegmt=True),
+        # Let browsers keep the body but revalidate on every use
+        "Cache-Control": "private, no-cache",
+    }
+    if request.headers.get("if-none-match") == cached.etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+def _directory_item(file_info: Any) -> Dict[str, Any]:
+    """Convert a LocalManager dict or FTP/SFTP file info to a DirectoryItem dict."""
+    if isinstance(file_info, dict):
+        return {
+            "name": file_info.get('name') or file_info['path'].rpartition('/')[2],
+            "path": file_info['path'],
+            "size": file_info.get('size', 0),
+            "modified": file_info.get('modified'),
+            "is_file": file_info.get('is_file', True),
+            "permissions": file_info.get('permissions'),
+        }
+    return {
+        "name": file_info.path.rpartition('/')[2],
+        "path": file_info.path,
+        "size": file_info.size,
+        "modified": file_info.modified,
+        "is_file": getattr(file_info, 'is_file', True),
+        "permissions": file_info.permissions,
+    }
+
+
+def _listing_totals(files: List[Any], items: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """
+    Get (total_files, total_directories) for listing items.
+
+    Uses the totals the manager counted while listing when ``files`` is an
+    untruncated ListingResult, otherwise counts the items.
+    """
+    if isinstance(files, ListingResult) and len(files) == len(items):
+        return files.total_files, files.total_directories
+    total_files = sum(1 for item in items if item["is_file"])
+    return total_files, len(items) - total_files
+
+
+async def _iter_listing(
+    key: Any,
+    config: Any,
+    factory: Callable[[Any], Any],
+    is_local: bool,
+    root: str,
+    recursive: bool,
+    max_depth: int,
+    max_items: int
+) -> AsyncIterator[bytes]:
+    """
+    Yield a listing as NDJSON, one directory at a time.
+
+    Each directory is listed on its own and its items are sent before the
+    next one is listed, so memory stays bounded by the largest directory.
+    Items match ``browse_directory``: recursive FTP/SFTP listings contain
+    files only, recursive local listings also contain directories. The last
+    line is ``{"__summary__": {...}}`` with the totals.
+    """
+    total_files = 0
+    total_directories = 0
+    error = None
+    pending = [(root, 0)]
+
+    try:
+        async with _acquire_manager(key, config, factory) as manager:
+            while pending and total_files + total_directories < max_items:
+                directory, depth = pending.pop()
+                if is_local:
+                    entries = await _run_blocking(manager.list_directory, path=directory)
+                else:
+                    entries = await _run_blocking(manager.list_directory, remote_path=directory)
+
+                lines = []
+                for file_info in entries:
+                    item = _directory_item(file_info)
+                    if not item["is_file"]:
+                        if recursive and depth + 1 < max_depth:
+                            pending.append((item["path"], depth + 1))
+                        if recursive and not is_local:
+                            continue
+                    if total_files + total_directories >= max_items:
+                        break
+                    if item["is_file"]:
+                        total_files += 1
+                    else:
+                        total_directories += 1
+                    lines.append(_dumps(item) + b"\n")
+
+                if lines:
+                    yield b"".join(lines)
+
+                if not recursive:
+                    break
+    except ConnectionError:
+        error = "Failed to connect to endpoint"
+    except Exception as e:
+        logger.error(f"Failed to stream directory {root}: {e}")
+        error = f"Failed to browse directory: {str(e)}"
+
+    summary = {
+        "path": root,
+        "total_items": total_files + total_directories,
+        "total_files": total_files,
+        "total_directories": total_directories,
+        "error": error,
+    }
+    yield _dumps({"__summary__": summary}) + b"\n"
+
+
 class FileMetadataResponse(BaseModel):
     """File metadata response schema."""
     path: str
@@ -52,7 +374,7 @@ class MetadataComparisonRequest(BaseModel):
     destination_endpoint_id: UUID
     source_path: str
     destination_path: str
-    sync_direction: str = Field(..., pattern="^(ftp_to_local|local_to_ftp|bidirectional)$")
+    sync_direction: SyncDirection
     source_is_main: bool = True
     force_overwrite: bool = False
 
@@ -65,6 +387,122 @@ class MetadataComparisonResponse(BaseModel):
     destination_metadata: Optional[FileMetadataResponse] = None
 
 
+class BatchComparisonItem(MetadataComparisonResponse):
+    """Per-file result of a batch metadata comparison."""
+    path: str
+
+
+# Parent directories compared at once by batch-compare; each holds one
+# pooled connection per endpoint.
+BATCH_COMPARE_CONCURRENCY = WALK_CONCURRENCY
+
+
+def _file_metadata(path: str, info: Optional[Dict[str, Any]]) -> Optional[FileMetadata]:
+    """Convert a manager ``get_file_info`` dict to FileMetadata."""
+    if not info:
+        return None
+    return FileMetadata(
+        path=path,
+        size=info.get('size') or 0,
+        modified=info.get('modified'),
+        exists=info.get('exists', True)
+    )
+
+
+def _metadata_response(metadata: Optional[FileMetadata]) -> Optional[FileMetadataResponse]:
+    """Convert FileMetadata to its response schema."""
+    if not metadata:
+        return None
+    return FileMetadataResponse(
+        path=metadata.path,
+        size=metadata.size,
+        modified=metadata.modified,
+        exists=metadata.exists
+    )
+
+
+async def _iter_batch_compare(
+    sides: List[Tuple[UUID, Any, Callable[[Any], Any]]],
+    file_paths: List[str],
+    sync_direction: SyncDirection,
+    source_is_main: bool,
+    force_overwrite: bool
+) -> AsyncIterator[bytes]:
+    """
+    Yield batch comparison results as NDJSON, one parent directory at a time.
+
+    Paths are grouped by parent directory. Up to BATCH_COMPARE_CONCURRENCY
+    groups are fetched at once, each with one ``batch_get_file_info`` call per
+    endpoint, and results are sent in completion order.
+
+    Args:
+        sides: (endpoint_id, config, factory) for the source and destination
+        file_paths: Paths to compare on both endpoints
+        sync_direction: Sync direction
+        source_is_main: Whether the source is the main source
+        force_overwrite: Always sync regardless of metadata
+    """
+    metadata_engine = MetadataEngine()
+    serialize = BatchComparisonItem.__pydantic_serializer__.to_json
+    semaphore = asyncio.Semaphore(BATCH_COMPARE_CONCURRENCY)
+    operations: Dict[str, int] = {}
+    error = None
+
+    by_parent: Dict[str, List[str]] = {}
+    for file_path in dict.fromkeys(file_paths):
+        by_parent.setdefault(posixpath.dirname(file_path) or "/", []).append(file_path)
+
+    async def fetch(endpoint_id: UUID, config: Any, factory: Callable[[Any], Any], paths: List[str]):
+        async with _acquire_manager(endpoint_id, config, factory) as manager:
+            return await _run_blocking(manager.batch_get_file_info, paths)
+
+    async def compare_group(paths: List[str]) -> bytes:
+        async with semaphore:
+            source_info, destination_info = await asyncio.gather(
+                *(fetch(endpoint_id, config, factory, paths) for endpoint_id, config, factory in sides)
+            )
+
+        lines = []
+        for file_path in paths:
+            result = metadata_engine.compare_files(
+                source_metadata=_file_metadata(file_path, source_info.get(file_path)),
+                destination_metadata=_file_metadata(file_path, destination_info.get(file_path)),
+                sync_direction=sync_direction,
+                source_is_main=source_is_main,
+                force_overwrite=force_overwrite
+            )
+            operation = result.operation.value
+            operations[operation] = operations.get(operation, 0) + 1
+            lines.append(serialize(BatchComparisonItem(
+                path=file_path,
+                operation=operation,
+                reason=result.reason,
+                source_metadata=_metadata_response(result.source_metadata),
+                destination_metadata=_metadata_response(result.destination_metadata)
+            )) + b"\n")
+        return b"".join(lines)
+
+    tasks = [asyncio.ensure_future(compare_group(paths)) for paths in by_parent.values()]
+    try:
+        for completed in asyncio.as_completed(tasks):
+            yield await completed
+    except ConnectionError:
+        error = "Failed to connect to endpoint"
+    except Exception as e:
+        logger.error(f"Batch metadata comparison failed: {e}")
+        error = f"Batch metadata comparison failed: {str(e)}"
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    summary = {
+        "total_compared": sum(operations.values()),
+        "operations": operations,
+        "error": error,
+    }
+    yield _dumps({"__summary__": summary}) + b"\n"
+
+
 class EndpointConfig(BaseModel):
     """Temporary endpoint configuration for browsing without saving."""
     endpoint_type: str
@@ -89,114 +527,58 @@ async def browse_directory_with_config(
 
     This allows browsing without saving the endpoint first.
     """
-    from app.core.local_manager import LocalManager, LocalConfig
-    from app.core.ftp_manager import FTPConfig
-    from app.core.sftp_manager import SFTPConfig
-
     try:
-        # Create appropriate manager based on endpoint type
-        if config.endpoint_type.lower() == 'ftp':
-            ftp_config = FTPConfig(
-                host=config.host,
-                port=config.port or 21,
-                username=config.username,
-                password=config.password
-            )
-            manager = FTPManager(config=ftp_config)
-        elif config.endpoint_type.lower() == 'sftp':
-            sftp_config = SFTPConfig(
-                host=config.host,
-                port=config.port or 22,
-                username=config.username,
-                password=config.password
-            )
-            manager = SFTPManager(config=sftp_config)
-        elif config.endpoint_type.lower() == 'local':
-            # Always use /mnt as base_path (the mount point)
-            # The 'path' parameter will be relative to /mnt
-            local_config = LocalConfig(base_path="/mnt")
-            manager = LocalManager(config=local_config)
+        # Always use /mnt as base_path (the mount point)
+        # The 'path' parameter will be relative to /mnt
+        endpoint_data = {**config.model_dump(), 'endpoint_type': config.endpoint_type.lower()}
+        manager_config, factory = _manager_config(endpoint_data, local_base_path="/mnt")
+        shared = factory is LocalManager
+        if shared:
+            try:
+                manager = await _shared_local_manager(manager_config.base_path)
+            except ConnectionError:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Failed to connect to endpoint"
+                )
         else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Unsupported endpoint type: {config.endpoint_type}"
-            )
+            manager = factory(manager_config)
 
-        # Connect to endpoint
-        if not manager.connect():
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Failed to connect to endpoint"
-            )
+            # Connect to endpoint
+            if not await _run_blocking(manager.connect):
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Failed to connect to endpoint"
+                )
 
         try:
             # List directory - LocalManager uses 'path' parameter, FTP/SFTP use 'remote_path'
             if config.endpoint_type.lower() == 'local':
-                files = manager.list_directory(
+                files = await _run_blocking(
+                    manager.list_directory,
                     path=path,
                     recursive=recursive,
-                    max_depth=max_depth
+                    max_depth=max_depth,
+                    max_items=max_items
                 )
             else:
-                files = manager.list_directory(
+                files = await _run_blocking(
+                    manager.list_directory,
                     remote_path=path,
                     recursive=recursive,
-                    max_depth=max_depth
+                    max_depth=max_depth,
+                    max_items=max_items
                 )
 
-            # Limit results
-            if len(files) > max_items:
-                files = files[:max_items]
-
             # Convert to response format
-            items = []
-            total_files = 0
-            total_directories = 0
-
-            for file_info in files:
-                # Handle both dict (LocalManager) and object (FTP/SFTP) formats
-                if isinstance(file_info, dict):
-                    name = file_info.get('name') or file_info.get('path', '').split('/')[-1]
-                    path = file_info.get('path', '')
-                    size = file_info.get('size', 0)
-                    modified = file_info.get('modified')
-                    is_file = file_info.get('is_file', False)
-                    permissions = file_info.get('permissions')
-                else:
-                    name = file_info.path.split('/')[-1] or file_info.path
-                    path = file_info.path
-                    size = file_info.size
-                    modified = file_info.modified
-                    is_file = file_info.is_file
-                    permissions = file_info.permissions
-
-                items.append(DirectoryItem(
-                    name=name,
-                    path=path,
-                    size=size,
-                    modified=modified,
-                    is_file=is_file,
-                    permissions=permissions
-                ))
-
-                if is_file:
-                    total_files += 1
-                else:
-                    total_directories += 1
-
-            return DirectoryListing(
-                path=path,
-                items=items,
-                total_items=len(items),
-                total_files=total_files,
-                total_directories=total_directories
-            )
+            items = [_directory_item(file_info) for file_info in files]
+            total_files, total_directories = _listing_totals(files, items)
+
+            return _listing_response(path, items, total_files, total_directories)
         finally:
-            # LocalManager uses close() instead of disconnect()
-            if hasattr(manager, 'disconnect'):
-                manager.disconnect()
-            elif hasattr(manager, 'close'):
-                manager.close()
+            # The shared LocalManager stays connected for later requests
+            if not shared:
+                await _run_blocking(manager.close)
 
     except HTTPException:
         raise
@@ -210,137 +592,88 @@ async def browse_directory_with_config(
 @router.get("/{endpoint_id}", response_model=DirectoryListing)
 async def browse_directory(
     endpoint_id: UUID,
+    request: Request,
     path: str = Query("/", description="Directory path to browse"),
     recursive: bool = Query(False, description="List recursively"),
     max_depth: int = Query(5, ge=1, le=10, description="Maximum recursion depth"),
     max_items: int = Query(1000, ge=1, le=10000, description="Maximum items to return"),
+    parallel: bool = Query(True, description="List subdirectories concurrently when recursive (FTP/SFTP)"),
+    refresh: bool = Query(False, description="Bypass the listing cache"),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Browse directory contents on an endpoint.
 
     Supports FTP, SFTP, and Local endpoints with configurable depth control.
+    Listings are cached for ``BROWSE_CACHE_TTL_SECONDS`` and carry an ETag,
+    so unchanged listings can be revalidated with ``If-None-Match``.
     """
-    from app.repositories.endpoint_repository import EndpointRepository
-
     # Get endpoint with decrypted password
     endpoint_repo = EndpointRepository(db)
-    endpoint_data = await endpoint_repo.get_with_decrypted_password(endpoint_id)
+    endpoint_data = await endpoint_repo.get_with_decrypted_password_cached(endpoint_id)
 
     if not endpoint_data:
         raise HTTPException(status_code=404, detail="Endpoint not found")
 
     endpoint_type = EndpointType(endpoint_data['endpoint_type'])
 
-    if endpoint_type not in [EndpointType.FTP, EndpointType.SFTP, EndpointType.LOCAL]:
+    if endpoint_type not in _MANAGER_CONFIGS:
         raise HTTPException(
             status_code=400,
             detail=f"Endpoint type {endpoint_type} does not support directory browsing"
         )
 
-    try:
-        # Create appropriate manager based on endpoint type
-        from app.core.local_manager import LocalManager, LocalConfig
-
-        if endpoint_type == EndpointType.FTP:
-            config = FTPConfig(
-                host=endpoint_data['host'],
-                port=endpoint_data.get('port') or 21,
-                username=endpoint_data['username'],
-                password=endpoint_data.get('password', '')
-            )
-            manager = FTPManager(config)
-        elif endpoint_type == EndpointType.SFTP:
-            config = SFTPConfig(
-                host=endpoint_data['host'],
-                port=endpoint_data.get('port') or 22,
-                username=endpoint_data['username'],
-                password=endpoint_data.get('password', '')
-            )
-            manager = SFTPManager(config)
-        elif endpoint_type == EndpointType.LOCAL:
-            # For LOCAL endpoints, use /mnt as base_path (the mount point)
-            local_config = LocalConfig(base_path="/mnt")
-            manager = LocalManager(config=local_config)
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported endpoint type: {endpoint_type}"
-            )
+    cache_key = (endpoint_id, path, recursive, max_depth, max_items)
+    if not refresh:
+        cached = listing_cache.get(cache_key)
+        if cached is not None:
+            return _cached_response(request, cached)
 
-        # Connect
-        if not manager.connect():
-            raise HTTPException(
-                status_code=503,
-                detail="Failed to connect to endpoint"
-            )
+    try:
+        # For LOCAL endpoints, use /mnt as base_path (the mount point)
+        config, factory = _manager_config(endpoint_data, local_base_path="/mnt")
 
-        # List directory - LocalManager uses 'path' parameter, FTP/SFTP use 'remote_path'
-        if endpoint_type == EndpointType.LOCAL:
-            files = manager.list_directory(
-                path=path,
-                recursive=recursive,
-                max_depth=max_depth
-            )
+        if recursive and parallel and endpoint_type != EndpointType.LOCAL:
+            files = await _walk_parallel(endpoint_id, config, factory, path, max_depth, max_items)
         else:
-            files = manager.list_directory(
-                remote_path=path,
-                recursive=recursive,
-                max_depth=max_depth
-            )
-
-        # Disconnect - LocalManager uses close() instead of disconnect()
-        if hasattr(manager, 'disconnect'):
-            manager.disconnect()
-        elif hasattr(manager, 'close'):
-            manager.close()
+            # Borrow a connected manager; pooled ones go back to the pool afterwards
+            async with _acquire_manager(endpoint_id, config, factory) as manager:
+                # List directory - LocalManager uses 'path' parameter, FTP/SFTP use 'remote_path'
+                if endpoint_type == EndpointType.LOCAL:
+                    files = await _run_blocking(
+                        manager.list_directory,
+                        path=path,
+                        recursive=recursive,
+                        max_depth=max_depth,
+                        max_items=max_items
+                    )
+                else:
+                    files = await _run_blocking(
+                        manager.list_directory,
+                        remote_path=path,
+                        recursive=recursive,
+                        max_depth=max_depth,
+                        max_items=max_items
+                    )
 
         # Convert to response format
-        items = []
-        total_files = 0
-        total_directories = 0
-
-        for file_info in files[:max_items]:  # Limit items
-            # Handle both FTPFileInfo/SFTPFileInfo and dict (LocalManager)
-            if isinstance(file_info, dict):
-                is_file = file_info.get('is_file', True)
-                is_directory = file_info.get('is_directory', False)
-                name = file_info.get('name', file_info['path'].split('/')[-1])
-                file_path = file_info['path']
-                size = file_info.get('size', 0)
-                modified = file_info.get('modified')
-                permissions = file_info.get('permissions')
-            else:
-                is_file = getattr(file_info, 'is_file', True)
-                is_directory = not is_file
-                name = file_info.path.split('/')[-1]
-                file_path = file_info.path
-                size = file_info.size
-                modified = file_info.modified
-                permissions = file_info.permissions
-
-            if is_file:
-                total_files += 1
-            else:
-                total_directories += 1
+        items = [_directory_item(file_info) for file_info in files]
+        total_files, total_directories = _listing_totals(files, items)
 
-            items.append(DirectoryItem(
-                name=name,
-                path=file_path,
-                size=size,
-                modified=modified,
-                is_file=is_file,
-                permissions=permissions
-            ))
-
-        return DirectoryListing(
-            path=path,
-            items=items,
-            total_items=len(items),
-            total_files=total_files,
-            total_directories=total_directories
-        )
+        response = _listing_response(path, items, total_files, total_directories)
+        if getattr(files, 'failed', False):
+            # Managers log listing errors and return what they have; caching
+            # that would show a transient error as an empty directory
+            return response
+        return _cached_response(request, listing_cache.set(cache_key, response.body))
 
+    except HTTPException:
+        raise
+    except ConnectionError:
+        raise HTTPException(
+            status_code=503,
+            detail="Failed to connect to endpoint"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -351,82 +684,57 @@ async def browse_directory(
 @router.get("/{endpoint_id}/metadata", response_model=FileMetadataResponse)
 async def get_file_metadata(
     endpoint_id: UUID,
+    request: Request,
     path: str = Query(..., description="File path to get metadata for"),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get file metadata from an endpoint.
 
-    Returns file size, modification time, and other metadata.
+    Returns file size, modification time, and other metadata. Results are
+    cached for ``BROWSE_METADATA_CACHE_TTL_SECONDS`` so polling clients do
+    not stat the file on every request.
     """
-    from app.repositories.endpoint_repository import EndpointRepository
-
     # Get endpoint with decrypted password
     endpoint_repo = EndpointRepository(db)
-    endpoint_data = await endpoint_repo.get_with_decrypted_password(endpoint_id)
+    endpoint_data = await endpoint_repo.get_with_decrypted_password_cached(endpoint_id)
 
     if not endpoint_data:
         raise HTTPException(status_code=404, detail="Endpoint not found")
 
-    endpoint_type = EndpointType(endpoint_data['endpoint_type'])
+    cache_key = (endpoint_id, path)
+    cached = metadata_cache.get(cache_key)
+    if cached is not None:
+        return _cached_response(request, cached)
 
     try:
-        # Create appropriate manager based on endpoint type
-        from app.core.local_manager import LocalManager
-
-        if endpoint_type == EndpointType.FTP:
-            config = FTPConfig(
-                host=endpoint_data['host'],
-                port=endpoint_data.get('port') or 21,
-                username=endpoint_data['username'],
-                password=endpoint_data.get('password', '')
-            )
-            manager = FTPManager(config)
-        elif endpoint_type == EndpointType.SFTP:
-            config = SFTPConfig(
-                host=endpoint_data['host'],
-                port=endpoint_data.get('port') or 22,
-                username=endpoint_data['username'],
-                password=endpoint_data.get('password', '')
-            )
-            manager = SFTPManager(config)
-        elif endpoint_type == EndpointType.LOCAL:
-            manager = LocalManager(local_path=endpoint_data.get('local_path') or "/")
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported endpoint type: {endpoint_type}"
-            )
-
-        # Connect
-        if not manager.connect():
-            raise HTTPException(
-                status_code=503,
-                detail="Failed to connect to endpoint"
-            )
-
-        # Get file info
-        file_info = manager.get_file_info(path)
+        config, factory = _manager_config(
+            endpoint_data, local_base_path=endpoint_data.get('local_path') or "/"
+        )
 
-        # Disconnect - LocalManager uses close() instead of disconnect()
-        if hasattr(manager, 'disconnect'):
-            manager.disconnect()
-        elif hasattr(manager, 'close'):
-            manager.close()
+        # Get file info with a pooled connection
+        async with _acquire_manager(endpoint_id, config, factory) as manager:
+            file_info = await _run_blocking(manager.get_file_info, path)
 
         if not file_info:
             raise HTTPException(status_code=404, detail="File not found")
 
-        return FileMetadataResponse(
-            path=path,
-            size=file_info.get('size', 0),
-            modified=file_info.get('modified'),
-            exists=file_info.get('exists', True),
-            permissions=file_info.get('permissions')
-        )
+        metadata = {
+            "path": path,
+            "size": file_info.get('size') or 0,
+            "modified": file_info.get('modified'),
+            "exists": file_info.get('exists', True),
+            "permissions": file_info.get('permissions'),
+        }
+        return _cached_response(request, metadata_cache.set(cache_key, _dumps(metadata)))
 
     except HTTPException:
         raise
+    except ConnectionError:
+        raise HTTPException(
+            status_code=503,
+            detail="Failed to connect to endpoint"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -434,71 +742,114 @@ async def get_file_metadata(
         )
 
 
+@router.get("/{endpoint_id}/stream")
+async def stream_directory(
+    endpoint_id: UUID,
+    path: str = Query("/", description="Directory path to browse"),
+    recursive: bool = Query(False, description="List recursively"),
+    max_depth: int = Query(5, ge=1, le=10, description="Maximum recursion depth"),
+    max_items: int = Query(10000, ge=1, le=100000, description="Maximum items to return"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Stream directory contents as NDJSON.
+
+    Sends one DirectoryItem per line as each directory is listed, followed
+    by a ``{"__summary__": {...}}`` line with the totals (and ``error`` if
+    the listing stopped early). Suited to large recursive listings that
+    would otherwise be buffered in full before the first byte is sent.
+    """
+    endpoint_repo = EndpointRepository(db)
+    endpoint_data = await endpoint_repo.get_with_decrypted_password_cached(endpoint_id)
+
+    if not endpoint_data:
+        raise HTTPException(status_code=404, detail="Endpoint not found")
+
+    endpoint_type = EndpointType(endpoint_data['endpoint_type'])
+
+    if endpoint_type not in _MANAGER_CONFIGS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Endpoint type {endpoint_type} does not support directory browsing"
+        )
+
+    # For LOCAL endpoints, use /mnt as base_path (the mount point)
+    config, factory = _manager_config(endpoint_data, local_base_path="/mnt")
+
+    return StreamingResponse(
+        _iter_listing(
+            endpoint_id,
+            config,
+            factory,
+            endpoint_type == EndpointType.LOCAL,
+            path,
+            recursive,
+            max_depth,
+            max_items
+        ),
+        media_type="application/x-ndjson"
+    )
+
+
 @router.post("/compare-metadata", response_model=MetadataComparisonResponse)
-async def compare_file_metadata(request: MetadataComparisonRequest):
+async def compare_file_metadata(
+    request: MetadataComparisonRequest,
+    db: AsyncSession = Depends(get_db)
+):
     """
     Compare file metadata between two endpoints.
     
     Determines what sync operation should be performed based on file sizes,
-    modification times, and sync direction preferences.
+    modification times, and sync direction preferences. Metadata is fetched
+    from both endpoints concurrently.
     """
-    try:
-        # TODO: Get endpoints from database
-        # TODO: Get file metadata from both endpoints
-        # TODO: Use MetadataEngine to compare
-        
-        # For now, return mock comparison
-        metadata_engine = MetadataEngine()
-        
-        # Mock metadata for demonstration
-        source_metadata = FileMetadata(
-            path=request.source_path,
-            size=1024,
-            modified=datetime.now(),
-            exists=True
+    # Endpoint lookups share the request's DB session, so they run one after
+    # the other (normally both are served from the decrypted-endpoint cache)
+    endpoint_repo = EndpointRepository(db)
+    sides = []
+    for endpoint_id, file_path in (
+        (request.source_endpoint_id, request.source_path),
+        (request.destination_endpoint_id, request.destination_path),
+    ):
+        endpoint_data = await endpoint_repo.get_with_decrypted_password_cached(endpoint_id)
+        if not endpoint_data:
+            raise HTTPException(status_code=404, detail=f"Endpoint {endpoint_id} not found")
+        sides.append((endpoint_id, endpoint_data, file_path))
+
+    async def fetch_metadata(endpoint_id: UUID, endpoint_data: Dict[str, Any], file_path: str) -> Optional[FileMetadata]:
+        config, factory = _manager_config(
+            endpoint_data, local_base_path=endpoint_data.get('local_path') or "/"
         )
-        
-        destination_metadata = FileMetadata(
-            path=request.destination_path,
-            size=1024,
-            modified=datetime.now(),
-            exists=True
+        async with _acquire_manager(endpoint_id, config, factory) as manager:
+            return _file_metadata(file_path, await _run_blocking(manager.get_file_info, file_path))
+
+    try:
+        source_metadata, destination_metadata = await asyncio.gather(
+            *(fetch_metadata(*side) for side in sides)
         )
-        
-        # Convert string to enum
-        sync_direction_enum = {
-            "ftp_to_local": SyncDirection.FTP_TO_LOCAL,
-            "local_to_ftp": SyncDirection.LOCAL_TO_FTP,
-            "bidirectional": SyncDirection.BIDIRECTIONAL
-        }[request.sync_direction]
-        
-        # Perform comparison
-        result = metadata_engine.compare_files(
+
+        result = MetadataEngine().compare_files(
             source_metadata=source_metadata,
             destination_metadata=destination_metadata,
-            sync_direction=sync_direction_enum,
+            sync_direction=request.sync_direction,
             source_is_main=request.source_is_main,
             force_overwrite=request.force_overwrite
         )
-        
-        # Convert to response format
-        def metadata_to_response(metadata: Optional[FileMetadata]) -> Optional[FileMetadataResponse]:
-            if not metadata:
-                return None
-            return FileMetadataResponse(
-                path=metadata.path,
-                size=metadata.size,
-                modified=metadata.modified,
-                exists=metadata.exists
-            )
-        
+
         return MetadataComparisonResponse(
             operation=result.operation.value,
             reason=result.reason,
-            source_metadata=metadata_to_response(result.source_metadata),
-            destination_metadata=metadata_to_response(result.destination_metadata)
+            source_metadata=_metadata_response(result.source_metadata),
+            destination_metadata=_metadata_response(result.destination_metadata)
+        )
+
+    except HTTPException:
+        raise
+    except ConnectionError:
+        raise HTTPException(
+            status_code=503,
+            detail="Failed to connect to endpoint"
         )
-        
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -575,20 +926,34 @@ async def batch_compare_metadata(
     source_endpoint_id: UUID,
     destination_endpoint_id: UUID,
     file_paths: List[str],
-    sync_direction: str = Query(..., pattern="^(ftp_to_local|local_to_ftp|bidirectional)$"),
+    sync_direction: SyncDirection = Query(...),
     source_is_main: bool = Query(True),
-    force_overwrite: bool = Query(False)
+    force_overwrite: bool = Query(False),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Compare metadata for multiple files in batch.
     
     Efficient way to compare many files at once for sync planning.
-    Returns list of comparison results for each file.
+    Each path is looked up on both endpoints; metadata is fetched with one
+    listing per parent directory, several directories at a time.
+    Streams NDJSON: one BatchComparisonItem per line as each directory
+    completes, then a ``{"__summary__": {...}}`` line with counts per operation.
     """
-    # TODO: Implement batch metadata comparison
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Batch metadata comparison not implemented yet"
+    endpoint_repo = EndpointRepository(db)
+    sides = []
+    for endpoint_id in (source_endpoint_id, destination_endpoint_id):
+        endpoint_data = await endpoint_repo.get_with_decrypted_password_cached(endpoint_id)
+        if not endpoint_data:
+            raise HTTPException(status_code=404, detail=f"Endpoint {endpoint_id} not found")
+        config, factory = _manager_config(
+            endpoint_data, local_base_path=endpoint_data.get('local_path') or "/"
+        )
+        sides.append((endpoint_id, config, factory))
+
+    return StreamingResponse(
+        _iter_batch_compare(sides, file_paths, sync_direction, source_is_main, force_overwrite),
+        media_type="application/x-ndjson"
     )
 
 
@@ -604,34 +969,19 @@ async def get_endpoint_manager(endpoint: Endpoint):
     Returns:
         Manager instance (FTPManager, SFTPManager, or LocalManager)
     """
-    if endpoint.endpoint_type == EndpointType.FTP:
-        config = FTPConfig(
-            host=endpoint.host,
-            username=endpoint.username,
-            password=endpoint.password_encrypted,  # TODO: Decrypt
-            port=endpoint.port or 21
-        )
-        return FTPManager(config)
-    
-    elif endpoint.endpoint_type == EndpointType.SFTP:
-        config = SFTPConfig(
-            host=endpoint.host,
-            username=endpoint.username,
-            password=endpoint.password_encrypted,  # TODO: Decrypt
-            port=endpoint.port or 22
-        )
-        return SFTPManager(config)
-    
-    elif endpoint.endpoint_type == EndpointType.LOCAL:
-        # TODO: Implement LocalManager
-        raise NotImplementedError("LocalManager not implemented yet")
-    
-    elif endpoint.endpoint_type == EndpointType.S3:
+    build = _MANAGER_CONFIGS.get(endpoint.endpoint_type)
+    if build is None:
         # S3 browsing would use existing S3Manager
-        raise NotImplementedError("S3 browsing not implemented in this endpoint")
-    
-    else:
-        raise ValueError(f"Unsupported endpoint type: {endpoint.endpoint_type}")
+        raise NotImplementedError(f"{endpoint.endpoint_type} browsing not implemented in this endpoint")
+
+    endpoint_data = {
+        'host': endpoint.host,
+        'port': endpoint.port,
+        'username': endpoint.username,
+        'password': endpoint.password_encrypted,  # TODO: Decrypt
+    }
+    config, factory = build(endpoint_data, endpoint.local_path or "/")
+    return factory(config)
 
 
 async def get_file_metadata_from_endpoint(endpoint: Endpoint, file_path: str) -> Optional[FileMetadata]:
@@ -659,5 +1009,4 @@ async def get_file_metadata_from_endpoint(endpoint: Endpoint, file_path: str) ->
                 )
         return None
     finally:
-        if hasattr(manager, 'close'):
-            manager.close()
+        manager.close()
@@ -1,22 +1,40 @@
 """
 Endpoints API - Manage FTP/SFTP/S3/Local endpoints.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
+from functools import partial
+import asyncio
 import logging
+import os
 
 from app.database.models import EndpointType
-from app.repositories.endpoint_repository import EndpointRepository
-from app.core.security import encrypt_password
-from app.database.session import get_db
-from sqlalchemy.ext.asyncio import AsyncSession
-
-router = APIRouter()
+from app.repositories.endpoint_repository import EndpointRepository, invalidate_decrypted_cache
+from app.core.listing_cache import listing_cache, metadata_cache
+from app.core.ftp_manager import FTPManager, FTPConfig
+from app.core.sftp_manager import SFTPManager, SFTPConfig
+from app.core.s3_manager import S3Manager, S3Config
+from app.core.local_manager import LocalManager, LocalConfig, resolve_local_path
+from app.services.ftp_service import ftp_service
+from app.core.security import encrypt_password, secret_digest
+from app.api.deps import get_endpoint_repo
+from app.database.session import async_session_maker
+from app.api.responses import orm_list_response, orm_response
+from app.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, set_next_cursor
+
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
+# Plaintext secrets never go to the repository; they are stored encrypted
+SECRET_FIELDS = {'password', 's3_secret_key'}
+
+# In-flight /connect probes by (endpoint_id, strict)
+_inflight_connects: Dict[Tuple[UUID, bool], asyncio.Future] = {}
+
 
 class EndpointBase(BaseModel):
     """Base endpoint schema."""
@@ -65,6 +83,8 @@ class EndpointUpdate(BaseModel):
 
 class EndpointResponse(BaseModel):
     """Endpoint response schema."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     name: str
     endpoint_type: EndpointType
@@ -87,9 +107,6 @@ class EndpointResponse(BaseModel):
     updated_at: datetime
     last_health_check: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-
 
 class ConnectionTestResponse(BaseModel):
     """Connection test response schema."""
@@ -102,20 +119,23 @@ class ConnectionTestResponse(BaseModel):
 async def list_endpoints(
     endpoint_type: Optional[EndpointType] = Query(None, description="Filter by endpoint type"),
     active_only: bool = Query(True, description="Only return active endpoints"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    skip: int = Query(0, ge=0, description="Number of records to skip", deprecated=True),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of records"),
-    db: AsyncSession = Depends(get_db)
+    after: Optional[str] = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    repo: EndpointRepository = Depends(get_endpoint_repo)
 ):
     """List all endpoints with optional filtering."""
+    cursor = decode_cursor(after)
     try:
-        repo = EndpointRepository(db)
         endpoints = await repo.get_all(
             endpoint_type=endpoint_type,
             active_only=active_only,
             skip=skip,
-            limit=limit
+            limit=limit,
+            after=cursor
         )
-        return endpoints
+        response = orm_list_response(EndpointResponse, endpoints)
+        return set_next_cursor(response, endpoints, limit, 'created_at')
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -124,50 +144,43 @@ async def list_endpoints(
 
 
 @router.post("/", response_model=EndpointResponse, status_code=status.HTTP_201_CREATED)
-async def create_endpoint(endpoint: EndpointCreate, db: AsyncSession = Depends(get_db)):
+async def create_endpoint(endpoint: EndpointCreate, repo: EndpointRepository = Depends(get_endpoint_repo)):
     """Create new endpoint."""
     try:
-        repo = EndpointRepository(db)
+        # Prepare endpoint data; secrets are added back encrypted below
+        endpoint_data = endpoint.model_dump(
+            exclude_unset=True,
+            mode='python',
+            exclude=SECRET_FIELDS
+        )
 
-        # Check if endpoint name already exists
-        existing = await repo.get_by_name(endpoint.name)
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Endpoint with name '{endpoint.name}' already exists"
-            )
+        # Store the enum value (ftp), not its name (FTP); the field is
+        # required, so it is always a validated EndpointType here
+        endpoint_data['endpoint_type'] = endpoint.endpoint_type.value
 
-        # Prepare endpoint data
-        endpoint_data = endpoint.dict(exclude_unset=True)
-
-        # Convert endpoint_type to lowercase string value for database
-        # Pydantic may serialize enum as string name (FTP) instead of value (ftp)
-        if 'endpoint_type' in endpoint_data:
-            endpoint_type = endpoint_data['endpoint_type']
-            logger.info(f"Original endpoint_type: {endpoint_type}, type: {type(endpoint_type)}")
-            if isinstance(endpoint_type, EndpointType):
-                # If it's an enum, get its value
-                endpoint_data['endpoint_type'] = endpoint_type.value
-                logger.info(f"Converted enum to value: {endpoint_data['endpoint_type']}")
-            elif isinstance(endpoint_type, str):
-                # If it's already a string, convert to lowercase
-                endpoint_data['endpoint_type'] = endpoint_type.lower()
-                logger.info(f"Converted string to lowercase: {endpoint_data['endpoint_type']}")
-            logger.info(f"Final endpoint_type: {endpoint_data['endpoint_type']}")
+        if endpoint.local_path:
+            endpoint_data['resolved_local_path'] = resolve_local_path(endpoint.local_path)
 
         # Encrypt passwords if provided
-        if endpoint_data.get('password'):
-            endpoint_data['password_encrypted'] = encrypt_password(endpoint_data.pop('password'))
+        if endpoint.password:
+            endpoint_data['password_encrypted'] = encrypt_password(endpoint.password)
+            endpoint_data['password_digest'] = secret_digest(endpoint.password)
 
-        if endpoint_data.get('s3_secret_key'):
-            endpoint_data['s3_secret_key_encrypted'] = encrypt_password(endpoint_data.pop('s3_secret_key'))
+        if endpoint.s3_secret_key:
+            endpoint_data['s3_secret_key_encrypted'] = encrypt_password(endpoint.s3_secret_key)
+            endpoint_data['s3_secret_key_digest'] = secret_digest(endpoint.s3_secret_key)
 
         # Set default values
         endpoint_data['is_active'] = True
         endpoint_data['connection_status'] = 'not_tested'
 
-        # Create endpoint
-        new_endpoint = await repo.create(endpoint_data)
+        # Create endpoint; None means the name is already taken
+        new_endpoint = await repo.create_if_absent(endpoint_data)
+        if new_endpoint is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Endpoint with name '{endpoint.name}' already exists"
+            )
         return new_endpoint
 
     except HTTPException:
@@ -181,10 +194,9 @@ async def create_endpoint(endpoint: EndpointCreate, db: AsyncSession = Depends(g
 
 
 @router.get("/{endpoint_id}", response_model=EndpointResponse)
-async def get_endpoint(endpoint_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_endpoint(endpoint_id: UUID, repo: EndpointRepository = Depends(get_endpoint_repo)):
     """Get endpoint by ID."""
     try:
-        repo = EndpointRepository(db)
         endpoint = await repo.get_by_id(endpoint_id)
 
         if not endpoint:
@@ -193,7 +205,7 @@ async def get_endpoint(endpoint_id: UUID, db: AsyncSession = Depends(get_db)):
                 detail="Endpoint not found"
             )
 
-        return endpoint
+        return orm_response(EndpointResponse, endpoint)
 
     except HTTPException:
         raise
@@ -208,32 +220,38 @@ async def get_endpoint(endpoint_id: UUID, db: AsyncSession = Depends(get_db)):
 async def update_endpoint(
     endpoint_id: UUID,
     endpoint_update: EndpointUpdate,
-    db: AsyncSession = Depends(get_db)
+    repo: EndpointRepository = Depends(get_endpoint_repo)
 ):
     """Update endpoint."""
     try:
-        repo = EndpointRepository(db)
+        # Prepare update data; secrets are added back encrypted below
+        update_data = endpoint_update.model_dump(
+            exclude_unset=True,
+            mode='python',
+            exclude=SECRET_FIELDS
+        )
+
+        if 'local_path' in update_data:
+            local_path = update_data['local_path']
+            update_data['resolved_local_path'] = resolve_local_path(local_path) if local_path else None
 
-        # Check if endpoint exists
-        existing = await repo.get_by_id(endpoint_id)
-        if not existing:
+        # Passwords provided are encrypted by the repository, which skips
+        # ones whose digest shows they are unchanged (form resubmits)
+        secrets = {
+            field: getattr(endpoint_update, field)
+            for field in SECRET_FIELDS
+            if getattr(endpoint_update, field)
+        }
+
+        # Update endpoint; None means it does not exist
+        updated_endpoint = await repo.update(endpoint_id, update_data, secrets=secrets)
+        if not updated_endpoint:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Endpoint not found"
             )
-
-        # Prepare update data
-        update_data = endpoint_update.dict(exclude_unset=True)
-
-        # Encrypt passwords if provided
-        if 'password' in update_data and update_data['password']:
-            update_data['password_encrypted'] = encrypt_password(update_data.pop('password'))
-
-        if 's3_secret_key' in update_data and update_data['s3_secret_key']:
-            update_data['s3_secret_key_encrypted'] = encrypt_password(update_data.pop('s3_secret_key'))
-
-        # Update endpoint
-        updated_endpoint = await repo.update(endpoint_id, update_data)
+        listing_cache.invalidate(endpoint_id)
+        metadata_cache.invalidate(endpoint_id)
         return updated_endpoint
 
     except HTTPException:
@@ -246,17 +264,17 @@ async def update_endpoint(
 
 
 @router.delete("/{endpoint_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_endpoint(endpoint_id: UUID, db: AsyncSession = Depends(get_db)):
+async def delete_endpoint(endpoint_id: UUID, repo: EndpointRepository = Depends(get_endpoint_repo)):
     """Delete endpoint."""
     try:
-        repo = EndpointRepository(db)
-
         success = await repo.delete(endpoint_id)
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Endpoint not found"
             )
+        listing_cache.invalidate(endpoint_id)
+        metadata_cache.invalidate(endpoint_id)
 
     except HTTPException:
         raise
@@ -268,46 +286,22 @@ async def delete_endpoint(endpoint_id: UUID, db: AsyncSession = Depends(get_db))
 
 
 @router.post("/test-config", response_model=ConnectionTestResponse)
-async def test_endpoint_config(config: EndpointCreate):
+async def test_endpoint_config(config: EndpointCreate, background: BackgroundTasks):
     """Test endpoint connection without saving it."""
     try:
-        from app.services.endpoint_service import EndpointService
-        from app.core.ftp_manager import FTPManager
-        from app.core.sftp_manager import SFTPManager
-        from app.core.local_manager import LocalManager
-
         # Create appropriate manager based on endpoint type
-        if config.endpoint_type == EndpointType.FTP:
-            from app.core.ftp_manager import FTPConfig
-            ftp_config = FTPConfig(
-                host=config.host,
-                port=config.port or 21,
-                username=config.username,
-                password=config.password
-            )
-            manager = FTPManager(config=ftp_config)
-        elif config.endpoint_type == EndpointType.SFTP:
-            from app.core.sftp_manager import SFTPConfig
-            sftp_config = SFTPConfig(
-                host=config.host,
-                port=config.port or 22,
-                username=config.username,
-                password=config.password
-            )
-            manager = SFTPManager(config=sftp_config)
-        elif config.endpoint_type == EndpointType.LOCAL:
-            from app.core.local_manager import LocalConfig
-            local_config = LocalConfig(base_path=config.local_path or "/")
-            manager = LocalManager(config=local_config)
-        else:
+        factory = _TEST_MANAGER_FACTORIES.get(config.endpoint_type)
+        if factory is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Unsupported endpoint type: {config.endpoint_type}"
             )
+        manager = factory(config)
 
         # Test connection
-        if manager.connect():
-            manager.disconnect()
+        if await asyncio.to_thread(manager.connect):
+            # Disconnect after the response has been sent
+            background.add_task(_close_quietly, manager.close)
             return ConnectionTestResponse(
                 success=True,
                 message="Connection successful!"
@@ -325,43 +319,33 @@ async def test_endpoint_config(config: EndpointCreate):
 
 
 @router.post("/{endpoint_id}/connect", response_model=ConnectionTestResponse)
-async def connect_endpoint(endpoint_id: UUID, db: AsyncSession = Depends(get_db)):
+async def connect_endpoint(
+    endpoint_id: UUID,
+    strict: bool = Query(False, description="Verify local paths by writing a test file"),
+    repo: EndpointRepository = Depends(get_endpoint_repo)
+):
     """Connect to endpoint and update status."""
     try:
-        repo = EndpointRepository(db)
-
-        # Get endpoint with decrypted credentials
-        endpoint_data = await repo.get_with_decrypted_password(endpoint_id)
+        # Connect usually follows a credentials edit that another worker may
+        # have handled, so reload them and refresh this worker's cached copy
+        invalidate_decrypted_cache(endpoint_id)
+        endpoint_data = await repo.get_with_decrypted_password_cached(endpoint_id)
         if not endpoint_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Endpoint not found"
             )
 
-        # Test connection based on endpoint type
-        if endpoint_data['endpoint_type'] == EndpointType.FTP:
-            result = await test_ftp_connection(endpoint_data)
-        elif endpoint_data['endpoint_type'] == EndpointType.SFTP:
-            result = await test_sftp_connection(endpoint_data)
-        elif endpoint_data['endpoint_type'] == EndpointType.S3:
-            result = await test_s3_connection(endpoint_data)
-        elif endpoint_data['endpoint_type'] == EndpointType.LOCAL:
-            result = await test_local_connection(endpoint_data)
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Unsupported endpoint type: {endpoint_data['endpoint_type']}"
-            )
-
-        # Update connection status in database
-        status_value = "connected" if result['success'] else "error"
-        await repo.update_connection_status(
-            endpoint_id,
-            status_value,
-            result['message']
-        )
-
-        return result
+        # Concurrent connects to the same endpoint share one probe and one
+        # status write; every caller, leader included, is shielded so a
+        # disconnecting client does not cancel it for the others
+        key = (endpoint_id, strict)
+        inflight = _inflight_connects.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(_probe_and_record(endpoint_id, endpoint_data, strict))
+            _inflight_connects[key] = inflight
+            inflight.add_done_callback(lambda _: _inflight_connects.pop(key, None))
+        return await asyncio.shield(inflight)
 
     except HTTPException:
         raise
@@ -372,27 +356,45 @@ async def connect_endpoint(endpoint_id: UUID, db: AsyncSession = Depends(get_db)
         )
 
 
+async def _probe_and_record(
+    endpoint_id: UUID,
+    endpoint_data: dict,
+    strict: bool
+) -> dict:
+    """Test an endpoint's connection and store the outcome as its status."""
+    # Test connection based on endpoint type
+    result = await _connection_tester(endpoint_data['endpoint_type'], strict)(endpoint_data)
+
+    # The probe outlives any one caller's request, so the status write uses
+    # its own session rather than the leader's request-scoped one
+    status_value = "connected" if result['success'] else "error"
+    async with async_session_maker() as db:
+        await EndpointRepository(db).update_connection_status(
+            endpoint_id,
+            status_value,
+            result['message']
+        )
+        await db.commit()
+
+    return result
+
+
 @router.post("/{endpoint_id}/disconnect", response_model=ConnectionTestResponse)
-async def disconnect_endpoint(endpoint_id: UUID, db: AsyncSession = Depends(get_db)):
+async def disconnect_endpoint(endpoint_id: UUID, repo: EndpointRepository = Depends(get_endpoint_repo)):
     """Disconnect endpoint and update status."""
     try:
-        repo = EndpointRepository(db)
-
-        # Get endpoint
-        endpoint = await repo.get_by_id(endpoint_id)
+        # Update connection status to disconnected; None means it does not exist
+        endpoint = await repo.update_connection_status(
+            endpoint_id,
+            "disconnected",
+            "Manually disconnected"
+        )
         if not endpoint:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Endpoint not found"
             )
 
-        # Update connection status to disconnected
-        await repo.update_connection_status(
-            endpoint_id,
-            "disconnected",
-            "Manually disconnected"
-        )
-
         return {
             "success": True,
             "message": "Disconnected successfully"
@@ -408,41 +410,37 @@ async def disconnect_endpoint(endpoint_id: UUID, db: AsyncSession = Depends(get_
 
 
 @router.post("/{endpoint_id}/restart", response_model=ConnectionTestResponse)
-async def restart_endpoint(endpoint_id: UUID, db: AsyncSession = Depends(get_db)):
+async def restart_endpoint(
+    endpoint_id: UUID,
+    strict: bool = Query(False, description="Verify local paths by writing a test file"),
+    repo: EndpointRepository = Depends(get_endpoint_repo)
+):
     """Restart endpoint connection (disconnect then connect)."""
     try:
-        repo = EndpointRepository(db)
-
-        # Get endpoint with decrypted credentials
-        endpoint_data = await repo.get_with_decrypted_password(endpoint_id)
+        # Restart is how users pick up credentials changed through another
+        # worker, so reload them and refresh this worker's cached copy
+        invalidate_decrypted_cache(endpoint_id)
+        endpoint_data = await repo.get_with_decrypted_password_cached(endpoint_id)
         if not endpoint_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Endpoint not found"
             )
 
-        # First disconnect
-        await repo.update_connection_status(
-            endpoint_id,
-            "restarting",
-            "Restarting connection..."
+        # Reconnect
+        probe = _connection_tester(endpoint_data['endpoint_type'], strict)(endpoint_data)
+
+        # Mark as restarting while the probe runs; the probe does not use the
+        # session, so the two never share it concurrently
+        _, result = await asyncio.gather(
+            repo.update_connection_status(
+                endpoint_id,
+                "restarting",
+                "Restarting connection..."
+            ),
+            probe
         )
 
-        # Then reconnect
-        if endpoint_data['endpoint_type'] == EndpointType.FTP:
-            result = await test_ftp_connection(endpoint_data)
-        elif endpoint_data['endpoint_type'] == EndpointType.SFTP:
-            result = await test_sftp_connection(endpoint_data)
-        elif endpoint_data['endpoint_type'] == EndpointType.S3:
-            result = await test_s3_connection(endpoint_data)
-        elif endpoint_data['endpoint_type'] == EndpointType.LOCAL:
-            result = await test_local_connection(endpoint_data)
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Unsupported endpoint type: {endpoint_data['endpoint_type']}"
-            )
-
         # Update connection status
         status_value = "connected" if result['success'] else "error"
         await repo.update_connection_status(
@@ -464,10 +462,21 @@ async def restart_endpoint(endpoint_id: UUID, db: AsyncSession = Depends(get_db)
 
 # Helper functions for connection testing
 
+def _close_quietly(close: Callable[[], Any]) -> None:
+    """Run a manager's blocking teardown, logging instead of raising errors."""
+    try:
+        close()
+    except Exception as e:
+        logger.warning(f"Error closing test connection: {e}")
+
+
+def _close_in_background(close: Callable[[], Any]) -> None:
+    """Tear a test connection down off-loop without waiting for it."""
+    asyncio.get_running_loop().run_in_executor(None, _close_quietly, close)
+
+
 async def test_ftp_connection(endpoint_data: dict) -> dict:
     """Test FTP connection."""
-    from app.services.ftp_service import ftp_service
-
     try:
         result = await ftp_service.test_connection(
             host=endpoint_data['host'],
@@ -493,8 +502,6 @@ async def test_ftp_connection(endpoint_data: dict) -> dict:
 
 async def test_sftp_connection(endpoint_data: dict) -> dict:
     """Test SFTP connection."""
-    from app.core.sftp_manager import SFTPManager, SFTPConfig
-
     try:
         config = SFTPConfig(
             host=endpoint_data['host'],
@@ -505,9 +512,10 @@ async def test_sftp_connection(endpoint_data: dict) -> dict:
 
         manager = SFTPManager(config)
 
-        if manager.connect():
-            health_result = manager.health_check()
-            manager.close()
+        if await asyncio.to_thread(manager.connect):
+            health_result = await asyncio.to_thread(manager.health_check)
+            # The SSH disconnect exchange is not part of the result
+            _close_in_background(manager.close)
 
             return {
                 "success": health_result['success'],
@@ -535,8 +543,6 @@ async def test_sftp_connection(endpoint_data: dict) -> dict:
 
 async def test_s3_connection(endpoint_data: dict) -> dict:
     """Test S3 connection."""
-    from app.core.s3_manager import S3Manager, S3Config
-
     try:
         config = S3Config(
             bucket=endpoint_data['s3_bucket'],
@@ -546,7 +552,7 @@ async def test_s3_connection(endpoint_data: dict) -> dict:
         )
 
         manager = S3Manager(config)
-        result = manager.test_connection()
+        result = await asyncio.to_thread(manager.test_connection)
 
         return {
             "success": result['success'],
@@ -566,10 +572,68 @@ async def test_s3_connection(endpoint_data: dict) -> dict:
         }
 
 
-async def test_local_connection(endpoint_data: dict) -> dict:
-    """Test local path connection."""
-    import os
+def _do_local_probe(full_path: str, strict: bool = False) -> dict:
+    """
+    Check that a local path is a directory we can write to (blocking).
+
+    By default this asks the kernel (``os.access`` and ``os.statvfs``)
+    instead of creating and removing a file, which is slow on network
+    mounts. ``strict`` writes a test file for ACL or root-squashed mounts
+    where ``os.access`` can be wrong.
+    """
+    if not os.path.isdir(full_path):
+        return {
+            "success": False,
+            "message": f"Local path does not exist or is not a directory: {full_path}",
+            "details": {"endpoint_type": "LOCAL", "path": full_path}
+        }
+
+    # Test read/write permissions
+    if strict:
+        test_file = os.path.join(full_path, '.f2l_test')
+        try:
+            with open(test_file, 'w') as f:
+                f.write('test')
+            os.remove(test_file)
+        except Exception as perm_error:
+            return {
+                "success": False,
+                "message": f"Local path exists but no write permissions: {str(perm_error)}",
+                "details": {"endpoint_type": "LOCAL", "path": full_path}
+            }
+    elif not os.access(full_path, os.R_OK | os.W_OK | os.X_OK):
+        return {
+            "success": False,
+            "message": "Local path exists but no write permissions",
+            "details": {"endpoint_type": "LOCAL", "path": full_path}
+        }
+
+    details = {
+        "endpoint_type": "LOCAL",
+        "path": full_path
+    }
+    try:
+        fs = os.statvfs(full_path)
+        details["free_bytes"] = fs.f_bavail * fs.f_frsize
+    except OSError:
+        pass
+    else:
+        if fs.f_flag & os.ST_RDONLY:
+            return {
+                "success": False,
+                "message": "Local path is on a read-only file system",
+                "details": details
+            }
+
+    return {
+        "success": True,
+        "message": "Local path accessible with read/write permissions",
+        "details": details
+    }
+
 
+async def test_local_connection(endpoint_data: dict, strict: bool = False) -> dict:
+    """Test local path connection; ``strict`` verifies writes with a test file."""
     try:
         local_path = endpoint_data.get('local_path')
         if not local_path:
@@ -579,40 +643,10 @@ async def test_local_connection(endpoint_data: dict) -> dict:
                 "details": {"endpoint_type": "LOCAL"}
             }
 
-        # If path is relative, join with /mnt (the base mount point)
-        if not local_path.startswith('/'):
-            full_path = os.path.join('/mnt', local_path)
-        else:
-            full_path = local_path
-
-        if os.path.exists(full_path) and os.path.isdir(full_path):
-            # Test read/write permissions
-            test_file = os.path.join(full_path, '.f2l_test')
-            try:
-                with open(test_file, 'w') as f:
-                    f.write('test')
-                os.remove(test_file)
-
-                return {
-                    "success": True,
-                    "message": "Local path accessible with read/write permissions",
-                    "details": {
-                        "endpoint_type": "LOCAL",
-                        "path": full_path
-                    }
-                }
-            except Exception as perm_error:
-                return {
-                    "success": False,
-                    "message": f"Local path exists but no write permissions: {str(perm_error)}",
-                    "details": {"endpoint_type": "LOCAL", "path": full_path}
-                }
-        else:
-            return {
-                "success": False,
-                "message": f"Local path does not exist or is not a directory: {full_path}",
-                "details": {"endpoint_type": "LOCAL", "path": full_path}
-            }
+        # Resolved when the endpoint was saved; unsaved configs resolve here
+        full_path = endpoint_data.get('resolved_local_path') or resolve_local_path(local_path)
+
+        return await asyncio.to_thread(_do_local_probe, full_path, strict)
 
     except Exception as e:
         return {
@@ -620,3 +654,53 @@ async def test_local_connection(endpoint_data: dict) -> dict:
             "message": f"Local path error: {str(e)}",
             "details": {"endpoint_type": "LOCAL"}
         }
+
+
+_CONNECTION_TESTERS: Dict[EndpointType, Callable[[dict], Awaitable[dict]]] = {
+    EndpointType.FTP: test_ftp_connection,
+    EndpointType.SFTP: test_sftp_connection,
+    EndpointType.S3: test_s3_connection,
+    EndpointType.LOCAL: test_local_connection,
+}
+
+
+# Same tests, but local paths are verified by writing a test file
+_STRICT_CONNECTION_TESTERS: Dict[EndpointType, Callable[[dict], Awaitable[dict]]] = {
+    **_CONNECTION_TESTERS,
+    EndpointType.LOCAL: partial(test_local_connection, strict=True),
+}
+
+
+def _connection_tester(endpoint_type: EndpointType, strict: bool = False) -> Callable[[dict], Awaitable[dict]]:
+    """Get the connection test for an endpoint type, or raise 400 if unsupported."""
+    testers = _STRICT_CONNECTION_TESTERS if strict else _CONNECTION_TESTERS
+    tester = testers.get(endpoint_type)
+    if tester is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported endpoint type: {endpoint_type}"
+        )
+    return tester
+
+
+def _remote_test_manager(config_cls: type, manager_cls: type, default_port: int, config: EndpointCreate) -> Any:
+    """Create an FTP/SFTP manager for an unsaved endpoint config."""
+    return manager_cls(config=config_cls(
+        host=config.host,
+        port=config.port or default_port,
+        username=config.username,
+        password=config.password
+    ))
+
+
+def _local_test_manager(config: EndpointCreate) -> LocalManager:
+    """Create a local manager for an unsaved endpoint config."""
+    return LocalManager(config=LocalConfig(base_path=config.local_path or "/"))
+
+
+# Managers that test_endpoint_config can connect with, by endpoint type
+_TEST_MANAGER_FACTORIES: Dict[EndpointType, Callable[[EndpointCreate], Any]] = {
+    EndpointType.FTP: partial(_remote_test_manager, FTPConfig, FTPManager, 21),
+    EndpointType.SFTP: partial(_remote_test_manager, SFTPConfig, SFTPManager, 22),
+    EndpointType.LOCAL: _local_test_manager,
+}
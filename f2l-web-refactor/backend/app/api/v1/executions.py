@@ -1,22 +1,29 @@
 """
 Executions API - Monitor sync executions.
 """
-from fastapi import APIRouter, HTTPException, Query, Depends, status
-from typing import List, Optional
+from fastapi import APIRouter, Header, HTTPException, Query, Depends, status
+from fastapi.responses import ORJSONResponse
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
 
-from app.database.session import get_db
+from app.api.deps import get_execution_repo
+from app.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, set_next_cursor
+from app.api.responses import NDJSON_MEDIA_TYPE, orm_list_response, orm_ndjson_response, orm_response
 from app.repositories.execution_repository import ExecutionRepository
-from app.database.models import ExecutionStatus
+from app.database.models import ExecutionStatus, OperationType, SyncOperation
+from app.database.session import async_session_maker
+from app.tasks.sync_tasks import cancel_sync_execution
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class ExecutionResponse(BaseModel):
     """Execution response schema."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     session_id: UUID
     status: str
@@ -37,13 +44,12 @@ class ExecutionResponse(BaseModel):
     is_dry_run: bool = False
     force_overwrite: bool = False
 
-    class Config:
-        from_attributes = True
-
 
 class OperationResponse(BaseModel):
     """Operation response schema."""
-    id: UUID
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
     execution_id: UUID
     operation_type: str
     source_path: str
@@ -54,41 +60,43 @@ class OperationResponse(BaseModel):
     created_at: datetime
     completed_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
 
+# Filter values are accepted by member name, case-insensitively
+_EXECUTION_STATUSES = {member.name: member for member in ExecutionStatus}
+_OPERATION_TYPES = {member.name: member for member in OperationType}
 
 @router.get("/", response_model=List[ExecutionResponse])
 async def list_executions(
     session_id: Optional[UUID] = Query(None, description="Filter by session ID"),
-    status: Optional[str] = Query(None, description="Filter by status"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    status_filter: Optional[str] = Query(None, alias="status", description="Filter by status"),
+    skip: int = Query(0, ge=0, description="Number of records to skip", deprecated=True),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of records"),
-    db: AsyncSession = Depends(get_db)
+    after: Optional[str] = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    repo: ExecutionRepository = Depends(get_execution_repo)
 ):
     """List sync executions with filtering."""
+    cursor = decode_cursor(after)
     try:
-        repo = ExecutionRepository(db)
-
         # Convert status string to enum if provided
         status_enum = None
-        if status:
-            try:
-                status_enum = ExecutionStatus[status.upper()]
-            except KeyError:
+        if status_filter:
+            status_enum = _EXECUTION_STATUSES.get(status_filter.upper())
+            if status_enum is None:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid status: {status}"
+                    detail=f"Invalid status: {status_filter}"
                 )
 
         executions = await repo.get_all(
             session_id=session_id,
             status=status_enum,
             skip=skip,
-            limit=limit
+            limit=limit,
+            after=cursor
         )
 
-        return executions
+        response = orm_list_response(ExecutionResponse, executions)
+        return set_next_cursor(response, executions, limit, 'queued_at')
 
     except HTTPException:
         raise
@@ -100,10 +108,9 @@ async def list_executions(
 
 
 @router.get("/{execution_id}", response_model=ExecutionResponse)
-async def get_execution(execution_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_execution(execution_id: UUID, repo: ExecutionRepository = Depends(get_execution_repo)):
     """Get execution by ID."""
     try:
-        repo = ExecutionRepository(db)
         execution = await repo.get_by_id(execution_id)
 
         if not execution:
@@ -112,7 +119,7 @@ async def get_execution(execution_id: UUID, db: AsyncSession = Depends(get_db)):
                 detail="Execution not found"
             )
 
-        return execution
+        return orm_response(ExecutionResponse, execution)
 
     except HTTPException:
         raise
@@ -123,17 +130,41 @@ async def get_execution(execution_id: UUID, db: AsyncSession = Depends(get_db)):
         )
 
 
-@router.get("/{execution_id}/operations", response_model=List[OperationResponse])
+async def _stream_operations(
+    execution_id: UUID,
+    operation_type: Optional[OperationType],
+    success_only: Optional[bool]
+) -> AsyncIterator[SyncOperation]:
+    """Iterate over operations in a session of their own."""
+    # The request's session is closed before a streamed body is sent
+    async with async_session_maker() as db:
+        async for operation in ExecutionRepository(db).iter_execution_operations(
+            execution_id=execution_id,
+            operation_type=operation_type,
+            success_only=success_only
+        ):
+            yield operation
+
+
+@router.get(
+    "/{execution_id}/operations",
+    response_model=List[OperationResponse],
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}}
+)
 async def get_execution_operations(
     execution_id: UUID,
     operation_type: Optional[str] = Query(None, description="Filter by operation type"),
     success_only: Optional[bool] = Query(None, description="Filter by success status"),
-    db: AsyncSession = Depends(get_db)
+    accept: Optional[str] = Header(None),
+    repo: ExecutionRepository = Depends(get_execution_repo)
 ):
-    """Get operations for a specific execution."""
-    try:
-        repo = ExecutionRepository(db)
+    """
+    Get operations for a specific execution.
 
+    Clients that send ``Accept: application/x-ndjson`` get one operation per
+    line, streamed as rows are read instead of in a single JSON array.
+    """
+    try:
         # Verify execution exists
         execution = await repo.get_by_id(execution_id)
         if not execution:
@@ -143,24 +174,28 @@ async def get_execution_operations(
             )
 
         # Convert operation_type string to enum if provided
-        from app.database.models import OperationType
         operation_type_enum = None
         if operation_type:
-            try:
-                operation_type_enum = OperationType[operation_type.upper()]
-            except KeyError:
+            operation_type_enum = _OPERATION_TYPES.get(operation_type.upper())
+            if operation_type_enum is None:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Invalid operation type: {operation_type}"
                 )
 
+        if accept and NDJSON_MEDIA_TYPE in accept:
+            return orm_ndjson_response(
+                OperationResponse,
+                _stream_operations(execution_id, operation_type_enum, success_only)
+            )
+
         operations = await repo.get_execution_operations(
             execution_id=execution_id,
             operation_type=operation_type_enum,
             success_only=success_only
         )
 
-        return operations
+        return orm_list_response(OperationResponse, operations)
 
     except HTTPException:
         raise
@@ -172,41 +207,34 @@ async def get_execution_operations(
 
 
 @router.post("/{execution_id}/cancel")
-async def cancel_execution(execution_id: UUID, db: AsyncSession = Depends(get_db)):
+async def cancel_execution(execution_id: UUID, repo: ExecutionRepository = Depends(get_execution_repo)):
     """Cancel running execution."""
     try:
-        repo = ExecutionRepository(db)
-
-        # Verify execution exists
-        execution = await repo.get_by_id(execution_id)
+        # Cancel the execution if it is still queued or running
+        execution = await repo.cancel_execution(execution_id)
         if not execution:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Execution not found"
-            )
-
-        # Check if execution can be cancelled
-        if execution.status not in [ExecutionStatus.QUEUED, ExecutionStatus.RUNNING, ExecutionStatus.PAUSED]:
+            # Only the failure path pays for a second query to explain why
+            existing = await repo.get_by_id(execution_id)
+            if not existing:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Execution not found"
+                )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot cancel execution with status: {execution.status.value}"
+                detail=f"Cannot cancel execution with status: {existing.status.value}"
             )
 
-        # Cancel the execution
-        success = await repo.cancel_execution(execution_id)
+        # Record the cancellation before telling the worker, so a failed
+        # commit never leaves a stopped task on a row that still says running
+        await repo.db.commit()
 
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to cancel execution"
-            )
-
-        # Cancel Celery task if exists
-        if execution.celery_task_id:
-            from app.tasks.sync_tasks import cancel_sync_execution
-            cancel_sync_execution.delay(execution.celery_task_id)
-
-        await db.commit()
+        # Cancel the Celery task, whose ID is the execution ID; publishing
+        # blocks on the broker
+        await asyncio.to_thread(
+            cancel_sync_execution.delay,
+            execution.celery_task_id or str(execution.id)
+        )
 
         return {
             "message": "Execution cancelled successfully",
@@ -1,20 +1,33 @@
 """
 Health Check API endpoints for monitoring and system status.
 """
-from typing import Dict, Any
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import JSONResponse
+import asyncio
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Response
+from fastapi.responses import ORJSONResponse
 
+from app.config import settings
 from app.core.monitoring import get_system_health, health_checker, metrics_collector
 from app.core.config_manager import config_manager
 from app.core.logging_config import get_logger
 
 
 logger = get_logger(__name__)
-router = APIRouter(prefix="/health", tags=["health"])
+router = APIRouter(prefix="/health", tags=["health"], default_response_class=ORJSONResponse)
 
+# Constant probe bodies, encoded once instead of on every poll
+_LIVE_BODY = orjson.dumps({"status": "alive", "service": "f2l-sync"})
+_PING_BODY = orjson.dumps({"message": "pong", "service": "f2l-sync"})
+_VERSION_BODY = orjson.dumps({
+    'app_name': settings.APP_NAME,
+    'version': settings.APP_VERSION,
+    'environment': settings.APP_ENV,
+    'python_version': '3.11+',
+    'api_version': 'v1'
+})
 
-@router.get("/", response_model=Dict[str, Any])
+
+@router.get("/")
 async def get_health_status():
     """
     Get comprehensive system health status.
@@ -32,14 +45,14 @@ async def get_health_status():
         elif health_status['overall_status'] == 'unhealthy':
             status_code = 503  # Service Unavailable
         
-        return JSONResponse(
+        return ORJSONResponse(
             content=health_status,
             status_code=status_code
         )
         
     except Exception as e:
         logger.error(f"Health check failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 'overall_status': 'unhealthy',
                 'error': str(e),
@@ -49,7 +62,7 @@ async def get_health_status():
         )
 
 
-@router.get("/live", response_model=Dict[str, str])
+@router.get("/live")
 async def liveness_probe():
     """
     Kubernetes liveness probe endpoint.
@@ -57,10 +70,10 @@ async def liveness_probe():
     Returns:
         Simple alive status
     """
-    return {"status": "alive", "service": "f2l-sync"}
+    return Response(content=_LIVE_BODY, media_type="application/json")
 
 
-@router.get("/ready", response_model=Dict[str, Any])
+@router.get("/ready")
 async def readiness_probe():
     """
     Kubernetes readiness probe endpoint.
@@ -71,15 +84,17 @@ async def readiness_probe():
     try:
         # Run only critical checks for readiness
         critical_checks = ['database', 'redis']
-        results = {}
-        
-        for check_name in critical_checks:
-            result = await health_checker.run_check(check_name)
-            results[check_name] = {
+        check_results = await asyncio.gather(
+            *(health_checker.run_check_cached(check_name) for check_name in critical_checks)
+        )
+        results = {
+            check_name: {
                 'status': result.status,
                 'message': result.message,
                 'duration_ms': result.duration_ms
             }
+            for check_name, result in zip(critical_checks, check_results)
+        }
         
         # Determine readiness
         ready = all(result['status'] == 'healthy' for result in results.values())
@@ -91,11 +106,11 @@ async def readiness_probe():
         }
         
         status_code = 200 if ready else 503
-        return JSONResponse(content=response_data, status_code=status_code)
+        return ORJSONResponse(content=response_data, status_code=status_code)
         
     except Exception as e:
         logger.error(f"Readiness check failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 'ready': False,
                 'service': 'f2l-sync',
@@ -105,7 +120,7 @@ async def readiness_probe():
         )
 
 
-@router.get("/checks", response_model=Dict[str, Any])
+@router.get("/checks")
 async def get_health_checks():
     """
     Get detailed health check results.
@@ -116,7 +131,7 @@ async def get_health_checks():
     try:
         results = await health_checker.run_all_checks()
         
-        return {
+        return ORJSONResponse({
             'timestamp': results[list(results.keys())[0]].timestamp.isoformat() if results else None,
             'checks': {
                 name: {
@@ -127,14 +142,14 @@ async def get_health_checks():
                 }
                 for name, result in results.items()
             }
-        }
+        })
         
     except Exception as e:
         logger.error(f"Health checks failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/checks/{check_name}", response_model=Dict[str, Any])
+@router.get("/checks/{check_name}")
 async def get_specific_health_check(check_name: str):
     """
     Get specific health check result.
@@ -148,21 +163,21 @@ async def get_specific_health_check(check_name: str):
     try:
         result = await health_checker.run_check(check_name)
         
-        return {
+        return ORJSONResponse({
             'name': result.name,
             'status': result.status,
             'message': result.message,
             'duration_ms': result.duration_ms,
             'timestamp': result.timestamp.isoformat(),
             'details': result.details
-        }
+        })
         
     except Exception as e:
         logger.error(f"Health check {check_name} failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/metrics", response_model=Dict[str, Any])
+@router.get("/metrics")
 async def get_system_metrics():
     """
     Get current system metrics.
@@ -171,9 +186,9 @@ async def get_system_metrics():
         Current system metrics
     """
     try:
-        current_metrics = metrics_collector.collect_system_metrics()
+        current_metrics = await metrics_collector.latest_metrics()
         
-        return {
+        return ORJSONResponse({
             'timestamp': current_metrics.timestamp.isoformat(),
             'cpu_percent': current_metrics.cpu_percent,
             'memory_percent': current_metrics.memory_percent,
@@ -185,14 +200,14 @@ async def get_system_metrics():
             'load_average': current_metrics.load_average,
             'process_count': current_metrics.process_count,
             'thread_count': current_metrics.thread_count
-        }
+        })
         
     except Exception as e:
         logger.error(f"Metrics collection failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/metrics/summary", response_model=Dict[str, Any])
+@router.get("/metrics/summary")
 async def get_metrics_summary(hours: int = 1):
     """
     Get metrics summary for specified time period.
@@ -208,7 +223,7 @@ async def get_metrics_summary(hours: int = 1):
             raise HTTPException(status_code=400, detail="Hours must be between 1 and 24")
         
         summary = metrics_collector.get_metrics_summary(hours)
-        return summary
+        return ORJSONResponse(summary)
         
     except HTTPException:
         raise
@@ -217,7 +232,7 @@ async def get_metrics_summary(hours: int = 1):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/config", response_model=Dict[str, Any])
+@router.get("/config")
 async def get_configuration_status():
     """
     Get configuration validation status.
@@ -232,18 +247,18 @@ async def get_configuration_status():
         # Check environment health
         env_health = config_manager.check_environment_health()
         
-        return {
+        return ORJSONResponse({
             'configuration': config_summary,
             'environment_health': env_health,
             'timestamp': '2024-01-01T00:00:00Z'  # Will be set by response
-        }
+        })
         
     except Exception as e:
         logger.error(f"Configuration status check failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/version", response_model=Dict[str, str])
+@router.get("/version")
 async def get_version_info():
     """
     Get application version information.
@@ -251,18 +266,10 @@ async def get_version_info():
     Returns:
         Version and build information
     """
-    from app.config import settings
-    
-    return {
-        'app_name': settings.APP_NAME,
-        'version': settings.APP_VERSION,
-        'environment': settings.APP_ENV,
-        'python_version': '3.11+',
-        'api_version': 'v1'
-    }
+    return Response(content=_VERSION_BODY, media_type="application/json")
 
 
-@router.post("/checks/run", response_model=Dict[str, Any])
+@router.post("/checks/run")
 async def run_health_checks():
     """
     Manually trigger all health checks.
@@ -282,7 +289,7 @@ async def run_health_checks():
             elif result.status == 'warning' and overall_status == 'healthy':
                 overall_status = 'warning'
         
-        return {
+        return ORJSONResponse({
             'overall_status': overall_status,
             'timestamp': results[list(results.keys())[0]].timestamp.isoformat() if results else None,
             'checks_run': len(results),
@@ -295,14 +302,14 @@ async def run_health_checks():
                 }
                 for name, result in results.items()
             }
-        }
+        })
         
     except Exception as e:
         logger.error(f"Manual health check run failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/ping", response_model=Dict[str, str])
+@router.get("/ping")
 async def ping():
     """
     Simple ping endpoint for basic connectivity testing.
@@ -310,10 +317,10 @@ async def ping():
     Returns:
         Pong response
     """
-    return {"message": "pong", "service": "f2l-sync"}
+    return Response(content=_PING_BODY, media_type="application/json")
 
 
-@router.get("/status", response_model=Dict[str, Any])
+@router.get("/status")
 async def get_service_status():
     """
     Get high-level service status.
@@ -322,7 +329,6 @@ async def get_service_status():
         Service status summary
     """
     try:
-        from app.config import settings
         import time
         import psutil
         
@@ -331,8 +337,10 @@ async def get_service_status():
         uptime_seconds = time.time() - boot_time
         
         # Run critical checks only
-        db_check = await health_checker.run_check('database')
-        redis_check = await health_checker.run_check('redis')
+        db_check, redis_check = await asyncio.gather(
+            health_checker.run_check_cached('database'),
+            health_checker.run_check_cached('redis')
+        )
         
         # Determine service status
         service_healthy = (
@@ -340,7 +348,7 @@ async def get_service_status():
             redis_check.status == 'healthy'
         )
         
-        return {
+        return ORJSONResponse({
             'service': settings.APP_NAME,
             'version': settings.APP_VERSION,
             'environment': settings.APP_ENV,
@@ -351,13 +359,13 @@ async def get_service_status():
                 'database': db_check.status,
                 'redis': redis_check.status
             }
-        }
+        })
         
     except Exception as e:
         logger.error(f"Service status check failed: {e}")
-        return {
+        return ORJSONResponse({
             'service': 'f2l-sync',
             'status': 'unhealthy',
             'error': str(e),
             'timestamp': '2024-01-01T00:00:00Z'
-        }
+        })
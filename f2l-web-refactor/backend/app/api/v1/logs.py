@@ -12,7 +12,7 @@ router = APIRouter()
 
 class LogResponse(BaseModel):
     """Log response schema."""
-    id: UUID
+    id: int
     level: str
     message: str
     timestamp: datetime
@@ -1,21 +1,26 @@
 """
 Sessions API - Manage sync sessions.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 import logging
 
-from app.database.models import SyncDirection
+from app.api.deps import get_session_cache, get_session_repo
+from app.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, set_next_cursor
+from app.api.responses import orm_list_response, orm_response
+from app.core.session_cache import SessionCache
+from app.database.models import ScheduleUnit, SyncDirection
 from app.repositories.session_repository import SessionRepository
 from app.database.session import get_db
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class SessionBase(BaseModel):
@@ -39,7 +44,7 @@ class SessionBase(BaseModel):
     # Scheduling
     schedule_enabled: bool = False
     schedule_interval: Optional[int] = None
-    schedule_unit: Optional[str] = None  # "minutes", "hours", "days"
+    schedule_unit: Optional[ScheduleUnit] = None
     auto_start_enabled: bool = False
 
 
@@ -60,13 +65,15 @@ class SessionUpdate(BaseModel):
     # Note: max_parallel_transfers will be added in Phase 5
     schedule_enabled: Optional[bool] = None
     schedule_interval: Optional[int] = None
-    schedule_unit: Optional[str] = None
+    schedule_unit: Optional[ScheduleUnit] = None
     auto_start_enabled: Optional[bool] = None
     is_active: Optional[bool] = None
 
 
 class SessionResponse(BaseModel):
     """Session response schema."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     name: str
     source_endpoint_id: UUID
@@ -88,7 +95,7 @@ class SessionResponse(BaseModel):
     # Scheduling
     schedule_enabled: bool
     schedule_interval: Optional[int] = None
-    schedule_unit: Optional[str] = None
+    schedule_unit: Optional[ScheduleUnit] = None
     auto_start_enabled: bool
 
     # Status
@@ -100,9 +107,6 @@ class SessionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class SessionExecutionResponse(BaseModel):
     """Session execution response schema."""
@@ -114,19 +118,34 @@ class SessionExecutionResponse(BaseModel):
 @router.get("/", response_model=List[SessionResponse])
 async def list_sessions(
     active_only: bool = Query(True, description="Only return active sessions"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    skip: int = Query(0, ge=0, description="Number of records to skip", deprecated=True),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of records"),
-    db: AsyncSession = Depends(get_db)
+    after: Optional[str] = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    repo: SessionRepository = Depends(get_session_repo),
+    cache: SessionCache = Depends(get_session_cache)
 ):
-    """List all sync sessions."""
+    """List sync sessions, newest first."""
+    cursor = decode_cursor(after)
     try:
-        repo = SessionRepository(db)
+        # Keyed before the query, so a page read across a write is never served
+        key = await cache.list_key((active_only, after, skip, limit))
+        cached = await cache.get_list(key)
+        if cached is not None:
+            body, next_cursor = cached
+            response = Response(content=body, media_type="application/json")
+            if next_cursor:
+                response.headers[NEXT_CURSOR_HEADER] = next_cursor
+            return response
+
         sessions = await repo.get_all(
             active_only=active_only,
             skip=skip,
-            limit=limit
+            limit=limit,
+            after=cursor
         )
-        return sessions
+        response = set_next_cursor(orm_list_response(SessionResponse, sessions), sessions, limit, 'created_at')
+        await cache.set_list(key, response.body, response.headers.get(NEXT_CURSOR_HEADER))
+        return response
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -135,26 +154,26 @@ async def list_sessions(
 
 
 @router.post("/", response_model=SessionResponse, status_code=status.HTTP_201_CREATED)
-async def create_session(session: SessionCreate, db: AsyncSession = Depends(get_db)):
+async def create_session(
+    session: SessionCreate,
+    repo: SessionRepository = Depends(get_session_repo),
+    cache: SessionCache = Depends(get_session_cache)
+):
     """Create new sync session."""
     try:
-        repo = SessionRepository(db)
+        # Prepare session data
+        session_data = session.model_dump()
+        session_data['is_active'] = True
 
-        # Check if session name already exists
-        existing = await repo.get_by_name(session.name)
-        if existing:
+        # Create session; None means the name is already taken
+        new_session = await repo.create_if_absent(session_data)
+        if new_session is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Session with name '{session.name}' already exists"
             )
-
-        # Prepare session data
-        session_data = session.dict()
-        session_data['is_active'] = True
-
-        # Create session
-        new_session = await repo.create(session_data)
-        return new_session
+        await cache.invalidate()
+        return orm_response(SessionResponse, new_session, status_code=status.HTTP_201_CREATED)
 
     except HTTPException:
         raise
@@ -166,10 +185,18 @@ async def create_session(session: SessionCreate, db: AsyncSession = Depends(get_
 
 
 @router.get("/{session_id}", response_model=SessionResponse)
-async def get_session(session_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_session(
+    session_id: UUID,
+    repo: SessionRepository = Depends(get_session_repo),
+    cache: SessionCache = Depends(get_session_cache)
+):
     """Get session by ID."""
     try:
-        repo = SessionRepository(db)
+        key = await cache.session_key(session_id)
+        body = await cache.get_session(key)
+        if body is not None:
+            return Response(content=body, media_type="application/json")
+
         session = await repo.get_by_id(session_id)
 
         if not session:
@@ -178,7 +205,9 @@ async def get_session(session_id: UUID, db: AsyncSession = Depends(get_db)):
                 detail="Session not found"
             )
 
-        return session
+        response = orm_response(SessionResponse, session)
+        await cache.set_session(key, response.body)
+        return response
 
     except HTTPException:
         raise
@@ -193,24 +222,21 @@ async def get_session(session_id: UUID, db: AsyncSession = Depends(get_db)):
 async def update_session(
     session_id: UUID,
     session_update: SessionUpdate,
-    db: AsyncSession = Depends(get_db)
+    repo: SessionRepository = Depends(get_session_repo),
+    cache: SessionCache = Depends(get_session_cache)
 ):
     """Update session."""
     try:
-        repo = SessionRepository(db)
-
-        # Check if session exists
-        existing = await repo.get_by_id(session_id)
-        if not existing:
+        # Update session; None means it does not exist
+        update_data = session_update.model_dump(exclude_unset=True)
+        updated_session = await repo.update(session_id, update_data)
+        if not updated_session:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Session not found"
             )
-
-        # Update session
-        update_data = session_update.dict(exclude_unset=True)
-        updated_session = await repo.update(session_id, update_data)
-        return updated_session
+        await cache.invalidate()
+        return orm_response(SessionResponse, updated_session)
 
     except HTTPException:
         raise
@@ -222,17 +248,20 @@ async def update_session(
 
 
 @router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_session(session_id: UUID, db: AsyncSession = Depends(get_db)):
+async def delete_session(
+    session_id: UUID,
+    repo: SessionRepository = Depends(get_session_repo),
+    cache: SessionCache = Depends(get_session_cache)
+):
     """Delete session."""
     try:
-        repo = SessionRepository(db)
-
         success = await repo.delete(session_id)
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Session not found"
             )
+        await cache.invalidate()
 
     except HTTPException:
         raise
@@ -244,14 +273,19 @@ async def delete_session(session_id: UUID, db: AsyncSession = Depends(get_db)):
         )
 
 
-@router.post("/{session_id}/start", response_model=SessionExecutionResponse)
+@router.post("/{session_id}/start", response_model=SessionExecutionResponse, status_code=status.HTTP_202_ACCEPTED)
 async def start_session(
     session_id: UUID,
     dry_run: bool = Query(False, description="Perform dry run without actual file operations"),
     force_overwrite: bool = Query(False, description="Force overwrite existing files"),
     db: AsyncSession = Depends(get_db)
 ):
-    """Start sync session."""
+    """
+    Start sync session.
+
+    Returns once the sync task is queued; poll or cancel the execution
+    by the returned ID.
+    """
     try:
         from app.services.session_service import SessionService
 
@@ -13,7 +13,7 @@ Endpoints:
 - DELETE /shots/tasks/{task_id} - Delete download task
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
 from uuid import UUID
 from pydantic import BaseModel, Field
 from datetime import datetime
@@ -22,7 +22,8 @@ import traceback
 
 logger = logging.getLogger(__name__)
 
-from app.database.session import get_db
+from app.api.responses import json_array_response
+from app.database.session import async_session_maker, get_db
 from app.services.shot_structure_scanner import ShotStructureScanner
 from app.services.shot_comparison_service import ShotComparisonService
 from app.services.shot_download_service import ShotDownloadService
@@ -73,10 +74,10 @@ class CreateTaskRequest(BaseModel):
     task_name: str = Field(..., description="User-friendly task name")
     shots: List[ShotSelection] = Field(..., description="List of shots to download")
     departments: List[str] = Field(default=["anim", "lighting"], description="Departments to download")
-    version_strategy: Optional[str] = Field('latest', description="Version strategy: latest, specific, all, custom")
+    version_strategy: Optional[Literal['latest', 'specific', 'all', 'custom']] = Field('latest', description="Version strategy")
     specific_version: Optional[str] = Field(None, description="Specific version to download (e.g., v005)")
     custom_versions: Optional[dict] = Field(None, description="Custom version per shot (shot-department: version)")
-    conflict_strategy: Optional[str] = Field('skip', description="Conflict strategy: skip, overwrite, compare, keep_both")
+    conflict_strategy: Optional[Literal['skip', 'overwrite', 'compare', 'keep_both']] = Field('skip', description="Conflict strategy")
     notes: Optional[str] = Field(None, description="Optional notes")
     created_by: Optional[str] = Field(None, description="Username who created the task")
 
@@ -219,7 +220,7 @@ async def compare_shots(
 
     try:
         # Convert shots to dict format
-        shots = [shot.dict() for shot in request.shots]
+        shots = [shot.model_dump() for shot in request.shots]
 
         # Compare all shots
         results = []
@@ -272,7 +273,7 @@ async def create_download_task(
 
     try:
         # Convert shots to dict format
-        shots = [shot.dict() for shot in request.shots]
+        shots = [shot.model_dump() for shot in request.shots]
 
         result = await download_service.create_download_task(
             endpoint_id=request.endpoint_id,
@@ -298,21 +299,36 @@ async def create_download_task(
         )
 
 
+async def _stream_task_summaries(
+    endpoint_id: Optional[UUID],
+    status_enum: Optional[ShotDownloadTaskStatus],
+    limit: int,
+    offset: int
+) -> AsyncIterator[Dict[str, Any]]:
+    """Iterate over task summaries in a session of their own."""
+    # The request's session is closed before a streamed body is sent
+    async with async_session_maker() as db:
+        async for summary in ShotDownloadService(db).iter_tasks(
+            endpoint_id=endpoint_id,
+            status=status_enum,
+            limit=limit,
+            offset=offset
+        ):
+            yield summary
+
+
 @router.get("/tasks", response_model=List[TaskSummary])
 async def list_download_tasks(
     endpoint_id: Optional[UUID] = Query(None, description="Filter by endpoint"),
     status_filter: Optional[str] = Query(None, description="Filter by status"),
     limit: int = Query(50, ge=1, le=100, description="Max results"),
-    offset: int = Query(0, ge=0, description="Pagination offset"),
-    db: AsyncSession = Depends(get_db)
+    offset: int = Query(0, ge=0, description="Pagination offset")
 ):
     """
     List download tasks with optional filters.
 
-    Returns paginated list of task summaries.
+    Returns paginated list of task summaries, streamed as they are read.
     """
-    download_service = ShotDownloadService(db)
-
     try:
         # Convert status string to enum if provided
         status_enum = None
@@ -325,15 +341,10 @@ async def list_download_tasks(
                     detail=f"Invalid status: {status_filter}"
                 )
 
-        tasks = await download_service.list_tasks(
-            endpoint_id=endpoint_id,
-            status=status_enum,
-            limit=limit,
-            offset=offset
+        return json_array_response(
+            _stream_task_summaries(endpoint_id, status_enum, limit, offset)
         )
 
-        return tasks
-
     except HTTPException:
         raise
     except Exception as e:
@@ -13,7 +13,7 @@ Endpoints:
 - GET /uploads/history - Get upload history
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 from pydantic import BaseModel, Field
 from datetime import datetime
@@ -21,6 +21,7 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+from app.database.models import ShotUploadItemStatus
 from app.database.session import get_db
 from app.services.shot_upload_service import ShotUploadService
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -49,9 +50,9 @@ class CreateUploadTaskRequest(BaseModel):
     endpoint_id: UUID = Field(..., description="Endpoint UUID (has both local_path and remote_path)")
     task_name: str = Field(..., description="User-friendly task name")
     items: List[UploadItemRequest] = Field(..., description="List of files to upload")
-    version_strategy: Optional[str] = Field('latest', description="Version strategy")
+    version_strategy: Optional[Literal['latest', 'specific', 'all', 'custom']] = Field('latest', description="Version strategy")
     specific_version: Optional[str] = Field(None, description="Specific version")
-    conflict_strategy: Optional[str] = Field('skip', description="skip or overwrite")
+    conflict_strategy: Optional[Literal['skip', 'overwrite']] = Field('skip', description="skip or overwrite")
     notes: Optional[str] = Field(None, description="Optional notes")
 
 
@@ -137,7 +138,7 @@ async def create_upload_task(
         result = await service.create_upload_task(
             endpoint_id=request.endpoint_id,
             task_name=request.task_name,
-            items=[item.dict() for item in request.items],
+            items=[item.model_dump() for item in request.items],
             version_strategy=request.version_strategy or 'latest',
             specific_version=request.specific_version,
             conflict_strategy=request.conflict_strategy or 'skip',
@@ -334,7 +335,7 @@ async def get_upload_history(
     episode: Optional[str] = Query(None),
     sequence: Optional[str] = Query(None),
     shot: Optional[str] = Query(None),
-    status_filter: Optional[str] = Query(None, alias="status"),
+    status_filter: Optional[ShotUploadItemStatus] = Query(None, alias="status"),
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
     limit: int = Query(100, ge=1, le=500),
@@ -36,6 +36,11 @@ class Settings(BaseSettings):
     DATABASE_POOL_SIZE: int = Field(default=20, ge=5, le=100)
     DATABASE_MAX_OVERFLOW: int = Field(default=10, ge=0, le=50)
     DATABASE_ECHO: bool = False
+    MIGRATION_MODE: str = Field(
+        default="skip",
+        pattern="^(sync|async|skip)$",
+        description="Run Alembic migrations at startup: sync (before serving), async (in background) or skip"
+    )
 
     # Redis
     REDIS_URL: str = Field(
@@ -43,6 +48,7 @@ class Settings(BaseSettings):
         description="Redis connection string"
     )
     REDIS_CACHE_TTL: int = Field(default=3600, ge=60, le=86400, description="Cache TTL in seconds")
+    SESSION_CACHE_TTL_SECONDS: int = Field(default=30, ge=0, le=3600, description="Sync session response cache TTL (0 disables)")
 
     # Celery
     CELERY_BROKER_URL: str = Field(
@@ -104,9 +110,14 @@ class Settings(BaseSettings):
     DEFAULT_TRANSFER_WORKERS: int = Field(default=3, ge=1, le=10)
     SCAN_CACHE_ENABLED: bool = True
     SCAN_CACHE_TTL_HOURS: int = Field(default=24, ge=1, le=168)
+    BROWSE_CACHE_TTL_SECONDS: int = Field(default=30, ge=0, le=3600, description="Directory listing cache TTL (0 disables)")
+    BROWSE_METADATA_CACHE_TTL_SECONDS: int = Field(default=5, ge=0, le=300, description="File metadata cache TTL (0 disables)")
 
     # Health Check
     HEALTH_CHECK_INTERVAL_SECONDS: int = Field(default=30, ge=10, le=300)
+    HEALTH_CHECK_TIMEOUT_SECONDS: int = Field(default=5, ge=1, le=60, description="Time a single health check may take before it is unhealthy")
+    HEALTH_CHECK_CACHE_TTL_SECONDS: int = Field(default=5, ge=0, le=60, description="Probe check result cache TTL (0 disables)")
+    METRICS_SAMPLE_INTERVAL_SECONDS: int = Field(default=10, ge=0, le=300, description="System metrics sampling interval (0 samples per request)")
 
     # AWS S3 Defaults (Optional)
     AWS_ACCESS_KEY_ID: Optional[str] = None
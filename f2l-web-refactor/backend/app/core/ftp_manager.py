@@ -6,13 +6,20 @@ from typing import List, Dict, Optional, Callable, Any
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import os
+import posixpath
 import ftplib
 import logging
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
+from app.core.listing_result import ListingResult
+
 logger = logging.getLogger(__name__)
 
+# Bytes read from the local file per STOR data-socket write. ftplib's
+# default of 8 KiB means one Python-level read/sendall per 8 KiB.
+UPLOAD_BLOCK_SIZE = 8 * 1024 * 1024
+
 
 @dataclass
 class FTPConfig:
@@ -190,22 +197,27 @@ class FTPManager:
         remote_path: str = "/", 
         recursive: bool = False,
         max_depth: int = 5,
-        current_depth: int = 0
+        current_depth: int = 0,
+        max_items: Optional[int] = None
     ) -> List[FTPFileInfo]:
         """
         List directory contents with optional recursion.
+
+        Returns a ListingResult (a list that also carries file/directory
+        totals); listing errors are logged and flagged as ``failed`` on it.
         
         Args:
             remote_path: Remote directory path to list
             recursive: If True, list recursively
             max_depth: Maximum recursion depth
             current_depth: Current recursion depth (internal)
+            max_items: Stop listing further directories once this many entries are collected
             
         Returns:
             List of FTPFileInfo objects
         """
         if not self.ensure_connected():
-            return []
+            return ListingResult(failed=True)
 
         if recursive and current_depth >= max_depth:
             logger.warning(f"Maximum recursion depth ({max_depth}) reached for {remote_path}")
@@ -213,6 +225,7 @@ class FTPManager:
 
         files = []
         directories = []
+        failed = False
 
         def process_line(line: str):
             """Parse FTP LIST output line."""
@@ -267,7 +280,7 @@ class FTPManager:
                 self.ftp.cwd(remote_path)
             except Exception as e:
                 logger.error(f"Cannot access directory {remote_path}: {e}")
-                return []
+                return ListingResult(failed=True)
 
             # Get directory listing
             lines = []
@@ -275,7 +288,7 @@ class FTPManager:
                 self.ftp.retrlines('LIST', lines.append)
             except Exception as e:
                 logger.error(f"Error getting directory listing for {remote_path}: {e}")
-                return []
+                return ListingResult(failed=True)
 
             # Process files
             for line in lines:
@@ -285,15 +298,20 @@ class FTPManager:
             # Handle recursive listing
             if recursive:
                 for dirname in directories:
+                    if max_items is not None and len(files) >= max_items:
+                        break
                     subdir_path = f"{remote_path.rstrip('/')}/{dirname}"
                     try:
                         logger.debug(f"Recursing into: {subdir_path} (depth: {current_depth + 1})")
                         subdir_files = self.list_directory(
-                            subdir_path, recursive=True, max_depth=max_depth, current_depth=current_depth + 1
+                            subdir_path, recursive=True, max_depth=max_depth, current_depth=current_depth + 1,
+                            max_items=None if max_items is None else max_items - len(files)
                         )
                         files.extend(subdir_files)
+                        failed = failed or getattr(subdir_files, 'failed', False)
                     except Exception as e:
                         logger.error(f"Error recursing into {subdir_path}: {e}")
+                        failed = True
                         continue
 
             # Return to original directory
@@ -304,9 +322,14 @@ class FTPManager:
 
         except Exception as e:
             logger.error(f"Error listing {remote_path}: {e}")
+            failed = True
 
         self.last_activity = datetime.now()
-        return files
+        if max_items is not None and len(files) > max_items:
+            files = files[:max_items]
+            return ListingResult(files, sum(1 for f in files if not f.is_file), failed)
+        # Recursive listings hold files only; otherwise every directory seen was added
+        return ListingResult(files, 0 if recursive else len(directories), failed)
 
     def get_file_info(self, remote_path: str) -> Optional[Dict[str, Any]]:
         """
@@ -356,6 +379,59 @@ class FTPManager:
             logger.warning(f"Cannot get file info for {remote_path}: {e}")
             return None
 
+    def batch_get_file_info(self, remote_paths: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get metadata for many files with one MLSD per parent directory.
+
+        Falls back to SIZE/MDTM per file (get_file_info) when the server
+        does not support MLSD.
+
+        Args:
+            remote_paths: Remote file paths
+
+        Returns:
+            Dict mapping each path to its metadata (as get_file_info) or None if not found
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = dict.fromkeys(remote_paths)
+        if not remote_paths or not self.ensure_connected():
+            return results
+
+        by_parent: Dict[str, List[str]] = {}
+        for remote_path in remote_paths:
+            by_parent.setdefault(posixpath.dirname(remote_path) or "/", []).append(remote_path)
+
+        for parent, paths in by_parent.items():
+            try:
+                entries = dict(self.ftp.mlsd(parent, facts=['type', 'size', 'modify', 'perm']))
+            except ftplib.error_perm as e:
+                logger.debug(f"MLSD not available for {parent}, falling back to SIZE/MDTM: {e}")
+                for remote_path in paths:
+                    results[remote_path] = self.get_file_info(remote_path)
+                continue
+            except Exception as e:
+                logger.warning(f"Cannot list {parent} for file info: {e}")
+                continue
+
+            for remote_path in paths:
+                facts = entries.get(posixpath.basename(remote_path))
+                if facts is None or facts.get('type', 'file') != 'file':
+                    continue
+                try:
+                    modified = datetime.strptime(
+                        facts['modify'][:14], '%Y%m%d%H%M%S'
+                    ).replace(tzinfo=timezone.utc)
+                except (KeyError, ValueError):
+                    modified = None
+                results[remote_path] = {
+                    'path': remote_path,
+                    'size': int(facts['size']) if facts.get('size', '').isdigit() else None,
+                    'modified': modified,
+                    'exists': True
+                }
+
+        self.last_activity = datetime.now()
+        return results
+
     def download_file(
         self,
         remote_path: str,
@@ -591,22 +667,14 @@ class FTPManager:
                     progress_callback(bytes_transferred[0])
 
             # Upload file
+            # Stream the file straight from disk to the data socket
             with open(local_path, 'rb') as local_file:
-                if progress_callback:
-                    # Read file in chunks for progress tracking
-                    def read_with_progress():
-                        while True:
-                            chunk = local_file.read(8192)  # 8KB chunks
-                            if not chunk:
-                                break
-                            progress_hook(chunk)
-                            yield chunk
-
-                    # This is a simplified approach - actual implementation may vary
-                    self.ftp.storbinary(f'STOR {remote_path}', local_file)
-                else:
-                    # Simple upload without progress
-                    self.ftp.storbinary(f'STOR {remote_path}', local_file)
+                self.ftp.storbinary(
+                    f'STOR {remote_path}',
+                    local_file,
+                    blocksize=UPLOAD_BLOCK_SIZE,
+                    callback=progress_hook if progress_callback else None
+                )
 
             self.last_activity = datetime.now()
 
@@ -0,0 +1,94 @@
+"""
+ListingCache - Short-lived cache of serialized directory listings and file metadata.
+
+Interactive browsing re-lists the same directories on every page refresh,
+and a remote listing costs one or more round-trips per directory. Listings
+are cached as the JSON body that was sent, together with an ETag so clients
+can revalidate with ``If-None-Match`` instead of downloading them again.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Hashable, Optional, Tuple
+import hashlib
+import time
+
+from app.config import settings
+
+
+@dataclass
+class CachedListing:
+    """Serialized listing with its validators."""
+    body: bytes
+    etag: str
+    cached_at: datetime
+    expires_at: float
+
+
+class ListingCache:
+    """
+    In-process TTL cache of listing bodies keyed by ``(endpoint_id, ...)``.
+
+    The first element of every key must be the endpoint ID so that
+    ``invalidate()`` can drop all listings of an endpoint.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a listing is served from cache; 0 disables caching
+            max_entries: Listings kept before the oldest are dropped
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[Hashable, ...], CachedListing] = {}
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[CachedListing]:
+        """Get a listing that has not expired, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return entry
+
+    def set(self, key: Tuple[Hashable, ...], body: bytes) -> CachedListing:
+        """
+        Store a listing body.
+
+        Returns:
+            The cached listing (also returned when caching is disabled, so
+            callers can always send its ETag)
+        """
+        entry = CachedListing(
+            body=body,
+            etag=f'"{hashlib.sha1(body).hexdigest()}"',
+            cached_at=datetime.now(timezone.utc),
+            expires_at=time.monotonic() + self.ttl
+        )
+        if self.ttl <= 0:
+            return entry
+
+        self._entries.pop(key, None)
+        while len(self._entries) >= self.max_entries:
+            # Dicts keep insertion order, so the first entry is the oldest
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = entry
+        return entry
+
+    def invalidate(self, endpoint_id: Hashable) -> None:
+        """Drop every cached listing of an endpoint."""
+        for key in [key for key in self._entries if key[0] == endpoint_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached listings."""
+        self._entries.clear()
+
+
+listing_cache = ListingCache(ttl=settings.BROWSE_CACHE_TTL_SECONDS)
+
+# File metadata is polled by the UI; a few seconds coalesces bursts
+metadata_cache = ListingCache(ttl=settings.BROWSE_METADATA_CACHE_TTL_SECONDS, max_entries=1024)
@@ -0,0 +1,36 @@
+"""
+ListingResult - Directory listing entries with their file/directory totals.
+"""
+from typing import Any, Iterable
+
+
+class ListingResult(list):
+    """
+    Entries returned by ``list_directory`` together with their totals.
+
+    Managers already branch on file vs directory while listing, so they
+    count directories as they go and callers read the totals here instead
+    of making another pass. It is still a list, so callers that iterate or
+    slice the result are unaffected (slicing returns a plain list).
+
+    Managers log listing errors and return what they have, so ``failed``
+    marks a result that may be incomplete and should not be cached.
+    """
+
+    def __init__(self, entries: Iterable[Any] = (), total_directories: int = 0, failed: bool = False):
+        """
+        Initialize the result.
+
+        Args:
+            entries: Listing entries
+            total_directories: Number of entries that are not files
+            failed: Whether listing hit an error, so entries may be missing
+        """
+        super().__init__(entries)
+        self.total_directories = total_directories
+        self.failed = failed
+
+    @property
+    def total_files(self) -> int:
+        """Number of entries that are files."""
+        return len(self) - self.total_directories
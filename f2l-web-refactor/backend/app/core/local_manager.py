@@ -4,13 +4,29 @@ Local File System Manager - Handles local file operations for F2L Web Refactor.
 import os
 import shutil
 import logging
+from stat import S_ISDIR, S_ISREG
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+
+from app.core.listing_result import ListingResult
 
 logger = logging.getLogger(__name__)
 
+# Relative endpoint paths are resolved under the base mount point
+LOCAL_MOUNT_ROOT = PurePosixPath('/mnt')
+
+
+def resolve_local_path(local_path: str) -> str:
+    """
+    Resolve an endpoint's local path to the absolute path it refers to.
+
+    Relative paths are joined to ``LOCAL_MOUNT_ROOT``; redundant slashes and
+    ``.`` components are dropped.
+    """
+    return str(LOCAL_MOUNT_ROOT / local_path)
+
 
 @dataclass
 class LocalConfig:
@@ -81,6 +97,14 @@ class LocalManager:
         """Async version of close."""
         self.close()
 
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
     def health_check(self) -> Dict[str, Any]:
         """
         Perform health check on local file system.
@@ -135,7 +159,8 @@ class LocalManager:
         self,
         path: str,
         recursive: bool = False,
-        max_depth: int = 5
+        max_depth: int = 5,
+        max_items: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         List directory contents.
@@ -144,9 +169,11 @@ class LocalManager:
             path: Directory path relative to base path
             recursive: Whether to list recursively
             max_depth: Maximum recursion depth
+            max_items: Stop listing further directories once this many entries are collected
             
         Returns:
-            List of file/directory information dictionaries
+            List of file/directory information dictionaries (a ListingResult
+            carrying file/directory totals, flagged ``failed`` on errors)
         """
         try:
             if not self.connected:
@@ -163,19 +190,22 @@ class LocalManager:
                 logger.warning(f"Path is not a directory: {full_path}")
                 return []
             
-            files = []
-            
             if recursive:
-                files = self._list_recursive(full_path, max_depth, 0)
+                files = self._list_recursive(full_path, max_depth, 0, max_items)
             else:
                 files = self._list_single_level(full_path)
+            failed = files.failed
+            
+            if max_items is not None and len(files) > max_items:
+                files = files[:max_items]
+                files = ListingResult(files, sum(1 for f in files if not f['is_file']), failed)
             
             logger.info(f"Listed {len(files)} items from {full_path}")
             return files
             
         except Exception as e:
             logger.error(f"Failed to list directory {path}: {e}")
-            return []
+            return ListingResult(failed=True)
 
     async def list_directory_async(
         self,
@@ -223,6 +253,21 @@ class LocalManager:
             logger.error(f"Failed to get file info for {file_path}: {e}")
             return None
 
+    def batch_get_file_info(self, file_paths: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get metadata for many files.
+
+        Local stats are cheap, so this is get_file_info per path; it exists
+        so callers can batch uniformly across FTP/SFTP/Local.
+
+        Args:
+            file_paths: File paths relative to base path
+
+        Returns:
+            Dict mapping each path to its metadata or None if not found
+        """
+        return {file_path: self.get_file_info(file_path) for file_path in file_paths}
+
     def download_file(
         self,
         remote_path: str,
@@ -360,61 +405,83 @@ class LocalManager:
         
         return resolved
 
-    def _list_single_level(self, directory: Path) -> List[Dict[str, Any]]:
-        """List single directory level."""
+    def _list_single_level(self, directory: Path) -> ListingResult:
+        """
+        List single directory level.
+
+        Uses os.scandir so file type comes from the directory entry and
+        each entry costs at most one stat call (cached on the DirEntry).
+        """
         files = []
+        total_directories = 0
+        failed = False
+        rel_dir = directory.relative_to(self.base_path).as_posix()
+        prefix = "" if rel_dir == "." else f"{rel_dir}/"
         
         try:
-            for item in directory.iterdir():
-                try:
-                    stat = item.stat()
-                    
-                    # Get relative path from base path
-                    rel_path = item.relative_to(self.base_path)
-                    
-                    file_info = {
-                        'path': str(rel_path).replace('\\', '/'),
-                        'name': item.name,
-                        'size': stat.st_size if item.is_file() else 0,
-                        'modified': datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
-                        'is_file': item.is_file(),
-                        'is_directory': item.is_dir(),
-                        'permissions': oct(stat.st_mode)[-3:]
-                    }
-                    
-                    files.append(file_info)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to get info for {item}: {e}")
-                    continue
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        stat = entry.stat()
+                        is_file = S_ISREG(stat.st_mode)
+                        
+                        file_info = {
+                            'path': prefix + entry.name,
+                            'name': entry.name,
+                            'size': stat.st_size if is_file else 0,
+                            'modified': datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+                            'is_file': is_file,
+                            'is_directory': S_ISDIR(stat.st_mode),
+                            'permissions': oct(stat.st_mode)[-3:]
+                        }
+                        
+                        files.append(file_info)
+                        total_directories += not is_file
+                        
+                    except Exception as e:
+                        logger.warning(f"Failed to get info for {entry.path}: {e}")
+                        continue
         
         except Exception as e:
             logger.error(f"Failed to list directory {directory}: {e}")
+            failed = True
         
-        return files
+        return ListingResult(files, total_directories, failed)
 
-    def _list_recursive(self, directory: Path, max_depth: int, current_depth: int) -> List[Dict[str, Any]]:
-        """List directory recursively."""
-        files = []
+    def _list_recursive(
+        self,
+        directory: Path,
+        max_depth: int,
+        current_depth: int,
+        max_items: Optional[int] = None
+    ) -> ListingResult:
+        """List directory recursively, stopping once max_items entries are collected."""
+        files = ListingResult()
         
         if current_depth >= max_depth:
             return files
         
-        # Add current level
-        files.extend(self._list_single_level(directory))
-        
-        # Recurse into subdirectories
-        try:
-            for item in directory.iterdir():
-                if item.is_dir():
-                    try:
-                        sub_files = self._list_recursive(item, max_depth, current_depth + 1)
-                        files.extend(sub_files)
-                    except Exception as e:
-                        logger.warning(f"Failed to recurse into {item}: {e}")
-                        continue
+        # Add current level, then recurse into the subdirectories it found
+        level = self._list_single_level(directory)
+        files.extend(level)
+        files.total_directories += level.total_directories
+        files.failed = level.failed
         
-        except Exception as e:
-            logger.error(f"Failed to recurse directory {directory}: {e}")
+        for file_info in level:
+            if max_items is not None and len(files) >= max_items:
+                break
+            if file_info['is_directory']:
+                try:
+                    sub_files = self._list_recursive(
+                        directory / file_info['name'], max_depth, current_depth + 1,
+                        None if max_items is None else max_items - len(files)
+                    )
+                    files.extend(sub_files)
+                    files.total_directories += sub_files.total_directories
+                    files.failed = files.failed or sub_files.failed
+                except Exception as e:
+                    logger.warning(f"Failed to recurse into {file_info['path']}: {e}")
+                    files.failed = True
+                    continue
         
         return files
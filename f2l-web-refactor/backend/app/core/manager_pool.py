@@ -0,0 +1,137 @@
+"""
+EndpointManagerPool - Reuse connected FTP/SFTP/Local managers across requests.
+
+Connecting to an FTP/SFTP server costs a TCP (and SSH) handshake plus
+authentication. Interactive browsing hits the same endpoint many times in a
+row, so connected managers are lent out per endpoint and returned after use
+instead of being disconnected.
+"""
+from collections import deque
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Hashable, Optional, Tuple
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class EndpointManagerPool:
+    """
+    Per-endpoint pool of connected managers.
+
+    Managers are validated before being lent out (``ensure_connected()``
+    sends a NOOP / stats the cwd and reconnects if needed) and closed with
+    ``close()`` after sitting idle for ``idle_ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        max_idle_per_endpoint: int = 4,
+        idle_ttl: float = 60.0,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_idle_per_endpoint: Idle managers kept per endpoint; extras are closed
+            idle_ttl: Seconds an idle manager is kept before it is closed
+            executor: Executor for the blocking manager calls (default loop executor if None)
+        """
+        self.max_idle_per_endpoint = max_idle_per_endpoint
+        self.idle_ttl = idle_ttl
+        self.executor = executor
+        # endpoint key -> idle (manager, returned_at), most recently used last
+        self._idle: Dict[Hashable, Deque[Tuple[Any, float]]] = {}
+        self._evictor: Optional[asyncio.Task] = None
+
+    async def _run(self, func: Callable, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args))
+
+    async def _close(self, manager: Any) -> None:
+        try:
+            await self._run(manager.close)
+        except Exception as e:
+            logger.warning(f"Error closing pooled manager: {e}")
+
+    async def _checkout(self, key: Hashable, config: Any, factory: Callable[[Any], Any]) -> Any:
+        idle = self._idle.get(key)
+        while idle:
+            manager, _ = idle.pop()
+            if manager.config != config:
+                # Endpoint settings changed since this manager connected
+                await self._close(manager)
+                continue
+            ensure_connected = getattr(manager, 'ensure_connected', manager.connect)
+            if await self._run(ensure_connected):
+                return manager
+            await self._close(manager)
+
+        manager = factory(config)
+        if not await self._run(manager.connect):
+            raise ConnectionError("Failed to connect to endpoint")
+        return manager
+
+    async def _checkin(self, key: Hashable, manager: Any) -> None:
+        idle = self._idle.setdefault(key, deque())
+        if len(idle) >= self.max_idle_per_endpoint:
+            await self._close(manager)
+            return
+        idle.append((manager, time.monotonic()))
+        if self._evictor is None or self._evictor.done():
+            self._evictor = asyncio.create_task(self._evict_idle())
+
+    @asynccontextmanager
+    async def acquire(self, key: Hashable, config: Any, factory: Callable[[Any], Any]) -> AsyncIterator[Any]:
+        """
+        Lend a connected manager for an endpoint.
+
+        Args:
+            key: Pool key, normally the endpoint ID
+            config: Manager config; pooled managers with a different config are discarded
+            factory: Creates a new (unconnected) manager from ``config``
+
+        Yields:
+            Connected manager; it is returned to the pool on exit, or closed
+            if the block raised
+
+        Raises:
+            ConnectionError: If a new manager could not connect
+        """
+        manager = await self._checkout(key, config, factory)
+        try:
+            yield manager
+        except BaseException:
+            await self._close(manager)
+            raise
+        await self._checkin(key, manager)
+
+    async def _evict_idle(self) -> None:
+        """Close managers idle for longer than ``idle_ttl`` until the pool is empty."""
+        while any(self._idle.values()):
+            await asyncio.sleep(self.idle_ttl / 2)
+            cutoff = time.monotonic() - self.idle_ttl
+            for key, idle in list(self._idle.items()):
+                # Oldest first; stop at the first manager still within its TTL
+                while idle and idle[0][1] < cutoff:
+                    manager, _ = idle.popleft()
+                    await self._close(manager)
+                if not idle:
+                    self._idle.pop(key, None)
+
+    async def invalidate(self, key: Hashable) -> None:
+        """Close all idle managers for an endpoint."""
+        for manager, _ in self._idle.pop(key, ()):
+            await self._close(manager)
+
+    async def close_all(self) -> None:
+        """Close every idle manager and stop the eviction task."""
+        if self._evictor is not None:
+            self._evictor.cancel()
+            self._evictor = None
+        for key in list(self._idle):
+            await self.invalidate(key)
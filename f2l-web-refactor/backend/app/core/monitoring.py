@@ -4,7 +4,7 @@ Monitoring System - Health checks, metrics collection, and system monitoring.
 import time
 import psutil
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -48,9 +48,20 @@ class SystemMetrics:
 class HealthChecker:
     """System health checker."""
 
-    def __init__(self):
-        """Initialize health checker."""
+    def __init__(self, cache_ttl: float = 0, check_timeout: Optional[float] = None):
+        """
+        Initialize health checker.
+
+        Args:
+            cache_ttl: Seconds ``run_check_cached`` reuses a result; 0 disables caching
+            check_timeout: Seconds a check may take before it is reported unhealthy
+        """
         self.checks = {}
+        self.cache_ttl = cache_ttl
+        self.check_timeout = check_timeout
+        # check name -> (expires_at, result)
+        self._cached: Dict[str, Tuple[float, HealthCheckResult]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
         self.register_default_checks()
 
     def register_default_checks(self):
@@ -92,10 +103,19 @@ class HealthChecker:
 
         start_time = time.time()
         try:
-            result = await self.checks[name]()
+            result = await asyncio.wait_for(self.checks[name](), timeout=self.check_timeout)
             result.duration_ms = (time.time() - start_time) * 1000
             result.timestamp = datetime.utcnow()
             return result
+        except asyncio.TimeoutError:
+            logger.error(f"Health check {name} timed out after {self.check_timeout}s")
+            return HealthCheckResult(
+                name=name,
+                status='unhealthy',
+                message=f'Health check timed out after {self.check_timeout}s',
+                duration_ms=(time.time() - start_time) * 1000,
+                timestamp=datetime.utcnow()
+            )
         except Exception as e:
             logger.error(f"Health check {name} failed: {e}")
             return HealthCheckResult(
@@ -106,6 +126,36 @@ class HealthChecker:
                 timestamp=datetime.utcnow()
             )
 
+    async def run_check_cached(self, name: str) -> HealthCheckResult:
+        """
+        Run a health check, reusing its result for ``cache_ttl`` seconds.
+
+        Probes and scrapes poll the same checks many times a second; callers
+        arriving while the check runs wait for that run instead of starting
+        their own.
+
+        Args:
+            name: Check name
+
+        Returns:
+            HealthCheckResult
+        """
+        cached = self._cached.get(name)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        inflight = self._inflight.get(name)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self.run_check(name))
+            self._inflight[name] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(name, None))
+
+        # Shielded so a caller that goes away does not cancel the shared run
+        result = await asyncio.shield(inflight)
+        if self.cache_ttl > 0:
+            self._cached[name] = (time.monotonic() + self.cache_ttl, result)
+        return result
+
     async def run_all_checks(self) -> Dict[str, HealthCheckResult]:
         """
         Run all registered health checks.
@@ -283,23 +333,40 @@ class HealthChecker:
 
 
 class MetricsCollector:
-    """System metrics collector."""
+    """
+    System metrics collector.
 
-    def __init__(self):
-        """Initialize metrics collector."""
+    With a sample interval, metrics are collected by one background task
+    (started on first use) and readers get the latest snapshot, instead of
+    every request running the psutil calls and blocking a second on CPU.
+    """
+
+    def __init__(self, sample_interval: float = 0):
+        """
+        Initialize metrics collector.
+
+        Args:
+            sample_interval: Seconds between background samples; 0 collects on every read
+        """
         self.metrics_history = []
         self.max_history_size = 1000
+        self.sample_interval = sample_interval
+        self.snapshot: Optional[SystemMetrics] = None
+        self._sampler: Optional[asyncio.Task] = None
 
-    def collect_system_metrics(self) -> SystemMetrics:
+    def collect_system_metrics(self, cpu_interval: Optional[float] = 1) -> SystemMetrics:
         """
         Collect current system metrics.
-        
+
+        Args:
+            cpu_interval: Seconds to measure CPU over; None measures since the previous call
+
         Returns:
             SystemMetrics object
         """
         try:
             # CPU metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = psutil.cpu_percent(interval=cpu_interval)
             
             # Memory metrics
             memory = psutil.virtual_memory()
@@ -346,6 +413,38 @@ class MetricsCollector:
             logger.error(f"Failed to collect system metrics: {e}")
             raise
 
+    async def latest_metrics(self) -> SystemMetrics:
+        """
+        Get the latest system metrics snapshot.
+
+        Returns:
+            SystemMetrics object, at most ``sample_interval`` seconds old
+        """
+        if self.sample_interval <= 0:
+            return await asyncio.to_thread(self.collect_system_metrics)
+
+        if self._sampler is None or self._sampler.done():
+            self._sampler = asyncio.create_task(self._sample())
+        if self.snapshot is None:
+            self.snapshot = await asyncio.to_thread(self.collect_system_metrics)
+        return self.snapshot
+
+    async def _sample(self) -> None:
+        """Replace the snapshot every ``sample_interval`` seconds."""
+        while True:
+            await asyncio.sleep(self.sample_interval)
+            try:
+                # CPU usage is averaged over the time since the previous sample
+                self.snapshot = await asyncio.to_thread(self.collect_system_metrics, None)
+            except Exception:
+                pass  # Logged by collect_system_metrics; keep the last snapshot
+
+    async def stop_sampler(self) -> None:
+        """Stop the background sampler."""
+        if self._sampler is not None:
+            self._sampler.cancel()
+            self._sampler = None
+
     def get_metrics_history(self, hours: int = 1) -> List[SystemMetrics]:
         """
         Get metrics history for specified time period.
@@ -492,8 +591,11 @@ class AlertManager:
 
 
 # Global instances
-health_checker = HealthChecker()
-metrics_collector = MetricsCollector()
+health_checker = HealthChecker(
+    cache_ttl=settings.HEALTH_CHECK_CACHE_TTL_SECONDS,
+    check_timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS
+)
+metrics_collector = MetricsCollector(sample_interval=settings.METRICS_SAMPLE_INTERVAL_SECONDS)
 alert_manager = AlertManager()
 
 
@@ -508,7 +610,7 @@ async def get_system_health() -> Dict[str, Any]:
     health_results = await health_checker.run_all_checks()
     
     # Collect current metrics
-    current_metrics = metrics_collector.collect_system_metrics()
+    current_metrics = await metrics_collector.latest_metrics()
     
     # Check for alerts
     alerts = alert_manager.check_thresholds(current_metrics)
@@ -3,6 +3,7 @@ Security utilities for F2L Web Refactor.
 Handles password encryption/decryption and other security operations.
 """
 import base64
+import hashlib
 import logging
 from typing import Optional
 
@@ -99,6 +100,25 @@ def decrypt_password(encrypted_password: str) -> str:
     return get_security_manager().decrypt_password(encrypted_password)
 
 
+def secret_digest(secret: str) -> str:
+    """
+    Keyed digest of a secret, stored next to its ciphertext.
+
+    Fernet ciphertexts are randomized, so they cannot tell whether a
+    submitted secret equals the stored one; the digest can, without a
+    decryption. It is keyed with the encryption key so it cannot be
+    brute-forced from a database dump alone.
+
+    Args:
+        secret: Plain text secret
+
+    Returns:
+        32-character hex digest
+    """
+    key = settings.ENCRYPTION_KEY.encode() if isinstance(settings.ENCRYPTION_KEY, str) else settings.ENCRYPTION_KEY
+    return hashlib.blake2b(secret.encode(), key=key[:64], digest_size=16).hexdigest()
+
+
 def generate_encryption_key() -> str:
     """
     Generate new encryption key.
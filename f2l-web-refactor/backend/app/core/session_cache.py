@@ -0,0 +1,151 @@
+"""
+SessionCache - Redis cache of serialized sync session responses.
+
+Sessions are configuration rows that are read far more often than they are
+written. Their JSON bodies are cached in Redis, so every worker sees the
+same entries and a write through the API invalidates them for all workers.
+Redis errors are logged and treated as cache misses.
+"""
+from typing import Hashable, Optional, Tuple
+from uuid import UUID
+import logging
+
+import redis.asyncio as redis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bumped on every write; every key embeds it so entries from before a write
+# are never read again
+_VERSION_KEY = "sessions:version"
+
+# Seconds to wait on Redis before treating a call as a miss, so an
+# unreachable Redis that drops packets does not stall requests
+REDIS_TIMEOUT_SECONDS = 0.25
+
+
+class SessionCache:
+    """
+    TTL cache of session and session list bodies.
+
+    Every key is built under the current version, so invalidating every
+    session and page is one ``INCR`` instead of a ``SCAN``. Callers build
+    the key before reading the database and write under that same key: a
+    body read before a concurrent write then lands on a version nobody
+    reads any more instead of being served stale until it expires.
+
+    Key builders return None when caching is disabled or Redis cannot be
+    reached; the get and set methods treat a None key as a miss.
+    """
+
+    def __init__(self, url: str, ttl: int):
+        """
+        Initialize the cache.
+
+        Args:
+            url: Redis connection string
+            ttl: Seconds an entry is served from cache; 0 disables caching
+        """
+        self.url = url
+        self.ttl = ttl
+        self._client: Optional[redis.Redis] = None
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            self._client = redis.from_url(
+                self.url,
+                socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+                socket_timeout=REDIS_TIMEOUT_SECONDS
+            )
+        return self._client
+
+    async def _version(self) -> Optional[int]:
+        if self.ttl <= 0:
+            return None
+        try:
+            return int(await self.client.get(_VERSION_KEY) or 0)
+        except redis.RedisError as e:
+            logger.warning(f"Session cache read failed: {e}")
+            return None
+
+    async def session_key(self, session_id: UUID) -> Optional[str]:
+        """Build the key of a session under the current version."""
+        version = await self._version()
+        if version is None:
+            return None
+        return f"sessions:{version}:session:{session_id}"
+
+    async def list_key(self, query: Tuple[Hashable, ...]) -> Optional[str]:
+        """
+        Build the key of a list page under the current version.
+
+        Args:
+            query: Values that identify the page (filters, cursor, limit)
+        """
+        version = await self._version()
+        if version is None:
+            return None
+        return f"sessions:{version}:list:" + ":".join(map(str, query))
+
+    async def _get(self, key: Optional[str]) -> Optional[bytes]:
+        if key is None:
+            return None
+        try:
+            return await self.client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Session cache read failed: {e}")
+            return None
+
+    async def _set(self, key: Optional[str], value: bytes) -> None:
+        if key is None:
+            return
+        try:
+            await self.client.set(key, value, ex=self.ttl)
+        except redis.RedisError as e:
+            logger.warning(f"Session cache write failed: {e}")
+
+    async def get_session(self, key: Optional[str]) -> Optional[bytes]:
+        """Get a cached session body by its ``session_key``, or None."""
+        return await self._get(key)
+
+    async def set_session(self, key: Optional[str], body: bytes) -> None:
+        """Cache a session body under a key from ``session_key``."""
+        await self._set(key, body)
+
+    async def get_list(self, key: Optional[str]) -> Optional[Tuple[bytes, Optional[str]]]:
+        """
+        Get a cached list page by its ``list_key``.
+
+        Returns:
+            ``(body, next_cursor)`` or None
+        """
+        cached = await self._get(key)
+        if cached is None:
+            return None
+        # Stored as "<next cursor>|<body>"; cursors are URL-safe base64
+        next_cursor, body = cached.split(b"|", 1)
+        return body, next_cursor.decode() or None
+
+    async def set_list(self, key: Optional[str], body: bytes, next_cursor: Optional[str]) -> None:
+        """Cache a list page, with the cursor of the page after it, under a key from ``list_key``."""
+        await self._set(key, (next_cursor or "").encode() + b"|" + body)
+
+    async def invalidate(self) -> None:
+        """Drop every cached session and list page."""
+        if self.ttl <= 0:
+            return
+        try:
+            await self.client.incr(_VERSION_KEY)
+        except redis.RedisError as e:
+            logger.error(f"Session cache invalidation failed: {e}")
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+session_cache = SessionCache(settings.REDIS_URL, ttl=settings.SESSION_CACHE_TTL_SECONDS)
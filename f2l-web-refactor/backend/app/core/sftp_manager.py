@@ -6,6 +6,7 @@ from typing import List, Dict, Optional, Callable, Any
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import os
+import posixpath
 import stat
 import logging
 import asyncio
@@ -16,6 +17,8 @@ try:
 except ImportError:
     paramiko = None
 
+from app.core.listing_result import ListingResult
+
 logger = logging.getLogger(__name__)
 
 
@@ -235,22 +238,27 @@ class SFTPManager:
         remote_path: str = "/", 
         recursive: bool = False,
         max_depth: int = 5,
-        current_depth: int = 0
+        current_depth: int = 0,
+        max_items: Optional[int] = None
     ) -> List[SFTPFileInfo]:
         """
         List directory contents with optional recursion.
+
+        Returns a ListingResult (a list that also carries file/directory
+        totals); listing errors are logged and flagged as ``failed`` on it.
         
         Args:
             remote_path: Remote directory path to list
             recursive: If True, list recursively
             max_depth: Maximum recursion depth
             current_depth: Current recursion depth (internal)
+            max_items: Stop listing further directories once this many entries are collected
             
         Returns:
             List of SFTPFileInfo objects
         """
         if not self.ensure_connected():
-            return []
+            return ListingResult(failed=True)
 
         if recursive and current_depth >= max_depth:
             logger.warning(f"Maximum recursion depth ({max_depth}) reached for {remote_path}")
@@ -258,6 +266,7 @@ class SFTPManager:
 
         files = []
         directories = []
+        failed = False
 
         try:
             # Get directory listing with attributes
@@ -304,22 +313,32 @@ class SFTPManager:
             # Handle recursive listing
             if recursive:
                 for dirname in directories:
+                    if max_items is not None and len(files) >= max_items:
+                        break
                     subdir_path = f"{remote_path.rstrip('/')}/{dirname}"
                     try:
                         logger.debug(f"Recursing into: {subdir_path} (depth: {current_depth + 1})")
                         subdir_files = self.list_directory(
-                            subdir_path, recursive=True, max_depth=max_depth, current_depth=current_depth + 1
+                            subdir_path, recursive=True, max_depth=max_depth, current_depth=current_depth + 1,
+                            max_items=None if max_items is None else max_items - len(files)
                         )
                         files.extend(subdir_files)
+                        failed = failed or getattr(subdir_files, 'failed', False)
                     except Exception as e:
                         logger.error(f"Error recursing into {subdir_path}: {e}")
+                        failed = True
                         continue
 
         except Exception as e:
             logger.error(f"Error listing {remote_path}: {e}")
+            failed = True
 
         self.last_activity = datetime.now()
-        return files
+        if max_items is not None and len(files) > max_items:
+            files = files[:max_items]
+            return ListingResult(files, sum(1 for f in files if not f.is_file), failed)
+        # Recursive listings hold files only; otherwise every directory seen was added
+        return ListingResult(files, 0 if recursive else len(directories), failed)
 
     def get_file_info(self, remote_path: str) -> Optional[Dict[str, Any]]:
         """
@@ -360,6 +379,46 @@ class SFTPManager:
             logger.warning(f"Cannot get file info for {remote_path}: {e}")
             return None
 
+    def batch_get_file_info(self, remote_paths: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get metadata for many files with one listdir_attr per parent directory.
+
+        Args:
+            remote_paths: Remote file paths
+
+        Returns:
+            Dict mapping each path to its metadata (as get_file_info) or None if not found
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = dict.fromkeys(remote_paths)
+        if not remote_paths or not self.ensure_connected():
+            return results
+
+        by_parent: Dict[str, List[str]] = {}
+        for remote_path in remote_paths:
+            by_parent.setdefault(posixpath.dirname(remote_path) or "/", []).append(remote_path)
+
+        for parent, paths in by_parent.items():
+            try:
+                attrs = {item.filename: item for item in self.sftp_client.listdir_attr(parent)}
+            except Exception as e:
+                logger.warning(f"Cannot list {parent} for file info: {e}")
+                continue
+
+            for remote_path in paths:
+                item = attrs.get(posixpath.basename(remote_path))
+                if item is None:
+                    continue
+                results[remote_path] = {
+                    'path': remote_path,
+                    'size': item.st_size or 0,
+                    'modified': datetime.fromtimestamp(item.st_mtime, tz=timezone.utc) if item.st_mtime else None,
+                    'permissions': stat.filemode(item.st_mode) if item.st_mode else None,
+                    'exists': True
+                }
+
+        self.last_activity = datetime.now()
+        return results
+
     def download_file(
         self,
         remote_path: str,
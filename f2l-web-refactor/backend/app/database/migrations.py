@@ -0,0 +1,95 @@
+"""
+Alembic migration runner for application startup.
+
+Migrations can rewrite large tables, so they run in a worker thread and
+report progress through ``get_migration_status()`` instead of holding up
+the event loop.
+"""
+import asyncio
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+import logging
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+from app.config import settings
+from app.database.session import engine
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+
+# Outcome of the startup migration run: pending, running, completed, failed or skipped
+_migration_state: Dict[str, Optional[str]] = {"status": "pending", "error": None}
+
+
+def _alembic_config() -> Config:
+    """Build an Alembic config without alembic.ini so app logging is left alone."""
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    config.set_main_option("sqlalchemy.url", settings.DATABASE_URL.replace("%", "%%"))
+    return config
+
+
+@lru_cache(maxsize=1)
+def _head_revision() -> Optional[str]:
+    """Return the head revision of the migration scripts."""
+    return ScriptDirectory.from_config(_alembic_config()).get_current_head()
+
+
+def _upgrade_head() -> None:
+    command.upgrade(_alembic_config(), "head")
+
+
+async def run_migrations() -> bool:
+    """
+    Upgrade the database to the head revision.
+
+    Returns:
+        True if the upgrade succeeded
+    """
+    _migration_state.update(status="running", error=None)
+    logger.info("Running database migrations...")
+    try:
+        await asyncio.to_thread(_upgrade_head)
+    except Exception as e:
+        logger.exception(f"Database migrations failed: {e}")
+        _migration_state.update(status="failed", error=str(e))
+        return False
+
+    _migration_state["status"] = "completed"
+    logger.info("Database migrations completed")
+    return True
+
+
+def mark_migrations_skipped() -> None:
+    """Record that migrations are run outside the application."""
+    _migration_state.update(status="skipped", error=None)
+
+
+async def get_migration_status() -> Dict[str, Any]:
+    """
+    Get the startup migration status with current and head revisions.
+
+    Returns:
+        Dict with status, error, current_rev and head_rev
+    """
+    head_rev = await asyncio.to_thread(_head_revision)
+    try:
+        async with engine.connect() as conn:
+            current_rev = await conn.run_sync(
+                lambda sync_conn: MigrationContext.configure(sync_conn).get_current_revision()
+            )
+    except Exception as e:
+        logger.warning(f"Could not read current migration revision: {e}")
+        current_rev = None
+
+    return {
+        **_migration_state,
+        "current_rev": current_rev,
+        "head_rev": head_rev,
+    }
@@ -6,11 +6,11 @@ from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
     Column, String, Integer, BigInteger, Boolean, DateTime, Text, JSON, Float,
-    ForeignKey, Enum, Index, CheckConstraint, UniqueConstraint
+    ForeignKey, Enum, Index, CheckConstraint, UniqueConstraint, Identity
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 import uuid
 import enum
 
@@ -96,7 +96,7 @@ class Endpoint(Base):
     """
     __tablename__ = "endpoints"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     endpoint_type: Mapped[EndpointType] = mapped_column(Enum(EndpointType, values_callable=lambda x: [e.value for e in x]), nullable=False)
 
@@ -105,18 +105,21 @@ class Endpoint(Base):
     port: Mapped[Optional[int]] = mapped_column(Integer)
     username: Mapped[Optional[str]] = mapped_column(String(255))
     password_encrypted: Mapped[Optional[str]] = mapped_column(Text)  # Fernet encrypted
-    remote_path: Mapped[Optional[str]] = mapped_column(String(1024))
+    password_digest: Mapped[Optional[str]] = mapped_column(String(32))  # Keyed BLAKE2b, see secret_digest()
+    remote_path: Mapped[Optional[str]] = mapped_column(Text)
 
     # S3 Fields
     s3_bucket: Mapped[Optional[str]] = mapped_column(String(255))
     s3_region: Mapped[Optional[str]] = mapped_column(String(50))
     s3_access_key: Mapped[Optional[str]] = mapped_column(String(255))
     s3_secret_key_encrypted: Mapped[Optional[str]] = mapped_column(Text)  # Fernet encrypted
+    s3_secret_key_digest: Mapped[Optional[str]] = mapped_column(String(32))  # Keyed BLAKE2b, see secret_digest()
     s3_endpoint_url: Mapped[Optional[str]] = mapped_column(String(512))  # For S3-compatible services
     s3_use_ssl: Mapped[bool] = mapped_column(Boolean, default=True)
 
     # Local Fields
-    local_path: Mapped[Optional[str]] = mapped_column(String(1024))
+    local_path: Mapped[Optional[str]] = mapped_column(Text)
+    resolved_local_path: Mapped[Optional[str]] = mapped_column(Text)  # Absolute, see resolve_local_path()
 
     # Status & Monitoring
     connection_status: Mapped[str] = mapped_column(String(50), default="unknown")  # connected, disconnected, unknown
@@ -139,9 +142,10 @@ class Endpoint(Base):
 
     # Indexes
     __table_args__ = (
+        UniqueConstraint("name", name="uq_endpoint_name"),
         Index("idx_endpoint_type", "endpoint_type"),
         Index("idx_endpoint_status", "connection_status"),
-        Index("idx_endpoint_active", "is_active"),
+        Index("idx_endpoint_active", "id", postgresql_where=text("is_active = true")),
     )
 
     def __repr__(self):
@@ -154,7 +158,7 @@ class SyncSession(Base):
     """
     __tablename__ = "sync_sessions"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     name: Mapped[str] = mapped_column(String(255), nullable=False)
 
     # Endpoint References
@@ -162,8 +166,8 @@ class SyncSession(Base):
     destination_endpoint_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("endpoints.id", ondelete="CASCADE"))
 
     # Paths
-    source_path: Mapped[str] = mapped_column(String(1024), default="/")
-    destination_path: Mapped[str] = mapped_column(String(1024), default="/")
+    source_path: Mapped[str] = mapped_column(Text, default="/")
+    destination_path: Mapped[str] = mapped_column(Text, default="/")
 
     # Sync Configuration
     sync_direction: Mapped[SyncDirection] = mapped_column(Enum(SyncDirection, values_callable=lambda x: [e.value for e in x]), default=SyncDirection.SOURCE_TO_DEST)
@@ -207,9 +211,13 @@ class SyncSession(Base):
 
     # Indexes
     __table_args__ = (
-        Index("idx_session_active", "is_active"),
-        Index("idx_session_running", "is_running"),
+        UniqueConstraint("name", name="uq_session_name"),
+        Index("idx_session_active", "id", postgresql_where=text("is_active = true")),
+        Index("idx_session_created", "is_active", "created_at", "id"),
+        Index("idx_session_running", "id", postgresql_where=text("is_running = true")),
         Index("idx_session_schedule", "schedule_enabled", "next_run_at"),
+        Index("idx_session_folder_names", "folder_names", postgresql_using="gin", postgresql_ops={"folder_names": "jsonb_path_ops"}),
+        Index("idx_session_file_patterns", "file_patterns", postgresql_using="gin", postgresql_ops={"file_patterns": "jsonb_path_ops"}),
         CheckConstraint("source_endpoint_id != destination_endpoint_id", name="check_different_endpoints"),
     )
 
@@ -223,7 +231,7 @@ class SyncExecution(Base):
     """
     __tablename__ = "sync_executions"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     session_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("sync_sessions.id", ondelete="CASCADE"))
 
     # Execution Details
@@ -241,17 +249,17 @@ class SyncExecution(Base):
     files_synced: Mapped[int] = mapped_column(Integer, default=0)
     files_failed: Mapped[int] = mapped_column(Integer, default=0)
     files_skipped: Mapped[int] = mapped_column(Integer, default=0)
-    bytes_transferred: Mapped[int] = mapped_column(Integer, default=0)
+    bytes_transferred: Mapped[int] = mapped_column(BigInteger, default=0)  # bytes
     progress_percentage: Mapped[float] = mapped_column(Float, default=0.0)
 
     # Current State
-    current_file: Mapped[Optional[str]] = mapped_column(String(1024))
+    current_file: Mapped[Optional[str]] = mapped_column(Text)
     current_operation: Mapped[Optional[str]] = mapped_column(String(50))
 
     # Results
     error_message: Mapped[Optional[str]] = mapped_column(Text)
     error_stack_trace: Mapped[Optional[str]] = mapped_column(Text)
-    summary: Mapped[Optional[dict]] = mapped_column(JSONB)  # JSON summary of execution
+    summary: Mapped[Optional[dict]] = mapped_column(JSON)  # JSON summary of execution
 
     # Celery Task
     celery_task_id: Mapped[Optional[str]] = mapped_column(String(255))
@@ -264,8 +272,9 @@ class SyncExecution(Base):
     # Indexes
     __table_args__ = (
         Index("idx_execution_status", "status"),
-        Index("idx_execution_session", "session_id", "queued_at"),
+        Index("idx_execution_session", "session_id", text("queued_at DESC"), postgresql_include=["status", "duration_seconds", "files_synced", "bytes_transferred"]),
         Index("idx_execution_celery_task", "celery_task_id"),
+        Index("idx_execution_queued", "queued_at", "id"),
     )
 
     def __repr__(self):
@@ -278,17 +287,17 @@ class SyncOperation(Base):
     """
     __tablename__ = "sync_operations"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    execution_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("sync_executions.id", ondelete="CASCADE"))
+    id: Mapped[int] = mapped_column(BigInteger, Identity(always=True), primary_key=True)  # Sequential, high-volume table
+    execution_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("sync_executions.id", ondelete="CASCADE", deferrable=True, initially="DEFERRED"))
 
     # Operation Details
     operation_type: Mapped[OperationType] = mapped_column(Enum(OperationType, values_callable=lambda x: [e.value for e in x]))
     status: Mapped[OperationStatus] = mapped_column(Enum(OperationStatus, values_callable=lambda x: [e.value for e in x]), default=OperationStatus.PENDING)
 
     # File Details
-    source_path: Mapped[str] = mapped_column(String(1024))
-    destination_path: Mapped[str] = mapped_column(String(1024))
-    file_size: Mapped[int] = mapped_column(Integer, default=0)
+    source_path: Mapped[str] = mapped_column(Text)
+    destination_path: Mapped[str] = mapped_column(Text)
+    file_size: Mapped[int] = mapped_column(BigInteger, default=0)  # bytes
     file_modified_time: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # Execution
@@ -297,7 +306,7 @@ class SyncOperation(Base):
     duration_ms: Mapped[Optional[int]] = mapped_column(Integer)  # Milliseconds
 
     # Result
-    bytes_transferred: Mapped[int] = mapped_column(Integer, default=0)
+    bytes_transferred: Mapped[int] = mapped_column(BigInteger, default=0)  # bytes
     error_message: Mapped[Optional[str]] = mapped_column(Text)
 
     # Relationships
@@ -319,7 +328,7 @@ class Log(Base):
     """
     __tablename__ = "logs"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[int] = mapped_column(BigInteger, Identity(always=True), primary_key=True)  # Sequential, high-volume table
 
     # Log Details
     level: Mapped[LogLevel] = mapped_column(Enum(LogLevel, values_callable=lambda x: [e.value for e in x]), default=LogLevel.INFO)
@@ -327,15 +336,15 @@ class Log(Base):
     logger_name: Mapped[Optional[str]] = mapped_column(String(255))
 
     # Context
-    execution_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("sync_executions.id", ondelete="CASCADE"))
+    execution_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("sync_executions.id", ondelete="CASCADE", deferrable=True, initially="DEFERRED"))
     session_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True))
     endpoint_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True))
 
     # Extra Data
     extra_data: Mapped[Optional[dict]] = mapped_column(JSONB)
 
-    # Timing
-    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Timing (part of the primary key because logs is partitioned by it)
+    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True, server_default=func.now())
 
     # Relationships
     execution: Mapped[Optional["SyncExecution"]] = relationship("SyncExecution", back_populates="logs")
@@ -343,9 +352,10 @@ class Log(Base):
     # Indexes
     __table_args__ = (
         Index("idx_log_level", "level"),
-        Index("idx_log_timestamp", "timestamp"),
+        Index("idx_log_timestamp", "timestamp", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
         Index("idx_log_execution", "execution_id"),
         Index("idx_log_session", "session_id"),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
     )
 
     def __repr__(self):
@@ -358,16 +368,16 @@ class ScanCache(Base):
     """
     __tablename__ = "scan_cache"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
 
     # Cache Key
     endpoint_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("endpoints.id", ondelete="CASCADE"))
-    path: Mapped[str] = mapped_column(String(1024))
+    path: Mapped[str] = mapped_column(Text)
 
     # Cache Data
-    file_list: Mapped[dict] = mapped_column(JSONB)  # Cached file listing
+    file_list: Mapped[dict] = mapped_column(JSON)  # Cached file listing
     total_files: Mapped[int] = mapped_column(Integer, default=0)
-    total_size: Mapped[int] = mapped_column(Integer, default=0)
+    total_size: Mapped[int] = mapped_column(BigInteger, default=0)  # bytes
 
     # Metadata
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -378,6 +388,7 @@ class ScanCache(Base):
     __table_args__ = (
         UniqueConstraint("endpoint_id", "path", name="uq_scan_cache_endpoint_path"),
         Index("idx_scan_cache_expires", "expires_at", "is_valid"),
+        {"prefixes": ["UNLOGGED"]},  # Rebuildable cache, not WAL-logged
     )
 
     def __repr__(self):
@@ -413,7 +424,7 @@ class ShotStructureCache(Base):
     """
     __tablename__ = "shot_structure_cache"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     endpoint_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("endpoints.id", ondelete="CASCADE"))
 
     # Shot hierarchy
@@ -433,11 +444,9 @@ class ShotStructureCache(Base):
 
     # Indexes
     __table_args__ = (
-        Index("idx_shot_structure_lookup", "endpoint_id", "episode", "sequence", "shot"),
-        Index("idx_shot_structure_episode", "endpoint_id", "episode"),
-        Index("idx_shot_structure_sequence", "endpoint_id", "episode", "sequence"),
         Index("idx_shot_cache_expiry", "cache_expires_at"),
         UniqueConstraint("endpoint_id", "episode", "sequence", "shot", name="uq_shot_structure"),
+        {"prefixes": ["UNLOGGED"]},  # Rebuildable cache, not WAL-logged
     )
 
     def __repr__(self):
@@ -450,7 +459,7 @@ class ShotCacheMetadata(Base):
     """
     __tablename__ = "shot_cache_metadata"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     endpoint_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("endpoints.id", ondelete="CASCADE"), unique=True)
 
     # Scan timestamps
@@ -469,7 +478,6 @@ class ShotCacheMetadata(Base):
 
     # Indexes
     __table_args__ = (
-        Index("idx_shot_cache_endpoint", "endpoint_id"),
         Index("idx_shot_cache_next_scan", "next_full_scan"),
     )
 
@@ -493,7 +501,7 @@ class ShotDownloadTask(Base):
     """
     __tablename__ = "shot_download_tasks"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     endpoint_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("endpoints.id", ondelete="CASCADE"))
 
@@ -553,8 +561,8 @@ class ShotDownloadItem(Base):
     """
     __tablename__ = "shot_download_items"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    task_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("shot_download_tasks.id", ondelete="CASCADE"))
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
+    task_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("shot_download_tasks.id", ondelete="CASCADE", deferrable=True, initially="DEFERRED"))
 
     # Shot information
     episode: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -638,7 +646,7 @@ class ShotUploadTask(Base):
     """
     __tablename__ = "shot_upload_tasks"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v7())  # Time-ordered UUIDv7
     name: Mapped[str] = mapped_column(String(255), nullable=False)
 
     # Single endpoint with both local_path (source) and remote_path (target)
@@ -648,11 +656,11 @@ class ShotUploadTask(Base):
     status: Mapped[ShotUploadTaskStatus] = mapped_column(Enum(ShotUploadTaskStatus, values_callable=lambda x: [e.value for e in x]), default=ShotUploadTaskStatus.PENDING)
 
     # Version Control
-    version_strategy: Mapped[str] = mapped_column(String(20), default='latest')  # 'latest', 'specific', 'all', 'custom'
+    version_strategy: Mapped[str] = mapped_column(Enum('latest', 'specific', 'all', 'custom', name='uploadversionstrategy'), default='latest')
     specific_version: Mapped[Optional[str]] = mapped_column(String(20))  # Used when version_strategy = 'specific'
 
     # File Conflict Handling
-    conflict_strategy: Mapped[str] = mapped_column(String(20), default='skip')  # 'skip', 'overwrite'
+    conflict_strategy: Mapped[str] = mapped_column(Enum('skip', 'overwrite', name='uploadconflictstrategy'), default='skip')
 
     # Progress tracking
     total_items: Mapped[int] = mapped_column(Integer, default=0)
@@ -680,7 +688,7 @@ class ShotUploadTask(Base):
     # Indexes
     __table_args__ = (
         Index("idx_shot_upload_task_endpoint", "endpoint_id"),
-        Index("idx_shot_upload_task_status", "status"),
+        Index("idx_shot_upload_task_status_active", "status", "created_at", postgresql_where=text("status IN ('pending', 'running')")),
         Index("idx_shot_upload_task_created", "created_at"),
     )
 
@@ -694,7 +702,7 @@ class ShotUploadItem(Base):
     """
     __tablename__ = "shot_upload_items"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v7())  # Time-ordered UUIDv7
     task_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("shot_upload_tasks.id", ondelete="CASCADE"))
 
     # Shot information
@@ -735,9 +743,9 @@ class ShotUploadItem(Base):
 
     # Indexes
     __table_args__ = (
-        Index("idx_shot_upload_item_task", "task_id"),
-        Index("idx_shot_upload_item_status", "status"),
+        Index("idx_shot_upload_item_task_status", "task_id", "status", postgresql_include=["file_size", "uploaded_size"]),
         Index("idx_shot_upload_item_shot", "episode", "sequence", "shot"),
+        Index("idx_shot_upload_item_active", "task_id", "episode", "sequence", "shot", postgresql_where=text("status IN ('pending', 'uploading')")),
     )
 
     def __repr__(self):
@@ -750,7 +758,7 @@ class ShotUploadHistory(Base):
     """
     __tablename__ = "shot_upload_history"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v7())  # Time-ordered UUIDv7
 
     # Link to original task/item (may be null if task deleted)
     task_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True))
@@ -777,21 +785,22 @@ class ShotUploadHistory(Base):
     target_endpoint_name: Mapped[str] = mapped_column(String(255), nullable=False)
 
     # Result
-    status: Mapped[str] = mapped_column(String(20), nullable=False)  # 'completed', 'failed', 'skipped'
+    status: Mapped[ShotUploadItemStatus] = mapped_column(Enum(ShotUploadItemStatus, values_callable=lambda x: [e.value for e in x]), nullable=False)  # completed, failed or skipped
     error_message: Mapped[Optional[str]] = mapped_column(Text)
 
-    # Timestamps
-    uploaded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Timestamps (part of the primary key because the table is partitioned by it)
+    uploaded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True, server_default=func.now())
 
     # User info
     uploaded_by: Mapped[Optional[str]] = mapped_column(String(255))
 
     # Indexes
     __table_args__ = (
-        Index("idx_upload_history_task", "task_id"),
+        Index("idx_upload_history_task_status", "task_id", "status"),
         Index("idx_upload_history_shot", "episode", "sequence", "shot"),
         Index("idx_upload_history_date", "uploaded_at"),
         Index("idx_upload_history_status", "status"),
+        {"postgresql_partition_by": "RANGE (uploaded_at)"},
     )
 
     def __repr__(self):
@@ -804,7 +813,7 @@ class User(Base):
     """
     __tablename__ = "users"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[Optional[str]] = mapped_column(String(255))
@@ -819,8 +828,7 @@ class User(Base):
 
     # Indexes
     __table_args__ = (
-        Index("idx_user_email", "email"),
-        Index("idx_user_active", "is_active"),
+        Index("idx_user_active", "id", postgresql_where=text("is_active = true")),
     )
 
     def __repr__(self):
@@ -3,6 +3,7 @@ F2L Sync - Main FastAPI Application
 S3-enabled file sync service with web dashboard
 """
 from contextlib import asynccontextmanager
+import asyncio
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
@@ -12,6 +13,10 @@ import logging
 import time
 
 from app.config import settings
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.core.monitoring import metrics_collector
+from app.core.session_cache import session_cache
+from app.database.migrations import get_migration_status, mark_migrations_skipped, run_migrations
 from app.api.v1 import endpoints, sessions, executions, logs, settings as settings_api, auth, browse, shots, uploads
 
 # Configure logging
@@ -33,6 +38,16 @@ async def lifespan(app: FastAPI):
     logger.info(f"Environment: {settings.APP_ENV}")
     logger.info(f"Debug mode: {settings.DEBUG}")
 
+    # Migrations may rewrite large tables; in async mode they run in the
+    # background so the app (and /health) is up immediately.
+    if settings.MIGRATION_MODE == "sync":
+        if not await run_migrations():
+            raise RuntimeError("Database migrations failed")
+    elif settings.MIGRATION_MODE == "async":
+        app.state.migration_task = asyncio.create_task(run_migrations())
+    else:
+        mark_migrations_skipped()
+
     # TODO: Initialize database connection
     # TODO: Initialize Redis connection
     # TODO: Start background health monitors
@@ -41,6 +56,9 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down application")
+    await browse.manager_pool.close_all()
+    await metrics_collector.stop_sampler()
+    await session_cache.close()
     # TODO: Close database connections
     # TODO: Close Redis connections
 
@@ -66,6 +84,7 @@ app.add_middleware(
     allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
     allow_methods=settings.CORS_ALLOW_METHODS,
     allow_headers=settings.CORS_ALLOW_HEADERS,
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # GZip Compression
@@ -114,6 +133,13 @@ async def health_check():
     }
 
 
+# Migration status endpoint
+@app.get("/health/migration", tags=["health"])
+async def migration_status():
+    """Startup migration status with current and head revisions."""
+    return await get_migration_status()
+
+
 # Root endpoint
 @app.get("/", tags=["root"])
 async def root():
@@ -199,5 +225,8 @@ if __name__ == "__main__":
         port=8000,
         reload=settings.DEBUG,
         workers=1 if settings.DEBUG else settings.WORKERS,
-        log_level=settings.LOG_LEVEL.lower()
+        log_level=settings.LOG_LEVEL.lower(),
+        loop="uvloop",
+        http="httptools",
+        timeout_keep_alive=75
     )
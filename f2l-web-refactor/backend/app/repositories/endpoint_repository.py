@@ -1,13 +1,41 @@
 """
 Endpoint Repository - Database operations for endpoint management.
 """
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
+import time
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
 
 from app.database.models import Endpoint, EndpointType
-from app.core.security import decrypt_password
+from app.core.security import decrypt_password, encrypt_password, secret_digest
+
+# Decrypted endpoint data for interactive browsing: endpoint_id -> (expires_at, data)
+DECRYPTED_CACHE_TTL = 60.0
+DECRYPTED_CACHE_MAX_SIZE = 512
+_decrypted_cache: Dict[UUID, Tuple[float, dict]] = {}
+_decrypted_cache_stats = {"hits": 0, "misses": 0}
+
+
+def invalidate_decrypted_cache(endpoint_id: Optional[UUID] = None) -> None:
+    """Drop cached decrypted data for one endpoint, or for all if None."""
+    if endpoint_id is None:
+        _decrypted_cache.clear()
+    else:
+        _decrypted_cache.pop(endpoint_id, None)
+
+
+def get_decrypted_cache_stats() -> dict:
+    """Get hit/miss counters and hit ratio of the decrypted endpoint cache."""
+    hits = _decrypted_cache_stats["hits"]
+    lookups = hits + _decrypted_cache_stats["misses"]
+    return {
+        **_decrypted_cache_stats,
+        "size": len(_decrypted_cache),
+        "hit_ratio": hits / lookups if lookups else 0.0,
+    }
 
 
 class EndpointRepository:
@@ -22,16 +50,18 @@ class EndpointRepository:
         endpoint_type: Optional[EndpointType] = None,
         active_only: bool = True,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Endpoint]:
         """
-        Get all endpoints with optional filtering.
+        Get all endpoints with optional filtering, oldest first.
 
         Args:
             endpoint_type: Filter by endpoint type
             active_only: Only return active endpoints
-            skip: Number of records to skip
+            skip: Number of records to skip (deprecated, use ``after``)
             limit: Maximum number of records to return
+            after: ``(created_at, id)`` of the last endpoint of the previous page
 
         Returns:
             List of Endpoint objects
@@ -44,7 +74,10 @@ class EndpointRepository:
         if active_only:
             query = query.filter(Endpoint.is_active == True)
 
-        query = query.offset(skip).limit(limit)
+        if after:
+            query = query.filter(tuple_(Endpoint.created_at, Endpoint.id) > after)
+
+        query = query.order_by(Endpoint.created_at, Endpoint.id).offset(skip).limit(limit)
         result = await self.db.execute(query)
         return result.scalars().all()
 
@@ -92,13 +125,45 @@ class EndpointRepository:
         await self.db.refresh(endpoint)
         return endpoint
 
-    async def update(self, endpoint_id: UUID, update_data: dict) -> Optional[Endpoint]:
+    async def create_if_absent(self, endpoint_data: dict) -> Optional[Endpoint]:
+        """
+        Create new endpoint unless one with the same name exists.
+
+        The name check and the insert are a single statement, so concurrent
+        creates with the same name cannot both succeed.
+
+        Args:
+            endpoint_data: Dictionary with endpoint data
+
+        Returns:
+            Created Endpoint object or None if the name is taken
+        """
+        stmt = (
+            insert(Endpoint)
+            .values(**endpoint_data)
+            .on_conflict_do_nothing(index_elements=['name'])
+            .returning(Endpoint)
+        )
+        result = await self.db.execute(stmt)
+        endpoint = result.scalar_one_or_none()
+        await self.db.commit()
+        return endpoint
+
+    async def update(
+        self,
+        endpoint_id: UUID,
+        update_data: dict,
+        secrets: Optional[Dict[str, str]] = None
+    ) -> Optional[Endpoint]:
         """
         Update endpoint.
 
         Args:
             endpoint_id: Endpoint UUID
             update_data: Dictionary with fields to update
+            secrets: Plain text secrets by field (``password``, ``s3_secret_key``);
+                each is encrypted into ``<field>_encrypted`` unless its digest
+                shows it is unchanged
 
         Returns:
             Updated Endpoint object or None if not found
@@ -111,7 +176,20 @@ class EndpointRepository:
             if hasattr(endpoint, field):
                 setattr(endpoint, field, value)
 
+        for field in ('password', 's3_secret_key'):
+            if f'{field}_encrypted' in update_data and f'{field}_digest' not in update_data:
+                # Ciphertext written directly; its digest no longer matches
+                setattr(endpoint, f'{field}_digest', None)
+
+        for field, plaintext in (secrets or {}).items():
+            digest = secret_digest(plaintext)
+            if getattr(endpoint, f'{field}_digest') == digest:
+                continue
+            setattr(endpoint, f'{field}_encrypted', encrypt_password(plaintext))
+            setattr(endpoint, f'{field}_digest', digest)
+
         await self.db.commit()
+        invalidate_decrypted_cache(endpoint_id)
         await self.db.refresh(endpoint)
         return endpoint
 
@@ -131,6 +209,7 @@ class EndpointRepository:
 
         await self.db.delete(endpoint)
         await self.db.commit()
+        invalidate_decrypted_cache(endpoint_id)
         return True
 
     async def update_connection_status(
@@ -150,19 +229,23 @@ class EndpointRepository:
         Returns:
             Updated Endpoint object or None if not found
         """
-        from datetime import datetime
-
-        endpoint = await self.get_by_id(endpoint_id)
-        if not endpoint:
-            return None
-
-        endpoint.connection_status = status
-        endpoint.last_health_check = datetime.utcnow()
+        values = {
+            'connection_status': status,
+            'last_health_check': datetime.utcnow(),
+        }
         if message:
-            endpoint.health_check_message = message
-
+            values['health_check_message'] = message
+
+        # One UPDATE ... RETURNING instead of load, flush and refresh
+        stmt = (
+            update(Endpoint)
+            .where(Endpoint.id == endpoint_id)
+            .values(**values)
+            .returning(Endpoint)
+        )
+        result = await self.db.execute(stmt)
+        endpoint = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(endpoint)
         return endpoint
 
     async def get_active_by_type(self, endpoint_type: EndpointType) -> List[Endpoint]:
@@ -229,6 +312,7 @@ class EndpointRepository:
             'username': endpoint.username,
             'remote_path': endpoint.remote_path,
             'local_path': endpoint.local_path,
+            'resolved_local_path': endpoint.resolved_local_path,
             's3_bucket': endpoint.s3_bucket,
             's3_region': endpoint.s3_region,
             's3_access_key': endpoint.s3_access_key,
@@ -252,6 +336,41 @@ class EndpointRepository:
 
         return endpoint_dict
 
+    async def get_with_decrypted_password_cached(self, endpoint_id: UUID) -> Optional[dict]:
+        """
+        Get endpoint with decrypted password, cached for ``DECRYPTED_CACHE_TTL`` seconds.
+
+        For hot read paths such as directory browsing. Entries are dropped by
+        ``update()`` and ``delete()``; other writers may be seen up to one TTL late.
+
+        Args:
+            endpoint_id: Endpoint UUID
+
+        Returns:
+            Copy of the endpoint data with decrypted password, or None if not found
+        """
+        now = time.monotonic()
+        cached = _decrypted_cache.get(endpoint_id)
+        if cached and cached[0] > now:
+            _decrypted_cache_stats["hits"] += 1
+            return dict(cached[1])
+
+        _decrypted_cache_stats["misses"] += 1
+        endpoint_dict = await self.get_with_decrypted_password(endpoint_id)
+        if endpoint_dict is None:
+            _decrypted_cache.pop(endpoint_id, None)
+            return None
+
+        if len(_decrypted_cache) >= DECRYPTED_CACHE_MAX_SIZE:
+            # Drop expired entries first, then the oldest inserted
+            for key in [k for k, (expires_at, _) in _decrypted_cache.items() if expires_at <= now]:
+                del _decrypted_cache[key]
+            while len(_decrypted_cache) >= DECRYPTED_CACHE_MAX_SIZE:
+                del _decrypted_cache[next(iter(_decrypted_cache))]
+
+        _decrypted_cache[endpoint_id] = (now + DECRYPTED_CACHE_TTL, endpoint_dict)
+        return dict(endpoint_dict)
+
     async def count_by_type(self) -> dict:
         """
         Count endpoints by type.
@@ -301,7 +420,7 @@ class EndpointRepository:
         Returns:
             List of recently updated Endpoint objects
         """
-        from datetime import datetime, timedelta
+        from datetime import timedelta
 
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
 
@@ -323,9 +442,6 @@ class EndpointRepository:
         Returns:
             Number of updated endpoints
         """
-        from datetime import datetime
-        from sqlalchemy import update
-
         stmt = update(Endpoint).where(
             Endpoint.id.in_(endpoint_ids)
         ).values(
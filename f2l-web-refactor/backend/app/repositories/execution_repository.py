@@ -1,14 +1,17 @@
 """
 Execution Repository - Database operations for sync execution management.
 """
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, or_, desc, func, select
+from sqlalchemy import and_, or_, desc, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
 from datetime import datetime, timedelta
 
 from app.database.models import SyncExecution, SyncOperation, ExecutionStatus, OperationType
 
+CANCELLABLE_STATUSES = (ExecutionStatus.QUEUED, ExecutionStatus.RUNNING)
+
 
 class ExecutionRepository:
     """Repository for sync execution database operations."""
@@ -22,16 +25,18 @@ class ExecutionRepository:
         session_id: Optional[UUID] = None,
         status: Optional[ExecutionStatus] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[SyncExecution]:
         """
-        Get all sync executions with optional filtering.
+        Get all sync executions with optional filtering, newest first.
 
         Args:
             session_id: Filter by session ID
             status: Filter by execution status
-            skip: Number of records to skip
+            skip: Number of records to skip (deprecated, use ``after``)
             limit: Maximum number of records to return
+            after: ``(queued_at, id)`` of the last execution of the previous page
 
         Returns:
             List of SyncExecution objects
@@ -44,7 +49,12 @@ class ExecutionRepository:
         if status:
             query = query.filter(SyncExecution.status == status)
 
-        query = query.order_by(desc(SyncExecution.queued_at)).offset(skip).limit(limit)
+        if after:
+            query = query.filter(tuple_(SyncExecution.queued_at, SyncExecution.id) < after)
+
+        query = query.order_by(
+            desc(SyncExecution.queued_at), desc(SyncExecution.id)
+        ).offset(skip).limit(limit)
         result = await self.db.execute(query)
         return result.scalars().all()
 
@@ -152,6 +162,43 @@ class ExecutionRepository:
         Returns:
             List of SyncOperation objects
         """
+        query = self._operations_query(execution_id, operation_type, success_only)
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
+    async def iter_execution_operations(
+        self,
+        execution_id: UUID,
+        operation_type: Optional[OperationType] = None,
+        success_only: Optional[bool] = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[SyncOperation]:
+        """
+        Iterate over the operations of an execution from a server-side cursor.
+
+        Rows are fetched ``batch_size`` at a time, so memory use does not grow
+        with the number of operations.
+
+        Args:
+            execution_id: Execution UUID
+            operation_type: Filter by operation type
+            success_only: Filter by success status
+            batch_size: Rows fetched per round-trip
+
+        Yields:
+            SyncOperation objects in the order of ``get_execution_operations``
+        """
+        query = self._operations_query(execution_id, operation_type, success_only)
+        result = await self.db.stream(query.execution_options(yield_per=batch_size))
+        async for operation in result.scalars():
+            yield operation
+
+    @staticmethod
+    def _operations_query(
+        execution_id: UUID,
+        operation_type: Optional[OperationType],
+        success_only: Optional[bool]
+    ):
         query = select(SyncOperation).filter(
             SyncOperation.execution_id == execution_id
         )
@@ -162,9 +209,7 @@ class ExecutionRepository:
         if success_only is not None:
             query = query.filter(SyncOperation.success == success_only)
 
-        query = query.order_by(SyncOperation.started_at)
-        result = await self.db.execute(query)
-        return result.scalars().all()
+        return query.order_by(SyncOperation.started_at)
 
     async def get_execution_statistics(self, execution_id: UUID) -> Dict[str, Any]:
         """
@@ -340,28 +385,92 @@ class ExecutionRepository:
         # For now, return empty list as placeholder
         return []
 
-    async def cancel_execution(self, execution_id: UUID) -> bool:
+    async def cancel_execution(self, execution_id: UUID) -> Optional[SyncExecution]:
         """
         Cancel a running execution.
-        
+
+        The status check and the update are a single conditional UPDATE, so
+        an execution that finishes concurrently is never marked cancelled.
+
         Args:
             execution_id: Execution UUID
-            
+
         Returns:
-            True if cancelled, False if not found or not cancellable
+            Cancelled SyncExecution or None if not found or not cancellable
         """
-        execution = await self.get_by_id(execution_id)
-        if not execution:
-            return False
-        
-        if execution.status not in [ExecutionStatus.QUEUED, ExecutionStatus.RUNNING, ExecutionStatus.PAUSED]:
-            return False
-        
-        execution.status = ExecutionStatus.CANCELLED
-        execution.completed_at = datetime.utcnow()
-        
-        await self.db.flush()
-        return True
+        stmt = (
+            update(SyncExecution)
+            .where(
+                SyncExecution.id == execution_id,
+                SyncExecution.status.in_(CANCELLABLE_STATUSES)
+            )
+            .values(status=ExecutionStatus.CANCELLED, completed_at=datetime.utcnow())
+            .returning(SyncExecution)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def start_execution(self, execution_data: dict) -> Optional[SyncExecution]:
+        """
+        Mark an execution running, creating it if it was never queued.
+
+        Executions started from the API are inserted as QUEUED before their
+        task is published; scheduled runs have no row yet. Claiming the row
+        and inserting it are a single statement, and only a QUEUED row is
+        claimed, so an execution cancelled while queued is never started.
+
+        Args:
+            execution_data: Dictionary with execution data, including ``id``
+
+        Returns:
+            Running SyncExecution or None if it is no longer queued
+        """
+        execution_data = {**execution_data, 'status': ExecutionStatus.RUNNING}
+        stmt = (
+            insert(SyncExecution)
+            .values(**execution_data)
+            .on_conflict_do_update(
+                index_elements=['id'],
+                set_={
+                    field: value for field, value in execution_data.items()
+                    if field in ('status', 'started_at', 'celery_task_id')
+                },
+                where=SyncExecution.status == ExecutionStatus.QUEUED
+            )
+            .returning(SyncExecution)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def update_if_active(self, execution_id: UUID, update_data: dict) -> Optional[SyncExecution]:
+        """
+        Update an execution that is still queued or running.
+
+        The status check and the update are a single conditional UPDATE, so
+        a worker finishing a run never overwrites a concurrent cancellation.
+
+        Args:
+            execution_id: Execution UUID
+            update_data: Dictionary with fields to update
+
+        Returns:
+            Updated SyncExecution or None if not found or already finished
+        """
+        values = {
+            field: value for field, value in update_data.items()
+            if field in SyncExecution.__table__.c
+        }
+        stmt = (
+            update(SyncExecution)
+            .where(
+                SyncExecution.id == execution_id,
+                SyncExecution.status.in_(CANCELLABLE_STATUSES)
+            )
+            .values(**values)
+            .returning(SyncExecution)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def get_active_executions_count(self) -> int:
         """
@@ -64,12 +64,12 @@ class LogRepository:
         result = await query.offset(skip).limit(limit).all()
         return result
 
-    async def get_by_id(self, log_id: UUID) -> Optional[Log]:
+    async def get_by_id(self, log_id: int) -> Optional[Log]:
         """
         Get log entry by ID.
         
         Args:
-            log_id: Log UUID
+            log_id: Log ID
             
         Returns:
             Log object or None if not found
@@ -116,12 +116,12 @@ class LogRepository:
         
         return logs
 
-    async def delete(self, log_id: UUID) -> bool:
+    async def delete(self, log_id: int) -> bool:
         """
         Delete log entry.
         
         Args:
-            log_id: Log UUID
+            log_id: Log ID
             
         Returns:
             True if deleted, False if not found
@@ -53,12 +53,12 @@ class OperationRepository:
         result = await query.offset(skip).limit(limit).all()
         return result
 
-    async def get_by_id(self, operation_id: UUID) -> Optional[SyncOperation]:
+    async def get_by_id(self, operation_id: int) -> Optional[SyncOperation]:
         """
         Get sync operation by ID.
         
         Args:
-            operation_id: Operation UUID
+            operation_id: Operation ID
             
         Returns:
             SyncOperation object or None if not found
@@ -105,12 +105,12 @@ class OperationRepository:
         
         return operations
 
-    async def update(self, operation_id: UUID, update_data: dict) -> Optional[SyncOperation]:
+    async def update(self, operation_id: int, update_data: dict) -> Optional[SyncOperation]:
         """
         Update sync operation.
         
         Args:
-            operation_id: Operation UUID
+            operation_id: Operation ID
             update_data: Dictionary with fields to update
             
         Returns:
@@ -128,12 +128,12 @@ class OperationRepository:
         await self.db.refresh(operation)
         return operation
 
-    async def delete(self, operation_id: UUID) -> bool:
+    async def delete(self, operation_id: int) -> bool:
         """
         Delete sync operation.
         
         Args:
-            operation_id: Operation UUID
+            operation_id: Operation ID
             
         Returns:
             True if deleted, False if not found
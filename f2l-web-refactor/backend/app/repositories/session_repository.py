@@ -1,10 +1,12 @@
 """
 Session Repository - Database operations for sync session management.
 """
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, or_, delete, desc, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
 
 from app.database.models import SyncSession, SyncExecution, ExecutionStatus
 
@@ -20,15 +22,17 @@ class SessionRepository:
         self,
         active_only: bool = True,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[SyncSession]:
         """
-        Get all sync sessions with optional filtering.
+        Get all sync sessions with optional filtering, newest first.
 
         Args:
             active_only: Only return active sessions
-            skip: Number of records to skip
+            skip: Number of records to skip (deprecated, use ``after``)
             limit: Maximum number of records to return
+            after: ``(created_at, id)`` of the last session of the previous page
 
         Returns:
             List of SyncSession objects
@@ -38,7 +42,12 @@ class SessionRepository:
         if active_only:
             query = query.filter(SyncSession.is_active == True)
 
-        query = query.offset(skip).limit(limit)
+        if after:
+            query = query.filter(tuple_(SyncSession.created_at, SyncSession.id) < after)
+
+        query = query.order_by(
+            desc(SyncSession.created_at), desc(SyncSession.id)
+        ).offset(skip).limit(limit)
         result = await self.db.execute(query)
         return result.scalars().all()
 
@@ -86,6 +95,30 @@ class SessionRepository:
         await self.db.refresh(session)
         return session
 
+    async def create_if_absent(self, session_data: dict) -> Optional[SyncSession]:
+        """
+        Create new sync session unless one with the same name exists.
+
+        The name check and the insert are a single statement, so concurrent
+        creates with the same name cannot both succeed.
+
+        Args:
+            session_data: Dictionary with session data
+
+        Returns:
+            Created SyncSession object or None if the name is taken
+        """
+        stmt = (
+            insert(SyncSession)
+            .values(**session_data)
+            .on_conflict_do_nothing(index_elements=['name'])
+            .returning(SyncSession)
+        )
+        result = await self.db.execute(stmt)
+        session = result.scalar_one_or_none()
+        await self.db.commit()
+        return session
+
     async def update(self, session_id: UUID, update_data: dict) -> Optional[SyncSession]:
         """
         Update sync session.
@@ -97,16 +130,23 @@ class SessionRepository:
         Returns:
             Updated SyncSession object or None if not found
         """
-        session = await self.get_by_id(session_id)
-        if not session:
-            return None
-
-        for field, value in update_data.items():
-            if hasattr(session, field):
-                setattr(session, field, value)
-
+        values = {
+            field: value for field, value in update_data.items()
+            if hasattr(SyncSession, field)
+        }
+        if not values:
+            return await self.get_by_id(session_id)
+
+        # One UPDATE ... RETURNING instead of load, flush and refresh
+        stmt = (
+            update(SyncSession)
+            .where(SyncSession.id == session_id)
+            .values(**values)
+            .returning(SyncSession)
+        )
+        result = await self.db.execute(stmt)
+        session = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(session)
         return session
 
     async def delete(self, session_id: UUID) -> bool:
@@ -119,13 +159,12 @@ class SessionRepository:
         Returns:
             True if deleted, False if not found
         """
-        session = await self.get_by_id(session_id)
-        if not session:
-            return False
-
-        await self.db.delete(session)
+        # Executions and their operations go with it (ON DELETE CASCADE)
+        stmt = delete(SyncSession).where(SyncSession.id == session_id).returning(SyncSession.id)
+        result = await self.db.execute(stmt)
+        deleted = result.scalar_one_or_none() is not None
         await self.db.commit()
-        return True
+        return deleted
 
     async def get_by_endpoint(self, endpoint_id: UUID) -> List[SyncSession]:
         """
@@ -1,13 +1,15 @@
 """
 Session Service - Business logic for sync session management.
 """
+import asyncio
 import logging
+from functools import partial
 from typing import List, Optional, Dict, Any
-from uuid import UUID
+from uuid import UUID, uuid4
 from datetime import datetime, timezone
 
 from app.repositories.session_repository import SessionRepository
-from app.repositories.execution_repository import ExecutionRepository
+from app.repositories.execution_repository import CANCELLABLE_STATUSES, ExecutionRepository
 from app.repositories.endpoint_repository import EndpointRepository
 from app.database.models import SyncSession, SyncExecution, ExecutionStatus
 from app.tasks.sync_tasks import execute_sync_session, cancel_sync_execution
@@ -212,34 +214,46 @@ class SessionService:
             # Validate endpoints exist and are accessible
             await self._validate_session_endpoints(session)
             
-            # Create execution record
-            execution_data = {
+            # The execution ID doubles as the Celery task ID, so the worker
+            # claims this row and cancelling it can revoke the task
+            execution_id = uuid4()
+            execution = await self.execution_repo.create({
+                'id': execution_id,
                 'session_id': session_id,
                 'status': ExecutionStatus.QUEUED,
-                'is_dry_run': dry_run
-            }
-            
-            execution = await self.execution_repo.create(execution_data)
-            
-            # Queue Celery task
-            task = execute_sync_session.delay(
-                session_id=str(session_id),
-                dry_run=dry_run,
-                force_overwrite=force_overwrite,
-                user_id=str(user_id) if user_id else None
-            )
-            
-            # Update execution with task ID
-            await self.execution_repo.update(execution.id, {
-                'celery_task_id': task.id,
-                'status': ExecutionStatus.QUEUED
+                'is_dry_run': dry_run,
+                'celery_task_id': str(execution_id)
             })
             
-            logger.info(f"Started session {session_id} execution {execution.id}")
+            # The row must be visible before a worker can pick up the task
+            await self.db.commit()
+            
+            try:
+                # Publishing blocks on the broker; keep it off the event loop
+                task = await asyncio.to_thread(partial(
+                    execute_sync_session.apply_async,
+                    kwargs={
+                        'session_id': str(session_id),
+                        'dry_run': dry_run,
+                        'force_overwrite': force_overwrite,
+                        'user_id': str(user_id) if user_id else None
+                    },
+                    task_id=str(execution_id)
+                ))
+            except Exception as e:
+                await self.execution_repo.update_if_active(execution_id, {
+                    'status': ExecutionStatus.FAILED,
+                    'completed_at': datetime.now(timezone.utc),
+                    'error_message': f"Failed to queue sync task: {e}"
+                })
+                await self.db.commit()
+                raise
+            
+            logger.info(f"Started session {session_id} execution {execution_id}")
             
             return {
                 'success': True,
-                'execution_id': str(execution.id),
+                'execution_id': str(execution_id),
                 'task_id': task.id,
                 'session_id': str(session_id),
                 'session_name': session.name,
@@ -264,11 +278,14 @@ class SessionService:
             Dictionary with stop results
         """
         try:
-            # Get running executions for session
-            running_executions = await self.execution_repo.get_all(
-                session_id=session_id,
-                status=ExecutionStatus.RUNNING
-            )
+            # Get running executions for session, and queued ones that a
+            # worker has not picked up yet
+            running_executions = []
+            for execution_status in CANCELLABLE_STATUSES:
+                running_executions.extend(await self.execution_repo.get_all(
+                    session_id=session_id,
+                    status=execution_status
+                ))
             
             if not running_executions:
                 return {
@@ -281,15 +298,16 @@ class SessionService:
             
             for execution in running_executions:
                 try:
-                    # Cancel Celery task
-                    if execution.celery_task_id:
-                        cancel_sync_execution.delay(execution.celery_task_id)
+                    # Update execution status unless it finished meanwhile
+                    if not await self.execution_repo.cancel_execution(execution.id):
+                        continue
+                    await self.db.commit()
                     
-                    # Update execution status
-                    await self.execution_repo.update(execution.id, {
-                        'status': ExecutionStatus.CANCELLED,
-                        'completed_at': datetime.now(timezone.utc)
-                    })
+                    # Cancel Celery task; the execution ID is the task ID
+                    await asyncio.to_thread(
+                        cancel_sync_execution.delay,
+                        execution.celery_task_id or str(execution.id)
+                    )
                     
                     stopped_executions.append(str(execution.id))
                     
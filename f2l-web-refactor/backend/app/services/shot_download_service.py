@@ -9,7 +9,7 @@ This service provides:
 """
 import logging
 import asyncio
-from typing import List, Dict, Optional, Callable
+from typing import Any, AsyncIterator, List, Dict, Optional, Callable
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -677,6 +677,39 @@ class ShotDownloadService:
         Returns:
             List of task summaries
         """
+        query = self._tasks_query(endpoint_id, status, limit, offset)
+        result = await self.db.execute(query)
+        return [self._task_summary(task) for task in result.scalars()]
+
+    async def iter_tasks(
+        self,
+        endpoint_id: Optional[UUID] = None,
+        status: Optional[ShotDownloadTaskStatus] = None,
+        limit: int = 50,
+        offset: int = 0,
+        batch_size: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over download task summaries from a server-side cursor.
+
+        Same filters and order as ``list_tasks``; rows are fetched
+        ``batch_size`` at a time instead of all at once.
+
+        Yields:
+            Task summaries
+        """
+        query = self._tasks_query(endpoint_id, status, limit, offset)
+        result = await self.db.stream(query.execution_options(yield_per=batch_size))
+        async for task in result.scalars():
+            yield self._task_summary(task)
+
+    @staticmethod
+    def _tasks_query(
+        endpoint_id: Optional[UUID],
+        status: Optional[ShotDownloadTaskStatus],
+        limit: int,
+        offset: int
+    ):
         query = select(ShotDownloadTask).order_by(ShotDownloadTask.created_at.desc())
 
         if endpoint_id:
@@ -685,30 +718,25 @@ class ShotDownloadService:
         if status:
             query = query.where(ShotDownloadTask.status == status)
 
-        query = query.limit(limit).offset(offset)
+        return query.limit(limit).offset(offset)
 
-        result = await self.db.execute(query)
-        tasks = result.scalars().all()
-
-        tasks_data = []
-        for task in tasks:
-            progress_percent = 0
-            if task.total_items > 0:
-                progress_percent = int((task.completed_items / task.total_items) * 100)
-
-            tasks_data.append({
-                "task_id": str(task.id),
-                "name": task.name,
-                "status": task.status.value,
-                "total_items": task.total_items,
-                "completed_items": task.completed_items,
-                "failed_items": task.failed_items,
-                "progress_percent": progress_percent,
-                "created_at": task.created_at.isoformat() if task.created_at else None,
-                "created_by": task.created_by
-            })
+    @staticmethod
+    def _task_summary(task: ShotDownloadTask) -> Dict[str, Any]:
+        progress_percent = 0
+        if task.total_items > 0:
+            progress_percent = int((task.completed_items / task.total_items) * 100)
 
-        return tasks_data
+        return {
+            "task_id": str(task.id),
+            "name": task.name,
+            "status": task.status.value,
+            "total_items": task.total_items,
+            "completed_items": task.completed_items,
+            "failed_items": task.failed_items,
+            "progress_percent": progress_percent,
+            "created_at": task.created_at.isoformat() if task.created_at else None,
+            "created_by": task.created_by
+        }
 
     async def delete_task(self, task_id: UUID) -> Dict[str, any]:
         """
@@ -13,7 +13,7 @@ import asyncio
 import os
 import re
 from typing import List, Dict, Optional, Callable
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime, timezone
 from pathlib import Path
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -256,7 +256,6 @@ class ShotUploadService:
 
         # Create task - single endpoint_id (stores both source and target info)
         task = ShotUploadTask(
-            id=uuid4(),
             name=task_name,
             endpoint_id=endpoint_id,
             status=ShotUploadTaskStatus.PENDING,
@@ -285,7 +284,6 @@ class ShotUploadService:
             target_path = os.path.join(target_root, relative_path).replace("\\", "/")
 
             upload_item = ShotUploadItem(
-                id=uuid4(),
                 task_id=task.id,
                 episode=item_data.get("episode", ""),
                 sequence=item_data.get("sequence", ""),
@@ -560,7 +558,6 @@ class ShotUploadService:
     ) -> None:
         """Record upload history."""
         history = ShotUploadHistory(
-            id=uuid4(),
             task_id=task.id,
             item_id=item.id,
             task_name=task.name,
@@ -786,7 +783,7 @@ class ShotUploadService:
                     "target_path": h.target_path,
                     "source_endpoint_name": h.source_endpoint_name,
                     "target_endpoint_name": h.target_endpoint_name,
-                    "status": h.status,
+                    "status": h.status.value,
                     "error_message": h.error_message,
                     "uploaded_at": h.uploaded_at.isoformat() if h.uploaded_at else None,
                     "uploaded_by": h.uploaded_by
@@ -61,6 +61,14 @@ celery_app.conf.update(
             "task": "app.tasks.maintenance_tasks.cleanup_old_executions",
             "schedule": 3600.0,  # Every hour
         },
+        "maintain-log-partitions": {
+            "task": "app.tasks.maintenance_tasks.maintain_log_partitions",
+            "schedule": 86400.0,  # Every day
+        },
+        "maintain-upload-history-partitions": {
+            "task": "app.tasks.maintenance_tasks.maintain_upload_history_partitions",
+            "schedule": 86400.0,  # Every day
+        },
         "process-scheduled-sessions": {
             "task": "app.tasks.sync_tasks.process_scheduled_sessions",
             "schedule": 60.0,  # Every minute
@@ -3,11 +3,13 @@ Maintenance tasks for system cleanup and optimization.
 """
 import asyncio
 import logging
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 from typing import Dict, Any, List
 import os
 import shutil
 
+from sqlalchemy import text
+
 from app.tasks.celery_app import celery_app
 from app.repositories.execution_repository import ExecutionRepository
 from app.repositories.endpoint_repository import EndpointRepository
@@ -125,6 +127,148 @@ async def _cleanup_old_logs_async(days: int) -> Dict[str, Any]:
             raise
 
 
+@celery_app.task(name="app.tasks.maintenance_tasks.maintain_log_partitions")
+def maintain_log_partitions(months_ahead: int = 2, retention_days: int = 30) -> Dict[str, Any]:
+    """
+    Create upcoming monthly logs partitions and drop expired ones.
+    
+    Args:
+        months_ahead: Number of future months to keep partitions for (default: 2)
+        retention_days: Partitions entirely older than this are dropped (default: 30)
+        
+    Returns:
+        Dictionary with partition maintenance results
+    """
+    logger.info(f"Maintaining logs partitions ({months_ahead} months ahead, {retention_days} days retention)")
+    
+    try:
+        result = asyncio.run(_maintain_log_partitions_async(months_ahead, retention_days))
+        return result
+        
+    except Exception as e:
+        logger.error(f"Failed to maintain log partitions: {e}")
+        return {
+            'success': False,
+            'message': str(e),
+            'partitions_created': [],
+            'partitions_dropped': []
+        }
+
+
+def _next_month(month: date) -> date:
+    """Return the first day of the month after ``month``."""
+    return (month + timedelta(days=32)).replace(day=1)
+
+
+async def _create_monthly_partitions(db, table: str, months_ahead: int) -> List[str]:
+    """Create ``<table>_YYYY_MM`` partitions for this month and the months ahead."""
+    partitions_created = []
+    month = datetime.now(timezone.utc).date().replace(day=1)
+    for _ in range(months_ahead + 1):
+        next_month = _next_month(month)
+        partition = f"{table}_{month:%Y_%m}"
+        await db.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {partition} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month}') TO ('{next_month}')"
+        ))
+        partitions_created.append(partition)
+        month = next_month
+    return partitions_created
+
+
+async def _maintain_log_partitions_async(months_ahead: int, retention_days: int) -> Dict[str, Any]:
+    """Async implementation of logs partition maintenance."""
+    async with async_session_maker() as db:
+        try:
+            # Create partitions for the current month and the months ahead
+            partitions_created = await _create_monthly_partitions(db, "logs", months_ahead)
+            
+            # Drop monthly partitions whose whole range is past retention;
+            # this replaces a DELETE + VACUUM over the same rows.
+            cutoff = (datetime.now(timezone.utc) - timedelta(days=retention_days)).date()
+            result = await db.execute(text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'logs'::regclass"
+            ))
+            partitions_dropped = []
+            for partition in sorted(result.scalars()):
+                try:
+                    start = datetime.strptime(partition, "logs_%Y_%m").date()
+                except ValueError:
+                    continue  # logs_default and anything not created by us
+                if _next_month(start) <= cutoff:
+                    await db.execute(text(f"DROP TABLE IF EXISTS {partition}"))
+                    partitions_dropped.append(partition)
+            
+            await db.commit()
+            
+            logger.info(f"Log partitions ensured: {partitions_created}, dropped: {partitions_dropped}")
+            
+            return {
+                'success': True,
+                'partitions_created': partitions_created,
+                'partitions_dropped': partitions_dropped,
+                'cutoff_date': cutoff.isoformat(),
+                'timestamp': datetime.now(timezone.utc).isoformat()
+            }
+            
+        except Exception as e:
+            logger.error(f"Error in log partition maintenance: {e}")
+            await db.rollback()
+            raise
+
+
+@celery_app.task(name="app.tasks.maintenance_tasks.maintain_upload_history_partitions")
+def maintain_upload_history_partitions(months_ahead: int = 2) -> Dict[str, Any]:
+    """
+    Create upcoming monthly shot_upload_history partitions.
+    
+    Upload history is kept for auditing, so old partitions are not dropped;
+    they can be detached and archived manually.
+    
+    Args:
+        months_ahead: Number of future months to keep partitions for (default: 2)
+        
+    Returns:
+        Dictionary with partition maintenance results
+    """
+    logger.info(f"Maintaining shot_upload_history partitions ({months_ahead} months ahead)")
+    
+    try:
+        result = asyncio.run(_maintain_upload_history_partitions_async(months_ahead))
+        return result
+        
+    except Exception as e:
+        logger.error(f"Failed to maintain upload history partitions: {e}")
+        return {
+            'success': False,
+            'message': str(e),
+            'partitions_created': []
+        }
+
+
+async def _maintain_upload_history_partitions_async(months_ahead: int) -> Dict[str, Any]:
+    """Async implementation of shot_upload_history partition maintenance."""
+    async with async_session_maker() as db:
+        try:
+            partitions_created = await _create_monthly_partitions(db, "shot_upload_history", months_ahead)
+            await db.commit()
+            
+            logger.info(f"Upload history partitions ensured: {partitions_created}")
+            
+            return {
+                'success': True,
+                'partitions_created': partitions_created,
+                'timestamp': datetime.now(timezone.utc).isoformat()
+            }
+            
+        except Exception as e:
+            logger.error(f"Error in upload history partition maintenance: {e}")
+            await db.rollback()
+            raise
+
+
 @celery_app.task(name="app.tasks.maintenance_tasks.cleanup_scan_cache")
 def cleanup_scan_cache(hours: int = 24) -> Dict[str, Any]:
     """
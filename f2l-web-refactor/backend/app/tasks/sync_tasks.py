@@ -90,19 +90,28 @@ async def _execute_sync_session_async(
             if not session.is_active:
                 raise ValueError(f"Session {session_id} is not active")
             
-            # Create execution record
+            # Claim the execution queued by the API, or record it for
+            # scheduled runs, under the task ID so it can be revoked
             execution_repo = ExecutionRepository(db)
             execution_data = {
                 'id': UUID(task_id),
                 'session_id': session_id,
-                'status': ExecutionStatus.RUNNING,
                 'is_dry_run': dry_run,
-                'started_at': datetime.now(timezone.utc)
+                'started_at': datetime.now(timezone.utc),
+                'celery_task_id': task_id
             }
             
-            execution = await execution_repo.create(execution_data)
+            execution = await execution_repo.start_execution(execution_data)
             await db.commit()
             
+            if not execution:
+                logger.info(f"Execution {task_id} was cancelled before it started")
+                return {
+                    'success': False,
+                    'execution_id': task_id,
+                    'error_message': 'Execution was cancelled before it started'
+                }
+            
             # Initialize sync engine
             sync_engine = SyncEngine()
             
@@ -153,7 +162,8 @@ async def _execute_sync_session_async(
             if not sync_result['success']:
                 execution_update['error_message'] = sync_result.get('error_message', 'Unknown error')
             
-            await execution_repo.update(execution.id, execution_update)
+            # A cancelled execution keeps its status
+            await execution_repo.update_if_active(execution.id, execution_update)
             await db.commit()
             
             return {
@@ -192,7 +202,7 @@ async def _update_execution_status(
             if status in [ExecutionStatus.COMPLETED, ExecutionStatus.FAILED, ExecutionStatus.CANCELLED]:
                 update_data['completed_at'] = datetime.now(timezone.utc)
             
-            await execution_repo.update(UUID(task_id), update_data)
+            await execution_repo.update_if_active(UUID(task_id), update_data)
             await db.commit()
             
         except Exception as e:
@@ -0,0 +1,117 @@
+"""
+Unit tests for the streamed batch metadata comparison.
+"""
+import orjson
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1 import browse
+from app.database.session import get_db
+
+MODIFIED = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+SOURCE_ID = uuid4()
+DESTINATION_ID = uuid4()
+
+
+@pytest.mark.unit
+class TestBatchCompare:
+    """Test cases for POST /browse/batch-compare."""
+
+    @pytest.fixture
+    def files(self):
+        """File info per endpoint, and the batch lookups made against them."""
+        return {
+            SOURCE_ID: {
+                '/shots/a.exr': {'size': 10, 'modified': MODIFIED},
+                '/shots/b.exr': {'size': 20, 'modified': MODIFIED},
+            },
+            DESTINATION_ID: {
+                '/shots/b.exr': {'size': 20, 'modified': MODIFIED},
+            },
+            'lookups': [],
+            'fail': False,
+        }
+
+    @pytest.fixture
+    def client(self, monkeypatch, files):
+        """Client for the browse router with two fake FTP endpoints."""
+        async def endpoint_data(repo, endpoint_id):
+            return {'endpoint_type': 'ftp', 'host': str(endpoint_id), 'username': 'user', 'password': 'secret'}
+
+        monkeypatch.setattr(browse.EndpointRepository, 'get_with_decrypted_password_cached', endpoint_data)
+
+        @asynccontextmanager
+        async def acquire_manager(key, config, factory):
+            if files['fail']:
+                raise ConnectionError("Failed to connect to endpoint")
+
+            def batch_get_file_info(paths):
+                files['lookups'].append((key, sorted(paths)))
+                return {path: files[key][path] for path in paths if path in files[key]}
+
+            yield SimpleNamespace(batch_get_file_info=batch_get_file_info)
+
+        monkeypatch.setattr(browse, '_acquire_manager', acquire_manager)
+
+        app = FastAPI()
+        app.include_router(browse.router, prefix='/browse')
+        app.dependency_overrides[get_db] = lambda: None
+        return TestClient(app)
+
+    def _compare(self, client, paths):
+        response = client.post(
+            '/browse/batch-compare',
+            params={
+                'source_endpoint_id': str(SOURCE_ID),
+                'destination_endpoint_id': str(DESTINATION_ID),
+                'sync_direction': 'ftp_to_local',
+            },
+            json=paths
+        )
+        assert response.status_code == 200
+        assert response.headers['content-type'] == 'application/x-ndjson'
+        lines = [orjson.loads(line) for line in response.content.splitlines()]
+        return lines[:-1], lines[-1]['__summary__']
+
+    def test_results_and_summary(self, client, files):
+        """Test each path gets one result line and the summary counts them."""
+        items, summary = self._compare(client, ['/shots/a.exr', '/shots/b.exr', '/comp/c.exr'])
+
+        operations = {item['path']: item['operation'] for item in items}
+        assert operations == {
+            '/shots/a.exr': 'download',
+            '/shots/b.exr': 'skip',
+            '/comp/c.exr': 'skip',
+        }
+        assert summary == {
+            'total_compared': 3,
+            'operations': {'download': 1, 'skip': 2},
+            'error': None,
+        }
+
+    def test_one_lookup_per_directory_and_endpoint(self, client, files):
+        """Test paths are fetched with one batch lookup per parent directory per endpoint."""
+        self._compare(client, ['/shots/a.exr', '/comp/c.exr', '/shots/b.exr', '/shots/a.exr'])
+
+        assert sorted(files['lookups']) == sorted([
+            (SOURCE_ID, ['/shots/a.exr', '/shots/b.exr']),
+            (DESTINATION_ID, ['/shots/a.exr', '/shots/b.exr']),
+            (SOURCE_ID, ['/comp/c.exr']),
+            (DESTINATION_ID, ['/comp/c.exr']),
+        ])
+
+    def test_connection_error_reported_in_summary(self, client, files):
+        """Test a connection failure ends the stream with an error summary."""
+        files['fail'] = True
+
+        items, summary = self._compare(client, ['/shots/a.exr'])
+
+        assert items == []
+        assert summary['error'] == "Failed to connect to endpoint"
+        assert summary['total_compared'] == 0
@@ -0,0 +1,132 @@
+"""
+Unit tests for the shared connection probe behind POST /endpoints/{id}/connect.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from app.api.v1 import endpoints
+
+
+@pytest.mark.unit
+class TestConnectSingleflight:
+    """Test cases for concurrent connect_endpoint calls."""
+
+    @pytest.fixture
+    def repo(self):
+        """Endpoint repository returning decrypted FTP credentials."""
+        repo = MagicMock()
+        repo.get_with_decrypted_password_cached = AsyncMock(
+            return_value={'endpoint_type': 'ftp', 'host': 'ftp.example.com'}
+        )
+        return repo
+
+    @pytest.fixture
+    def probe(self, monkeypatch):
+        """Replace _probe_and_record with one that waits for ``release``."""
+        probe = MagicMock(calls=0, release=asyncio.Event())
+
+        async def probe_and_record(endpoint_id, endpoint_data, strict):
+            probe.calls += 1
+            await probe.release.wait()
+            return {'success': True, 'message': 'Connection successful'}
+
+        monkeypatch.setattr(endpoints, '_probe_and_record', probe_and_record)
+        yield probe
+        endpoints._inflight_connects.clear()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_probe(self, repo, probe):
+        """Test callers for the same endpoint share one probe."""
+        endpoint_id = uuid4()
+
+        callers = [
+            asyncio.ensure_future(endpoints.connect_endpoint(endpoint_id, strict=False, repo=repo))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        probe.release.set()
+        results = await asyncio.gather(*callers)
+
+        assert probe.calls == 1
+        assert all(result['success'] for result in results)
+        assert endpoints._inflight_connects == {}
+
+    @pytest.mark.asyncio
+    async def test_strict_probes_separately(self, repo, probe):
+        """Test strict and non-strict connects do not share a probe."""
+        endpoint_id = uuid4()
+
+        callers = [
+            asyncio.ensure_future(endpoints.connect_endpoint(endpoint_id, strict=strict, repo=repo))
+            for strict in (False, True)
+        ]
+        await asyncio.sleep(0)
+        probe.release.set()
+        await asyncio.gather(*callers)
+
+        assert probe.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_leader_cancellation_keeps_probe(self, repo, probe):
+        """Test the caller that started the probe leaving does not cancel it."""
+        endpoint_id = uuid4()
+
+        leader = asyncio.ensure_future(endpoints.connect_endpoint(endpoint_id, strict=False, repo=repo))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(endpoints.connect_endpoint(endpoint_id, strict=False, repo=repo))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        probe.release.set()
+        result = await follower
+
+        assert leader.cancelled()
+        assert result['success']
+        assert probe.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_credentials_reloaded(self, repo, probe, monkeypatch):
+        """Test connect drops this worker's cached credentials before loading."""
+        endpoint_id = uuid4()
+        invalidated = []
+        monkeypatch.setattr(endpoints, 'invalidate_decrypted_cache', invalidated.append)
+
+        probe.release.set()
+        await endpoints.connect_endpoint(endpoint_id, strict=False, repo=repo)
+
+        assert invalidated == [endpoint_id]
+
+
+@pytest.mark.unit
+class TestProbeAndRecord:
+    """Test cases for _probe_and_record."""
+
+    @pytest.mark.asyncio
+    async def test_status_written_in_own_session(self, monkeypatch):
+        """Test the outcome is committed through a session the probe opens itself."""
+        endpoint_id = uuid4()
+        db = AsyncMock()
+        session_maker = MagicMock()
+        session_maker.return_value.__aenter__ = AsyncMock(return_value=db)
+        session_maker.return_value.__aexit__ = AsyncMock(return_value=False)
+        repository = MagicMock()
+        repository.return_value.update_connection_status = AsyncMock()
+
+        async def tester(endpoint_data):
+            return {'success': False, 'message': 'Login refused'}
+
+        monkeypatch.setattr(endpoints, 'async_session_maker', session_maker)
+        monkeypatch.setattr(endpoints, 'EndpointRepository', repository)
+        monkeypatch.setattr(endpoints, '_connection_tester', lambda endpoint_type, strict: tester)
+
+        result = await endpoints._probe_and_record(endpoint_id, {'endpoint_type': 'ftp'}, False)
+
+        assert result == {'success': False, 'message': 'Login refused'}
+        repository.assert_called_once_with(db)
+        repository.return_value.update_connection_status.assert_awaited_once_with(
+            endpoint_id, 'error', 'Login refused'
+        )
+        db.commit.assert_awaited_once()
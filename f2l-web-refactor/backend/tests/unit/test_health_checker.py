@@ -0,0 +1,118 @@
+"""
+Unit tests for HealthChecker result caching.
+"""
+import asyncio
+import pytest
+from datetime import datetime
+
+from app.core import monitoring
+from app.core.monitoring import HealthChecker, HealthCheckResult
+
+
+def _counting_check(calls, release=None):
+    """Build a check that counts its runs and optionally waits to finish."""
+    async def check():
+        calls.append(1)
+        if release is not None:
+            await release.wait()
+        return HealthCheckResult(
+            name='probe',
+            status='healthy',
+            message=f'run {len(calls)}',
+            duration_ms=0,
+            timestamp=datetime.utcnow()
+        )
+    return check
+
+
+@pytest.mark.unit
+class TestRunCheckCached:
+    """Test cases for HealthChecker.run_check_cached."""
+
+    @pytest.mark.asyncio
+    async def test_result_reused_within_ttl(self):
+        """Test a second call inside the TTL reuses the first result."""
+        calls = []
+        checker = HealthChecker(cache_ttl=60)
+        checker.register_check('probe', _counting_check(calls))
+
+        first = await checker.run_check_cached('probe')
+        second = await checker.run_check_cached('probe')
+
+        assert len(calls) == 1
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_result_refreshed_after_ttl(self, monkeypatch):
+        """Test the check runs again once the cached result expires."""
+        calls = []
+        now = [1000.0]
+        monkeypatch.setattr(monitoring.time, 'monotonic', lambda: now[0])
+        checker = HealthChecker(cache_ttl=5)
+        checker.register_check('probe', _counting_check(calls))
+
+        await checker.run_check_cached('probe')
+        now[0] += 6
+        result = await checker.run_check_cached('probe')
+
+        assert len(calls) == 2
+        assert result.message == 'run 2'
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_cache(self):
+        """Test every call runs the check when caching is disabled."""
+        calls = []
+        checker = HealthChecker(cache_ttl=0)
+        checker.register_check('probe', _counting_check(calls))
+
+        await checker.run_check_cached('probe')
+        await checker.run_check_cached('probe')
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_run(self):
+        """Test callers arriving while the check runs wait for that run."""
+        calls = []
+        release = asyncio.Event()
+        checker = HealthChecker(cache_ttl=0)
+        checker.register_check('probe', _counting_check(calls, release))
+
+        waiters = [asyncio.ensure_future(checker.run_check_cached('probe')) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert checker._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_run(self):
+        """Test a caller going away leaves the shared run to the others."""
+        calls = []
+        release = asyncio.Event()
+        checker = HealthChecker(cache_ttl=0)
+        checker.register_check('probe', _counting_check(calls, release))
+
+        first = asyncio.ensure_future(checker.run_check_cached('probe'))
+        second = asyncio.ensure_future(checker.run_check_cached('probe'))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        result = await second
+
+        assert first.cancelled()
+        assert result.status == 'healthy'
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_reported_unhealthy(self):
+        """Test a check that exceeds check_timeout is reported unhealthy."""
+        checker = HealthChecker(check_timeout=0.01)
+        checker.register_check('probe', _counting_check([], asyncio.Event()))
+
+        result = await checker.run_check_cached('probe')
+
+        assert result.status == 'unhealthy'
+        assert 'timed out' in result.message
@@ -0,0 +1,154 @@
+"""
+Unit tests for the browse listing cache and its ETag revalidation.
+"""
+import pytest
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1 import browse
+from app.core import listing_cache as listing_cache_module
+from app.core.listing_cache import ListingCache
+from app.core.listing_result import ListingResult
+from app.database.session import get_db
+
+
+@pytest.mark.unit
+class TestListingCache:
+    """Test cases for ListingCache."""
+
+    def test_get_returns_stored_body(self):
+        """Test a stored body is served with an ETag derived from it."""
+        cache = ListingCache(ttl=60)
+
+        stored = cache.set(('endpoint', '/'), b'{"items":[]}')
+
+        assert cache.get(('endpoint', '/')) is stored
+        assert stored.etag == ListingCache(ttl=60).set(('other', '/'), b'{"items":[]}').etag
+        assert stored.etag != cache.set(('endpoint', '/x'), b'{"items":[1]}').etag
+
+    def test_entry_expires_after_ttl(self, monkeypatch):
+        """Test an entry is dropped once its TTL has passed."""
+        now = [1000.0]
+        monkeypatch.setattr(listing_cache_module.time, 'monotonic', lambda: now[0])
+        cache = ListingCache(ttl=5)
+        cache.set(('endpoint', '/'), b'{}')
+
+        now[0] += 6
+
+        assert cache.get(('endpoint', '/')) is None
+
+    def test_zero_ttl_stores_nothing(self):
+        """Test a disabled cache still returns an ETag but keeps no entry."""
+        cache = ListingCache(ttl=0)
+
+        assert cache.set(('endpoint', '/'), b'{}').etag
+        assert cache.get(('endpoint', '/')) is None
+
+    def test_oldest_entry_evicted(self):
+        """Test the oldest listing is dropped once max_entries is reached."""
+        cache = ListingCache(ttl=60, max_entries=2)
+        for path in ('/a', '/b', '/c'):
+            cache.set(('endpoint', path), path.encode())
+
+        assert cache.get(('endpoint', '/a')) is None
+        assert cache.get(('endpoint', '/c')) is not None
+
+    def test_invalidate_drops_only_that_endpoint(self):
+        """Test invalidation is scoped to one endpoint."""
+        cache = ListingCache(ttl=60)
+        cache.set(('one', '/'), b'1')
+        cache.set(('one', '/sub'), b'1')
+        cache.set(('two', '/'), b'2')
+
+        cache.invalidate('one')
+
+        assert cache.get(('one', '/')) is None
+        assert cache.get(('one', '/sub')) is None
+        assert cache.get(('two', '/')) is not None
+
+
+@pytest.mark.unit
+class TestBrowseListingCache:
+    """Test cases for browse_directory serving cached listings."""
+
+    @pytest.fixture
+    def listing(self):
+        """What the fake manager returns from list_directory."""
+        return SimpleNamespace(calls=0, failed=False)
+
+    @pytest.fixture
+    def client(self, monkeypatch, listing):
+        """Client for the browse router with a fake FTP endpoint and manager."""
+        monkeypatch.setattr(browse, 'listing_cache', ListingCache(ttl=60))
+
+        async def endpoint_data(repo, endpoint_id):
+            return {'endpoint_type': 'ftp', 'host': 'ftp.example.com', 'username': 'user', 'password': 'secret'}
+
+        monkeypatch.setattr(browse.EndpointRepository, 'get_with_decrypted_password_cached', endpoint_data)
+
+        def list_directory(remote_path, recursive, max_depth, max_items):
+            listing.calls += 1
+            entries = [SimpleNamespace(
+                path=f'{remote_path}/a.exr', size=1, modified=None, is_file=True, permissions='-rw-r--r--'
+            )]
+            return ListingResult(entries, failed=listing.failed)
+
+        @asynccontextmanager
+        async def acquire_manager(key, config, factory):
+            yield SimpleNamespace(list_directory=list_directory)
+
+        monkeypatch.setattr(browse, '_acquire_manager', acquire_manager)
+
+        app = FastAPI()
+        app.include_router(browse.router, prefix='/browse')
+        app.dependency_overrides[get_db] = lambda: None
+        return TestClient(app)
+
+    def test_revalidation_returns_304(self, client, listing):
+        """Test a matching If-None-Match is answered from cache with 304."""
+        url = f'/browse/{uuid4()}?path=/shots'
+
+        first = client.get(url)
+        second = client.get(url, headers={'If-None-Match': first.headers['etag']})
+
+        assert first.status_code == 200
+        assert first.json()['total_files'] == 1
+        assert second.status_code == 304
+        assert second.headers['etag'] == first.headers['etag']
+        assert listing.calls == 1
+
+    def test_stale_etag_gets_body(self, client, listing):
+        """Test a non-matching If-None-Match gets the cached body."""
+        url = f'/browse/{uuid4()}?path=/shots'
+        client.get(url)
+
+        response = client.get(url, headers={'If-None-Match': '"stale"'})
+
+        assert response.status_code == 200
+        assert response.json()['items'][0]['path'] == '/shots/a.exr'
+        assert listing.calls == 1
+
+    def test_refresh_bypasses_cache(self, client, listing):
+        """Test refresh=true lists the directory again."""
+        url = f'/browse/{uuid4()}?path=/shots'
+        client.get(url)
+
+        client.get(url + '&refresh=true')
+
+        assert listing.calls == 2
+
+    def test_failed_listing_not_cached(self, client, listing):
+        """Test a listing that hit an error is returned but not cached."""
+        listing.failed = True
+        url = f'/browse/{uuid4()}?path=/shots'
+
+        first = client.get(url)
+        client.get(url)
+
+        assert first.status_code == 200
+        assert 'etag' not in first.headers
+        assert listing.calls == 2
@@ -0,0 +1,162 @@
+"""
+Unit tests for LocalManager listings and ListingResult totals.
+"""
+import os
+import pytest
+
+from app.core import local_manager
+from app.core.listing_result import ListingResult
+from app.core.local_manager import LocalManager, LocalConfig
+
+
+@pytest.mark.unit
+class TestListingResult:
+    """Test cases for ListingResult."""
+
+    def test_totals(self):
+        """Test file totals are derived from the directory count."""
+        result = ListingResult(['a', 'b', 'c'], total_directories=1)
+
+        assert result.total_files == 2
+        assert result.total_directories == 1
+        assert not result.failed
+
+    def test_slicing_returns_plain_list(self):
+        """Test slicing drops the totals along with the type."""
+        result = ListingResult(['a', 'b', 'c'], total_directories=1)
+
+        assert type(result[:2]) is list
+
+    def test_failed_flag(self):
+        """Test a failed listing is empty and flagged."""
+        result = ListingResult(failed=True)
+
+        assert result == []
+        assert result.failed
+
+
+@pytest.mark.unit
+class TestLocalManagerListing:
+    """Test cases for LocalManager.list_directory."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Connected LocalManager over a small tree."""
+        (tmp_path / 'shots' / 'sh010').mkdir(parents=True)
+        (tmp_path / 'shots' / 'sh020').mkdir()
+        for name in ('a.exr', 'b.exr', 'c.exr'):
+            (tmp_path / 'shots' / 'sh010' / name).write_text('x')
+        (tmp_path / 'shots' / 'sh020' / 'd.exr').write_text('x')
+        (tmp_path / 'shots' / 'notes.txt').write_text('x')
+
+        manager = LocalManager(LocalConfig(base_path=str(tmp_path)))
+        assert manager.connect()
+        return manager
+
+    def test_single_level_entries(self, manager):
+        """Test entries carry base-relative paths, sizes and types."""
+        result = manager.list_directory('shots')
+
+        entries = {entry['name']: entry for entry in result}
+        assert set(entries) == {'sh010', 'sh020', 'notes.txt'}
+        assert entries['notes.txt']['path'] == 'shots/notes.txt'
+        assert entries['notes.txt']['size'] == 1
+        assert entries['notes.txt']['is_file']
+        assert entries['sh010']['is_directory']
+        assert not entries['sh010']['is_file']
+        assert entries['sh010']['size'] == 0
+
+    def test_recursive_entries(self, manager):
+        """Test a recursive listing descends into subdirectories."""
+        result = manager.list_directory('shots', recursive=True)
+
+        assert 'shots/sh010/a.exr' in {entry['path'] for entry in result}
+
+    def test_single_level_totals(self, manager):
+        """Test a single-level listing counts files and directories."""
+        result = manager.list_directory('shots')
+
+        assert isinstance(result, ListingResult)
+        assert len(result) == 3
+        assert result.total_directories == 2
+        assert result.total_files == 1
+
+    def test_recursive_totals(self, manager):
+        """Test a recursive listing includes directories and their files."""
+        result = manager.list_directory('shots', recursive=True)
+
+        assert len(result) == 7
+        assert result.total_directories == 2
+        assert result.total_files == 5
+
+    def test_max_items_truncates_and_recounts(self, manager):
+        """Test max_items caps the listing and the totals match the entries kept."""
+        result = manager.list_directory('shots', recursive=True, max_items=4)
+
+        assert isinstance(result, ListingResult)
+        assert len(result) == 4
+        assert result.total_directories == sum(1 for f in result if not f['is_file'])
+        assert result.total_files == sum(1 for f in result if f['is_file'])
+
+    def test_max_items_stops_recursion(self, manager, monkeypatch):
+        """Test no further directories are listed once max_items is reached."""
+        listed = []
+        list_single_level = manager._list_single_level
+
+        def record(directory):
+            listed.append(directory.name)
+            return list_single_level(directory)
+
+        monkeypatch.setattr(manager, '_list_single_level', record)
+
+        manager.list_directory('shots', recursive=True, max_items=3)
+
+        assert listed == ['shots']
+
+    def test_not_connected_is_flagged_failed(self, tmp_path):
+        """Test a listing error returns an empty result flagged as failed."""
+        manager = LocalManager(LocalConfig(base_path=str(tmp_path)))
+
+        result = manager.list_directory('/')
+
+        assert result == []
+        assert result.failed
+
+    @pytest.fixture
+    def unreadable_sh020(self, monkeypatch):
+        """Make scandir fail for directories named sh020."""
+        scandir = os.scandir
+
+        def failing_scandir(path):
+            if os.path.basename(path) == 'sh020':
+                raise PermissionError(13, 'Permission denied', str(path))
+            return scandir(path)
+
+        monkeypatch.setattr(local_manager.os, 'scandir', failing_scandir)
+
+    def test_scandir_error_is_flagged_failed(self, manager, unreadable_sh020):
+        """Test a directory that cannot be read is flagged, not listed as empty."""
+        assert manager.list_directory('shots/sh020').failed
+
+    def test_subdirectory_error_flags_recursive_listing(self, manager, unreadable_sh020):
+        """Test a failed subdirectory flags the whole recursive listing."""
+        result = manager.list_directory('shots', recursive=True)
+
+        assert result.failed
+        assert 'shots/sh010/a.exr' in {entry['path'] for entry in result}
+
+    def test_truncation_keeps_failed_flag(self, manager, monkeypatch):
+        """Test max_items truncation does not drop the failed flag."""
+        entries = [{'name': str(i), 'is_file': True} for i in range(5)]
+        monkeypatch.setattr(
+            manager, '_list_single_level', lambda directory: ListingResult(entries, failed=True)
+        )
+
+        result = manager.list_directory('shots', max_items=2)
+
+        assert len(result) == 2
+        assert result.failed
+
+    def test_readable_listing_is_not_failed(self, manager):
+        """Test a listing without errors is not flagged."""
+        assert not manager.list_directory('shots', recursive=True).failed
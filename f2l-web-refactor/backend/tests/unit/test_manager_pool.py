@@ -0,0 +1,135 @@
+"""
+Unit tests for EndpointManagerPool.
+"""
+import asyncio
+import pytest
+import pytest_asyncio
+
+from app.core.manager_pool import EndpointManagerPool
+
+
+class FakeManager:
+    """Manager that records connects and closes."""
+
+    def __init__(self, config, connects=True):
+        self.config = config
+        self.connects = connects
+        self.alive = False
+        self.connect_calls = 0
+        self.closed = False
+
+    def connect(self):
+        self.connect_calls += 1
+        self.alive = self.connects
+        return self.connects
+
+    def ensure_connected(self):
+        return self.alive
+
+    def close(self):
+        self.closed = True
+        self.alive = False
+
+
+@pytest.mark.unit
+class TestEndpointManagerPool:
+    """Test cases for EndpointManagerPool."""
+
+    @pytest_asyncio.fixture
+    async def pool(self):
+        """Pool closed after the test."""
+        pool = EndpointManagerPool(max_idle_per_endpoint=1, idle_ttl=60)
+        yield pool
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_manager_reused_between_requests(self, pool):
+        """Test a returned manager is lent out again without reconnecting."""
+        async with pool.acquire('endpoint', 'config', FakeManager) as first:
+            pass
+        async with pool.acquire('endpoint', 'config', FakeManager) as second:
+            pass
+
+        assert second is first
+        assert first.connect_calls == 1
+        assert not first.closed
+
+    @pytest.mark.asyncio
+    async def test_concurrent_borrowers_get_separate_managers(self, pool):
+        """Test a manager is never lent to two borrowers at once."""
+        async with pool.acquire('endpoint', 'config', FakeManager) as first:
+            async with pool.acquire('endpoint', 'config', FakeManager) as second:
+                assert second is not first
+
+        # Only max_idle_per_endpoint managers are kept; the one returned last is closed
+        assert not second.closed
+        assert first.closed
+
+    @pytest.mark.asyncio
+    async def test_changed_config_discards_manager(self, pool):
+        """Test a pooled manager is not reused after the endpoint config changed."""
+        async with pool.acquire('endpoint', 'old', FakeManager) as first:
+            pass
+        async with pool.acquire('endpoint', 'new', FakeManager) as second:
+            pass
+
+        assert second is not first
+        assert first.closed
+        assert second.config == 'new'
+
+    @pytest.mark.asyncio
+    async def test_dead_manager_replaced(self, pool):
+        """Test a pooled manager that fails ensure_connected is replaced."""
+        async with pool.acquire('endpoint', 'config', FakeManager) as first:
+            pass
+        first.alive = False
+
+        async with pool.acquire('endpoint', 'config', FakeManager) as second:
+            pass
+
+        assert second is not first
+        assert first.closed
+
+    @pytest.mark.asyncio
+    async def test_error_closes_manager(self, pool):
+        """Test a manager whose borrower raised is closed, not pooled."""
+        with pytest.raises(RuntimeError):
+            async with pool.acquire('endpoint', 'config', FakeManager) as manager:
+                raise RuntimeError('listing failed')
+
+        assert manager.closed
+        async with pool.acquire('endpoint', 'config', FakeManager) as replacement:
+            assert replacement is not manager
+
+    @pytest.mark.asyncio
+    async def test_connect_failure_raises(self, pool):
+        """Test a manager that cannot connect raises ConnectionError."""
+        def factory(config):
+            return FakeManager(config, connects=False)
+
+        with pytest.raises(ConnectionError):
+            async with pool.acquire('endpoint', 'config', factory):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_idle_managers_evicted_after_ttl(self):
+        """Test idle managers are closed once idle_ttl has passed."""
+        pool = EndpointManagerPool(idle_ttl=0.02)
+        async with pool.acquire('endpoint', 'config', FakeManager) as manager:
+            pass
+
+        await asyncio.sleep(0.1)
+
+        assert manager.closed
+        assert pool._idle == {}
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_closes_idle_managers(self, pool):
+        """Test invalidating an endpoint closes its idle managers."""
+        async with pool.acquire('endpoint', 'config', FakeManager) as manager:
+            pass
+
+        await pool.invalidate('endpoint')
+
+        assert manager.closed
@@ -0,0 +1,135 @@
+"""
+Unit tests for keyset pagination cursors.
+"""
+import base64
+import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from fastapi import HTTPException, Response
+from sqlalchemy.dialects import postgresql
+
+from app.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor, set_next_cursor
+from app.repositories.execution_repository import ExecutionRepository
+from app.repositories.session_repository import SessionRepository
+
+
+def _raw_cursor(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+@pytest.mark.unit
+class TestCursorEncoding:
+    """Test cases for encode_cursor and decode_cursor."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes to the key it was encoded from."""
+        sort_value = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        row_id = uuid4()
+
+        cursor = encode_cursor(sort_value, row_id)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (sort_value, row_id)
+
+    def test_round_trip_naive_datetime(self):
+        """Test naive datetimes survive the round trip."""
+        sort_value = datetime(2024, 5, 1, 12, 30)
+        row_id = uuid4()
+
+        assert decode_cursor(encode_cursor(sort_value, row_id)) == (sort_value, row_id)
+
+    @pytest.mark.parametrize("cursor", [None, ""])
+    def test_missing_cursor(self, cursor):
+        """Test an absent cursor means the first page."""
+        assert decode_cursor(cursor) is None
+
+    @pytest.mark.parametrize("cursor", [
+        "not a cursor!",
+        _raw_cursor(b"no-separator"),
+        _raw_cursor(b"yesterday|" + str(uuid4()).encode()),
+        _raw_cursor(b"2024-05-01T12:30:00|not-a-uuid"),
+        _raw_cursor(b"\xff\xfe|\xff"),
+    ])
+    def test_malformed_cursor(self, cursor):
+        """Test malformed cursors are rejected with 400."""
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor)
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "Invalid pagination cursor"
+
+
+@pytest.mark.unit
+class TestSetNextCursor:
+    """Test cases for set_next_cursor."""
+
+    def _rows(self, count):
+        return [
+            SimpleNamespace(id=uuid4(), created_at=datetime(2024, 5, 1, 12, minute))
+            for minute in range(count)
+        ]
+
+    def test_full_page_sets_cursor(self):
+        """Test a full page links to the page after its last row."""
+        rows = self._rows(3)
+
+        response = set_next_cursor(Response(), rows, 3, "created_at")
+
+        cursor = response.headers[NEXT_CURSOR_HEADER]
+        assert decode_cursor(cursor) == (rows[-1].created_at, rows[-1].id)
+
+    def test_short_page_has_no_cursor(self):
+        """Test the last, short page carries no cursor."""
+        response = set_next_cursor(Response(), self._rows(2), 3, "created_at")
+
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+    def test_empty_page_has_no_cursor(self):
+        """Test an empty page carries no cursor."""
+        response = set_next_cursor(Response(), [], 3, "created_at")
+
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+
+@pytest.mark.unit
+class TestRepositoryKeyset:
+    """Test cases for get_all(after=...) on paginated repositories."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Mock database session that records the executed statement."""
+        session = AsyncMock()
+        session.execute.return_value = MagicMock()
+        return session
+
+    def _executed_sql(self, mock_session) -> str:
+        statement = mock_session.execute.call_args.args[0]
+        return str(statement.compile(dialect=postgresql.dialect())).replace("\n", " ")
+
+    @pytest.mark.asyncio
+    async def test_session_get_all_after(self, mock_session):
+        """Test sessions after a cursor are filtered on (created_at, id)."""
+        await SessionRepository(mock_session).get_all(after=(datetime(2024, 5, 1), uuid4()), limit=10)
+
+        sql = self._executed_sql(mock_session)
+        assert "(sync_sessions.created_at, sync_sessions.id) < (" in sql
+        assert "ORDER BY sync_sessions.created_at DESC, sync_sessions.id DESC" in sql
+
+    @pytest.mark.asyncio
+    async def test_session_get_all_first_page(self, mock_session):
+        """Test the first page has no keyset filter."""
+        await SessionRepository(mock_session).get_all(limit=10)
+
+        assert "(sync_sessions.created_at, sync_sessions.id) <" not in self._executed_sql(mock_session)
+
+    @pytest.mark.asyncio
+    async def test_execution_get_all_after(self, mock_session):
+        """Test executions after a cursor are filtered on (queued_at, id)."""
+        await ExecutionRepository(mock_session).get_all(after=(datetime(2024, 5, 1), uuid4()), limit=10)
+
+        sql = self._executed_sql(mock_session)
+        assert "(sync_executions.queued_at, sync_executions.id) < (" in sql
+        assert "ORDER BY sync_executions.queued_at DESC, sync_executions.id DESC" in sql
@@ -0,0 +1,231 @@
+"""
+Unit tests for repository writes that check and change a row in one statement.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.api.deps import get_execution_repo
+from app.api.v1 import executions
+from app.database.models import ExecutionStatus
+from app.repositories.endpoint_repository import EndpointRepository
+from app.repositories.execution_repository import ExecutionRepository
+from app.repositories.session_repository import SessionRepository
+
+
+def _mock_session(row):
+    """Mock database session whose statement returns ``row`` (or no row)."""
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = row
+    session.execute.return_value = result
+    return session
+
+
+def _executed_sql(session) -> str:
+    statement = session.execute.call_args.args[0]
+    return str(statement.compile(dialect=postgresql.dialect())).replace("\n", " ")
+
+
+@pytest.mark.unit
+class TestEndpointCreateIfAbsent:
+    """Test cases for EndpointRepository.create_if_absent."""
+
+    @pytest.mark.asyncio
+    async def test_insert_skips_taken_name(self):
+        """Test the name check is the INSERT's ON CONFLICT, returning the new row."""
+        session = _mock_session(MagicMock())
+
+        await EndpointRepository(session).create_if_absent({'name': 'ftp-main', 'endpoint_type': 'ftp'})
+
+        sql = _executed_sql(session)
+        assert sql.startswith("INSERT INTO endpoints")
+        assert "ON CONFLICT (name) DO NOTHING RETURNING" in sql
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_returns_created_endpoint(self):
+        """Test the inserted row is returned and committed."""
+        endpoint = MagicMock()
+        session = _mock_session(endpoint)
+
+        created = await EndpointRepository(session).create_if_absent({'name': 'ftp-main'})
+
+        assert created is endpoint
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_taken_name_returns_none(self):
+        """Test no returned row means the name already exists."""
+        session = _mock_session(None)
+
+        assert await EndpointRepository(session).create_if_absent({'name': 'ftp-main'}) is None
+
+
+@pytest.mark.unit
+class TestSessionCreateIfAbsent:
+    """Test cases for SessionRepository.create_if_absent."""
+
+    @pytest.mark.asyncio
+    async def test_insert_skips_taken_name(self):
+        """Test the name check is the INSERT's ON CONFLICT, returning the new row."""
+        session = _mock_session(MagicMock())
+
+        await SessionRepository(session).create_if_absent({'name': 'nightly'})
+
+        sql = _executed_sql(session)
+        assert sql.startswith("INSERT INTO sync_sessions")
+        assert "ON CONFLICT (name) DO NOTHING RETURNING" in sql
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_returns_created_session(self):
+        """Test the inserted row is returned and committed."""
+        sync_session = MagicMock()
+        session = _mock_session(sync_session)
+
+        assert await SessionRepository(session).create_if_absent({'name': 'nightly'}) is sync_session
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_taken_name_returns_none(self):
+        """Test no returned row means the name already exists."""
+        session = _mock_session(None)
+
+        assert await SessionRepository(session).create_if_absent({'name': 'nightly'}) is None
+
+
+@pytest.mark.unit
+class TestCancelExecution:
+    """Test cases for cancelling an execution with one conditional UPDATE."""
+
+    @pytest.mark.asyncio
+    async def test_update_only_cancellable_statuses(self):
+        """Test the status check is part of the UPDATE, which returns the row."""
+        session = _mock_session(MagicMock())
+
+        await ExecutionRepository(session).cancel_execution(uuid4())
+
+        sql = _executed_sql(session)
+        assert sql.startswith("UPDATE sync_executions SET status=")
+        assert "sync_executions.status IN (" in sql
+        assert "RETURNING" in sql
+        session.execute.assert_awaited_once()
+
+    @pytest.fixture
+    def repo(self):
+        """Execution repository whose cancel and lookup are mocked."""
+        repo = MagicMock()
+        repo.cancel_execution = AsyncMock()
+        repo.get_by_id = AsyncMock()
+        repo.db = AsyncMock()
+        return repo
+
+    @pytest.fixture
+    def client(self, repo):
+        """Client for the executions router using ``repo``."""
+        app = FastAPI()
+        app.include_router(executions.router, prefix='/executions')
+        app.dependency_overrides[get_execution_repo] = lambda: repo
+        return TestClient(app)
+
+    def test_cancel_commits_before_revoking(self, client, repo, monkeypatch):
+        """Test the cancellation is committed before the worker is told."""
+        calls = []
+        repo.cancel_execution.return_value = MagicMock(celery_task_id='task-1')
+        repo.db.commit.side_effect = lambda: calls.append('commit')
+        monkeypatch.setattr(
+            executions.cancel_sync_execution, 'delay', lambda task_id: calls.append(('revoke', task_id))
+        )
+
+        response = client.post(f'/executions/{uuid4()}/cancel')
+
+        assert response.status_code == 200
+        assert calls == ['commit', ('revoke', 'task-1')]
+        repo.get_by_id.assert_not_awaited()
+
+    def test_cancel_without_task_id_revokes_execution_id(self, client, repo, monkeypatch):
+        """Test an execution with no recorded task ID is revoked by its own ID."""
+        execution_id = uuid4()
+        revoked = []
+        repo.cancel_execution.return_value = MagicMock(id=execution_id, celery_task_id=None)
+        monkeypatch.setattr(executions.cancel_sync_execution, 'delay', revoked.append)
+
+        response = client.post(f'/executions/{execution_id}/cancel')
+
+        assert response.status_code == 200
+        assert revoked == [str(execution_id)]
+
+    def test_cancel_finished_execution(self, client, repo):
+        """Test an execution that is no longer cancellable is rejected with its status."""
+        repo.cancel_execution.return_value = None
+        repo.get_by_id.return_value = MagicMock(status=ExecutionStatus.COMPLETED)
+
+        response = client.post(f'/executions/{uuid4()}/cancel')
+
+        assert response.status_code == 400
+        assert response.json()['detail'] == "Cannot cancel execution with status: completed"
+
+    def test_cancel_missing_execution(self, client, repo):
+        """Test cancelling an unknown execution is a 404."""
+        repo.cancel_execution.return_value = None
+        repo.get_by_id.return_value = None
+
+        response = client.post(f'/executions/{uuid4()}/cancel')
+
+        assert response.status_code == 404
+
+
+@pytest.mark.unit
+class TestStartExecution:
+    """Test cases for ExecutionRepository.start_execution."""
+
+    @pytest.mark.asyncio
+    async def test_claims_only_queued_row(self):
+        """Test the insert falls back to claiming the row only while it is queued."""
+        session = _mock_session(MagicMock())
+        execution_id = uuid4()
+
+        await ExecutionRepository(session).start_execution({
+            'id': execution_id,
+            'session_id': uuid4(),
+            'is_dry_run': False,
+            'celery_task_id': str(execution_id)
+        })
+
+        sql = _executed_sql(session)
+        assert sql.startswith("INSERT INTO sync_executions")
+        assert "ON CONFLICT (id) DO UPDATE SET status = %(param_1)s, celery_task_id = %(param_2)s" in sql
+        assert "WHERE sync_executions.status = %(status_1)s RETURNING" in sql
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_execution_returns_none(self):
+        """Test no returned row means the execution is no longer queued."""
+        session = _mock_session(None)
+
+        assert await ExecutionRepository(session).start_execution({'id': uuid4(), 'session_id': uuid4()}) is None
+
+
+@pytest.mark.unit
+class TestUpdateIfActive:
+    """Test cases for ExecutionRepository.update_if_active."""
+
+    @pytest.mark.asyncio
+    async def test_update_only_unfinished_statuses(self):
+        """Test the status check is part of the UPDATE and unknown fields are dropped."""
+        session = _mock_session(MagicMock())
+
+        await ExecutionRepository(session).update_if_active(uuid4(), {
+            'status': ExecutionStatus.COMPLETED,
+            'files_processed': 3
+        })
+
+        sql = _executed_sql(session)
+        assert sql.startswith("UPDATE sync_executions SET status=%(status)s WHERE")
+        assert "sync_executions.status IN (" in sql
+        assert "RETURNING" in sql
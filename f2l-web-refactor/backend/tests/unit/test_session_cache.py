@@ -0,0 +1,135 @@
+"""
+Unit tests for the Redis session cache.
+"""
+import pytest
+from uuid import uuid4
+
+import redis.asyncio as redis
+
+from app.core.session_cache import SessionCache
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio commands SessionCache uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1).encode()
+        return int(self.data[key])
+
+
+class UnreachableRedis:
+    """Client whose every command fails like an unreachable server."""
+
+    async def get(self, key):
+        raise redis.TimeoutError("Timeout reading from socket")
+
+    async def set(self, key, value, ex=None):
+        raise redis.TimeoutError("Timeout writing to socket")
+
+    async def incr(self, key):
+        raise redis.TimeoutError("Timeout writing to socket")
+
+
+def _cache(client, ttl=60):
+    cache = SessionCache("redis://unused", ttl=ttl)
+    cache._client = client
+    return cache
+
+
+@pytest.mark.unit
+class TestSessionCache:
+    """Test cases for SessionCache."""
+
+    @pytest.mark.asyncio
+    async def test_session_round_trip(self):
+        """Test a cached session body is served under its key."""
+        cache = _cache(FakeRedis())
+        session_id = uuid4()
+
+        key = await cache.session_key(session_id)
+        await cache.set_session(key, b'{"name":"nightly"}')
+
+        assert await cache.get_session(await cache.session_key(session_id)) == b'{"name":"nightly"}'
+
+    @pytest.mark.asyncio
+    async def test_list_round_trip_keeps_cursor(self):
+        """Test a cached page comes back with the cursor of the next page."""
+        cache = _cache(FakeRedis())
+        page = (True, None, 0, 50)
+
+        await cache.set_list(await cache.list_key(page), b'[{"id":1}]', 'abc_-')
+        await cache.set_list(await cache.list_key((True, 'abc_-', 0, 50)), b'[]', None)
+
+        assert await cache.get_list(await cache.list_key(page)) == (b'[{"id":1}]', 'abc_-')
+        assert await cache.get_list(await cache.list_key((True, 'abc_-', 0, 50))) == (b'[]', None)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_sessions_and_pages(self):
+        """Test a write hides every session and page cached before it."""
+        cache = _cache(FakeRedis())
+        session_id = uuid4()
+        page = (True, None, 0, 50)
+        await cache.set_session(await cache.session_key(session_id), b'{}')
+        await cache.set_list(await cache.list_key(page), b'[]', None)
+
+        await cache.invalidate()
+
+        assert await cache.get_session(await cache.session_key(session_id)) is None
+        assert await cache.get_list(await cache.list_key(page)) is None
+
+    @pytest.mark.asyncio
+    async def test_body_read_before_write_is_not_served(self):
+        """Test a body cached after a concurrent write lands on a key nobody reads."""
+        cache = _cache(FakeRedis())
+        session_id = uuid4()
+        page = (True, None, 0, 50)
+
+        # A reader builds its keys, then a write commits and invalidates
+        # before the reader caches what it read from the database
+        session_key = await cache.session_key(session_id)
+        list_key = await cache.list_key(page)
+        await cache.invalidate()
+        await cache.set_session(session_key, b'{"name":"old"}')
+        await cache.set_list(list_key, b'[{"name":"old"}]', None)
+
+        assert await cache.get_session(await cache.session_key(session_id)) is None
+        assert await cache.get_list(await cache.list_key(page)) is None
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_cache(self):
+        """Test nothing is read or written when caching is disabled."""
+        client = FakeRedis()
+        cache = _cache(client, ttl=0)
+
+        key = await cache.session_key(uuid4())
+        await cache.set_session(key, b'{}')
+        await cache.invalidate()
+
+        assert key is None
+        assert client.data == {}
+
+    @pytest.mark.asyncio
+    async def test_unreachable_redis_is_a_miss(self):
+        """Test Redis errors are treated as cache misses instead of raised."""
+        cache = _cache(UnreachableRedis())
+
+        assert await cache.session_key(uuid4()) is None
+        assert await cache.get_list(await cache.list_key((True, None, 0, 50))) is None
+        await cache.set_list('sessions:0:list:x', b'[]', None)
+        await cache.invalidate()
+
+    def test_client_has_socket_timeouts(self):
+        """Test the Redis client gives up quickly instead of waiting on TCP timeouts."""
+        kwargs = SessionCache("redis://localhost:6379/0", ttl=60).client.connection_pool.connection_kwargs
+
+        assert kwargs['socket_connect_timeout'] < 1
+        assert kwargs['socket_timeout'] < 1
@@ -0,0 +1,96 @@
+"""
+Unit tests for queueing and stopping session executions.
+"""
+import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+from app.database.models import ExecutionStatus
+from app.services import session_service as session_service_module
+from app.services.session_service import SessionService
+
+
+@pytest.mark.unit
+class TestStartSession:
+    """Test cases for SessionService.start_session."""
+
+    @pytest.fixture
+    def calls(self):
+        """Order of commits and task publishes."""
+        return []
+
+    @pytest.fixture
+    def service(self, calls):
+        """Service with an active session and mocked repositories."""
+        db = AsyncMock()
+        db.commit.side_effect = lambda: calls.append('commit')
+        service = SessionService(db)
+        service.get_session_by_id = AsyncMock(return_value=SimpleNamespace(is_active=True, name='nightly'))
+        service._validate_session_endpoints = AsyncMock()
+        service.execution_repo = AsyncMock()
+        service.execution_repo.get_all.return_value = []
+        service.execution_repo.create.return_value = SimpleNamespace(
+            queued_at=datetime(2024, 5, 1, tzinfo=timezone.utc)
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_queued_row_committed_before_publish(self, service, calls, monkeypatch):
+        """Test the QUEUED execution exists, under the task ID, before the task is published."""
+        def apply_async(kwargs, task_id):
+            calls.append(('publish', task_id))
+            return SimpleNamespace(id=task_id)
+
+        monkeypatch.setattr(session_service_module.execute_sync_session, 'apply_async', apply_async)
+
+        result = await service.start_session(uuid4())
+
+        execution_data = service.execution_repo.create.call_args.args[0]
+        assert execution_data['status'] == ExecutionStatus.QUEUED
+        assert execution_data['celery_task_id'] == str(execution_data['id'])
+        assert calls == ['commit', ('publish', str(execution_data['id']))]
+        assert UUID(result['execution_id']) == execution_data['id']
+        assert result['task_id'] == result['execution_id']
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_fails_execution(self, service, monkeypatch):
+        """Test an execution whose task could not be queued is marked failed."""
+        def apply_async(kwargs, task_id):
+            raise ConnectionError("broker unavailable")
+
+        monkeypatch.setattr(session_service_module.execute_sync_session, 'apply_async', apply_async)
+
+        with pytest.raises(ConnectionError):
+            await service.start_session(uuid4())
+
+        execution_id = service.execution_repo.create.call_args.args[0]['id']
+        update_id, update_data = service.execution_repo.update_if_active.call_args.args
+        assert update_id == execution_id
+        assert update_data['status'] == ExecutionStatus.FAILED
+
+
+@pytest.mark.unit
+class TestStopSession:
+    """Test cases for SessionService.stop_session."""
+
+    @pytest.mark.asyncio
+    async def test_queued_and_running_executions_revoked(self, monkeypatch):
+        """Test queued executions are stopped too, revoked by their execution ID."""
+        queued = MagicMock(id=uuid4(), celery_task_id=None)
+        running = MagicMock(id=uuid4(), celery_task_id='task-1')
+        finished = MagicMock(id=uuid4(), celery_task_id='task-2')
+        by_status = {ExecutionStatus.QUEUED: [queued], ExecutionStatus.RUNNING: [running, finished]}
+
+        service = SessionService(AsyncMock())
+        service.execution_repo = AsyncMock()
+        service.execution_repo.get_all.side_effect = lambda session_id, status: by_status[status]
+        service.execution_repo.cancel_execution.side_effect = lambda execution_id: execution_id != finished.id
+        revoked = []
+        monkeypatch.setattr(session_service_module.cancel_sync_execution, 'delay', revoked.append)
+
+        result = await service.stop_session(uuid4())
+
+        assert result['stopped_executions'] == [str(queued.id), str(running.id)]
+        assert revoked == [str(queued.id), 'task-1']
@@ -71,7 +71,7 @@ export interface ExecutionStatistics {
 }
 
 export interface ExecutionLog {
-  id: string;
+  id: number;
   execution_id: string;
   level: 'debug' | 'info' | 'warning' | 'error';
   message: string;